@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+analyze_columns 유사도 그룹화 벤치마크
+
+서로 다른 헤더 50 ~ 5,000개로 기존 전수 비교(모든 쌍에 similarity_ratio)와
+문자 역색인 차단(CharCountIndex) + 일괄 유사도 계산(SimilarityScorer)을 비교하고 그룹 일치 여부를 출력한다.
+전수 비교는 시간이 오래 걸리므로 지정한 개수 이하에서만 실행한다.
+
+    python scripts/bench_column_grouping.py [전수 비교 최대 헤더 수 (기본 1000)]
+"""
+
+from pathlib import Path
+from unittest import mock
+import contextlib
+import io
+import random
+import sys
+import time
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from kfta_excel import similarity
+from kfta_excel.excel_unifier import ExcelUnifier
+
+SIZES = [50, 200, 1000, 2000, 5000]
+
+# 키워드 매핑에 걸리지 않는 학교별 헤더 표기
+PREFIXES = ["", "", "현 ", "전", "신규", "담당", "최근", "기준"]
+CORES = [
+    "생년월일", "근무지", "경력", "호봉", "자격증", "임용일", "성별", "발령일", "담임",
+    "부서", "급여", "수당", "계좌", "은행", "출생지", "비상연락", "차량번호", "사번", "입사일",
+]
+SUFFIXES = ["", "", "1", "2", "(필수)", "_코드", " 구분", "번호", "일자"]
+
+
+class BruteForceIndex:
+    """기존 방식: 뒤쪽의 모든 컬럼을 비교 후보로 반환"""
+
+    def __init__(self, texts):
+        self.texts = [str(text) for text in texts]
+
+    def __len__(self):
+        return len(self.texts)
+
+    def candidates(self, idx, threshold, start=0):
+        return [other for other in range(start, len(self.texts)) if other != idx]
+
+
+class PairwiseScorer:
+    """기존 방식: 쌍마다 similarity_ratio 호출"""
+
+    def __init__(self, texts):
+        self.texts = [str(text) for text in texts]
+
+    def scores(self, query, indices, score_cutoff=0):
+        return [similarity.similarity_ratio(query, self.texts[idx]) for idx in indices]
+
+
+def build_headers(count: int):
+    rng = random.Random(42)
+    headers = []
+    seen = set()
+    while len(headers) < count:
+        header = rng.choice(PREFIXES) + rng.choice(CORES) + rng.choice(SUFFIXES)
+        if rng.random() < 0.7:
+            # 학교마다 붙이는 고유 표기 (예: 분기명, 담당자명)
+            header += "".join(chr(0xAC00 + rng.randrange(11172)) for _ in range(rng.randint(1, 3)))
+        if header not in seen:
+            seen.add(header)
+            headers.append(header)
+    return headers
+
+
+def group(headers, brute_force=False):
+    unifier = ExcelUnifier(similarity_threshold=85)
+    unifier.dataframes = [{'path': 'bench.xlsx', 'sheet': None, 'data': None, 'columns': headers}]
+    patches = contextlib.ExitStack()
+    if brute_force:
+        patches.enter_context(mock.patch.object(similarity, "CharCountIndex", BruteForceIndex))
+        patches.enter_context(mock.patch.object(similarity, "SimilarityScorer", PairwiseScorer))
+    with patches, contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        groups = unifier.analyze_columns()
+        elapsed = time.perf_counter() - started
+    return groups, elapsed
+
+
+def main():
+    max_brute = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    print("=" * 64)
+    print("analyze_columns 유사도 그룹화 벤치마크 (임계값 85)")
+    print("=" * 64)
+    print(f"{'헤더 수':>8} | {'전수 비교':>10} | {'차단+일괄':>10} | {'속도 향상':>8} | 그룹 일치")
+    for size in SIZES:
+        headers = build_headers(size)
+        blocked, blocked_time = group(headers)
+        if size <= max_brute:
+            brute, brute_time = group(headers, brute_force=True)
+            print(f"{size:>8,} | {brute_time:>9.3f}s | {blocked_time:>9.3f}s | "
+                  f"{brute_time / max(blocked_time, 1e-9):>7.1f}x | {brute == blocked}")
+        else:
+            print(f"{size:>8,} | {'(생략)':>10} | {blocked_time:>9.3f}s | {'-':>8} | -")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+exact 중복 제거 정규화 벤치마크
+
+12개 KFTA 컬럼 명단(학교명은 반복이 많음)을 기존 방식(프레임 전체 복사 + 셀마다 normalize_value 후
+정규화 컬럼으로 drop_duplicates)과 현재 방식(고유값만 정규화 + 정수 키)으로 중복 제거하고
+실행 시간과 결과 일치 여부를 출력한다. 가장 많이 채워진 행을 남기는 방식(most_complete)의 시간도 함께 잰다.
+
+    python scripts/bench_dedup_normalization.py [행 수 (기본 500000)]
+"""
+
+from pathlib import Path
+import random
+import sys
+import time
+
+import pandas as pd
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from kfta_excel.excel_unifier import ExcelUnifier
+
+KFTA_COLUMNS = ['현재교육청', '현재분회', '이름', '발령교육청', '발령분회', '과목', '직위', '직종분류',
+                '분류명', '취급코드', '시군구분', '교호기호등']
+
+
+def build_roster(count: int) -> pd.DataFrame:
+    rng = random.Random(42)
+    offices = ["춘천", "원주", "강릉", "속초", "홍천", "인제", "양구", "철원"]
+    schools = [rng.choice(offices) + chr(0xAC00 + rng.randrange(11172)) + rng.choice(["초등학교", "중학교", "고등학교"])
+               for _ in range(600)]
+    names = ["김이박최정"[rng.randrange(5)] + chr(0xAC00 + rng.randrange(11172)) + chr(0xAC00 + rng.randrange(11172))
+             for _ in range(count // 3)]
+    rows = []
+    for _ in range(count):
+        school = rng.choice(schools)
+        rows.append([
+            school[:2], school, rng.choice(names), rng.choice(offices), rng.choice(schools),
+            rng.choice(["국어", "수학", ""]), rng.choice(["교사", ""]), "중등", "전보", "A1", "시", "",
+        ])
+    return pd.DataFrame(rows, columns=KFTA_COLUMNS)
+
+
+def legacy_dedup(unifier: ExcelUnifier, df: pd.DataFrame, key_columns):
+    """기존 방식"""
+    normalized_df = df.copy()
+    for col in key_columns:
+        col_type = 'school' if '학교' in col else 'general'
+        normalized_df[f'{col}_normalized'] = df[col].apply(lambda x: unifier.normalize_value(x, col_type))
+    normalized_keys = [f'{col}_normalized' for col in key_columns]
+    return normalized_df.drop_duplicates(subset=normalized_keys, keep='first').drop(columns=normalized_keys)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    df = build_roster(count)
+    df['학교'] = df['현재분회']
+    key_columns = ['이름', '학교']
+    unifier = ExcelUnifier()
+
+    started = time.perf_counter()
+    legacy = legacy_dedup(unifier, df, key_columns)
+    legacy_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    current = unifier._remove_duplicates_smart(df, key_columns)
+    current_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    complete = unifier._remove_duplicates_smart(df, key_columns, keep='most_complete')
+    complete_time = time.perf_counter() - started
+
+    print("=" * 60)
+    print(f"exact 중복 제거 벤치마크 ({count:,}행, 키: 이름 + 학교)")
+    print("=" * 60)
+    print(f"기존 (복사 + apply)   : {legacy_time:8.3f}s")
+    print(f"현재 (고유값 + 정수 키): {current_time:8.3f}s")
+    print(f"속도 향상             : {legacy_time / max(current_time, 1e-9):8.1f}x")
+    print(f"결과 일치             : {legacy.equals(current) and legacy.index.equals(current.index)} "
+          f"({len(current):,}행 남음)")
+    print(f"most_complete         : {complete_time:8.3f}s ({len(complete):,}행 남음)")
+
+
+if __name__ == "__main__":
+    main()
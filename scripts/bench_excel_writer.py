@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+save_unified_excel 저장 방식 벤치마크
+
+12개 KFTA 컬럼 명단을 기존 방식(cell: 셀마다 값/테두리 기록)과
+스트리밍 방식(streaming: 쓰기 전용 모드 + 공용 스타일)으로 저장하고 실행 시간과 셀 값 일치 여부를 출력한다.
+컬럼 너비 계산은 기존 방식(저장한 셀을 모두 다시 읽음)과 데이터프레임 벡터 연산(전체/표본)을 따로 비교하고,
+출력 형식(xlsx/parquet/feather/csv)별 저장 + 다시 읽기 시간도 출력한다. memory를 지정하면 tracemalloc으로 최대 메모리도 잰다
+(추적 비용 때문에 실행 시간이 몇 배 늘어남).
+
+    python scripts/bench_excel_writer.py [행 수 (기본 20000)] [memory]
+"""
+
+from pathlib import Path
+import contextlib
+import io
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+from openpyxl import load_workbook
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from kfta_excel.excel_unifier import ExcelUnifier
+from kfta_excel.workbook_writer import column_widths
+
+WIDTH_SAMPLE_ROWS = 10_000
+
+# 출력 형식별 다시 읽기 함수
+READERS = {
+    "xlsx": lambda path: pd.read_excel(path, header=1),
+    "parquet": pd.read_parquet,
+    "feather": pd.read_feather,
+    "csv": lambda path: pd.read_csv(path, encoding="utf-8-sig"),
+}
+
+
+def build_roster(count: int) -> pd.DataFrame:
+    rng = random.Random(42)
+    offices = ["춘천", "원주", "강릉", "속초", "홍천", "인제", "양구", "철원"]
+    schools = [rng.choice(offices) + chr(0xAC00 + rng.randrange(11172)) + rng.choice(["초등학교", "중학교", "고등학교"])
+               for _ in range(600)]
+    rows = []
+    for _ in range(count):
+        school = rng.choice(schools)
+        name = "김이박최정"[rng.randrange(5)] + chr(0xAC00 + rng.randrange(11172)) + chr(0xAC00 + rng.randrange(11172))
+        rows.append([
+            school[:2], school, name, rng.choice(offices), rng.choice(schools),
+            rng.choice(["국어", "수학", ""]), "교사", "중등", "전보", "A1", "시", "",
+        ])
+    return pd.DataFrame(rows, columns=ExcelUnifier.KFTA_COLUMNS)
+
+
+def save(df: pd.DataFrame, output: Path, engine: str, trace_memory: bool):
+    if trace_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        ExcelUnifier().save_unified_excel(str(output), df, engine=engine)
+    elapsed = time.perf_counter() - started
+    peak = None
+    if trace_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def legacy_widths(ws):
+    """기존 방식: 시트의 셀 값을 모두 다시 읽어 글자 수 최댓값으로 너비 계산"""
+    widths = []
+    for col_idx in range(1, ws.max_column + 1):
+        values = []
+        for row_idx in range(1, ws.max_row + 1):
+            cell_value = ws.cell(row=row_idx, column=col_idx).value
+            values.append(len(str(cell_value) if cell_value is not None else ""))
+        widths.append(min(max(values) + 2, 50))
+    return widths
+
+
+def sheet_values(path: Path):
+    """셀 값 행 목록 (병합 범위 때문에 생기는 뒤쪽 빈 칸은 제외)"""
+    rows = []
+    for row in load_workbook(path, read_only=True).active.iter_rows(values_only=True):
+        row = list(row)
+        while row and row[-1] is None:
+            row.pop()
+        rows.append(row)
+    return rows
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    trace_memory = len(sys.argv) > 2 and sys.argv[2] == "memory"
+    df = build_roster(count)
+
+    print("=" * 60)
+    print(f"save_unified_excel 저장 방식 벤치마크 ({count:,}행 x {len(df.columns)}열)")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        results = {}
+        for engine in ("cell", "streaming"):
+            output = Path(tmpdir) / f"{engine}.xlsx"
+            elapsed, peak = save(df, output, engine, trace_memory)
+            results[engine] = output
+            memory = f", 최대 메모리 {peak / 2**20:8.1f}MB" if peak is not None else ""
+            print(f"{engine:<10}: {elapsed:8.3f}s{memory}")
+
+        print(f"셀 값 일치 : {sheet_values(results['cell']) == sheet_values(results['streaming'])}")
+
+        # 기존 너비 계산은 셀 읽기 시간만 재기 위해 불러온 시트에서 측정
+        ws = load_workbook(results['cell']).active
+        started = time.perf_counter()
+        legacy = legacy_widths(ws)
+        legacy_time = time.perf_counter() - started
+        started = time.perf_counter()
+        full = column_widths(df)
+        full_time = time.perf_counter() - started
+        started = time.perf_counter()
+        sampled = column_widths(df, sample_rows=WIDTH_SAMPLE_ROWS)
+        sampled_time = time.perf_counter() - started
+
+    print("-" * 60)
+    print(f"너비 (기존, 셀 다시 읽기) : {legacy_time:8.3f}s {legacy[:len(df.columns)]}")
+    print(f"너비 (전각 2배, 전체)     : {full_time:8.3f}s {full}")
+    print(f"너비 (전각 2배, 표본 {WIDTH_SAMPLE_ROWS:,}) : {sampled_time:8.3f}s {sampled}")
+
+    print("-" * 60)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for output_format, reader in READERS.items():
+            output = Path(tmpdir) / f"out.{output_format}"
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                ExcelUnifier().save_unified_excel(str(output), df)
+            write_time = time.perf_counter() - started
+            started = time.perf_counter()
+            loaded = reader(output)
+            read_time = time.perf_counter() - started
+            print(f"{output_format:<8}: 저장 {write_time:8.3f}s + 읽기 {read_time:8.3f}s ({len(loaded):,}행)")
+
+
+if __name__ == "__main__":
+    main()
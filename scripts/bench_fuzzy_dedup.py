@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+유사 중복 제거(dedup_mode='fuzzy') 확장성 벤치마크
+
+이름/현재분회/현재교육청으로 이루어진 합성 명단(일부 행은 오타가 섞인 중복)을
+10,000 ~ 100,000행으로 늘려 가며 exact/fuzzy 중복 제거 시간을 출력한다.
+블록(이름 초성 + 현재교육청) 크기가 일정하므로 fuzzy 시간은 행 수에 비례해야 한다.
+
+    python scripts/bench_fuzzy_dedup.py [syllable|jamo (기본 jamo)]
+"""
+
+from pathlib import Path
+import contextlib
+import io
+import random
+import sys
+import time
+
+import pandas as pd
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from kfta_excel.excel_unifier import ExcelUnifier
+
+SIZES = [10000, 50000, 100000]
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+OFFICES = ["춘천", "원주", "강릉", "동해", "태백", "속초", "삼척", "홍천", "횡성", "영월",
+           "평창", "정선", "철원", "화천", "양구", "인제", "고성", "양양"]
+SUFFIXES = ["초", "중", "고", "초등학교", "중학교", "고등학교"]
+
+
+def syllable(rng):
+    return chr(0xAC00 + rng.randrange(11172))
+
+
+def typo(rng, text):
+    """음절 하나의 중성 또는 종성을 바꾼 오타 (예: 김철수 → 김철숙, 김촐수)"""
+    pos = rng.randrange(len(text))
+    code = ord(text[pos]) - 0xAC00
+    if not 0 <= code < 11172:
+        return text
+    initial, medial, final = code // 588, code % 588 // 28, code % 28
+    if rng.random() < 0.5:
+        medial = (medial + rng.choice([1, 20])) % 21
+    else:
+        final = (final + rng.randrange(1, 28)) % 28
+    return text[:pos] + chr(0xAC00 + initial * 588 + medial * 28 + final) + text[pos + 1:]
+
+
+def build_roster(count: int) -> pd.DataFrame:
+    rng = random.Random(42)
+    # 교육청마다 학교 수가 일정하도록 데이터 크기에 비례해 학교를 만든다
+    schools = {
+        office: [office + syllable(rng) + syllable(rng) + rng.choice(SUFFIXES) for _ in range(max(1, count // 400))]
+        for office in OFFICES
+    }
+    rows = []
+    while len(rows) < count:
+        if rows and rng.random() < 0.15:
+            office, name, school, subject = rows[rng.randrange(len(rows))]
+            if rng.random() < 0.5:
+                name = typo(rng, name)
+            else:
+                school = typo(rng, school)
+            rows.append((office, name, school, rng.choice(["", subject, "국어"])))
+            continue
+        office = rng.choice(OFFICES)
+        name = rng.choice(SURNAMES) + syllable(rng) + syllable(rng)
+        rows.append((office, name, rng.choice(schools[office]), rng.choice(["", "수학", "과학"])))
+    return pd.DataFrame(rows, columns=["현재교육청", "이름", "현재분회", "과목"])
+
+
+def timed(unifier, df, mode):
+    with contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        result = unifier._remove_duplicates_smart(df, ["이름", "현재분회"], mode=mode)
+        elapsed = time.perf_counter() - started
+    return result, elapsed
+
+
+def main():
+    similarity_mode = sys.argv[1] if len(sys.argv) > 1 else "jamo"
+    unifier = ExcelUnifier(similarity_threshold=85, similarity_mode=similarity_mode)
+
+    print("=" * 72)
+    print(f"유사 중복 제거 벤치마크 (키: 이름 + 현재분회, 임계값 85, {similarity_mode})")
+    print("=" * 72)
+    print(f"{'행 수':>8} | {'exact':>8} | {'fuzzy':>8} | {'fuzzy 1만행당':>12} | 남은 행 (exact / fuzzy)")
+    for size in SIZES:
+        df = build_roster(size)
+        exact, exact_time = timed(unifier, df, "exact")
+        fuzzy, fuzzy_time = timed(unifier, df, "fuzzy")
+        print(f"{size:>8,} | {exact_time:>7.3f}s | {fuzzy_time:>7.3f}s | {fuzzy_time / size * 10000:>11.3f}s | "
+              f"{len(exact):,} / {len(fuzzy):,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+KFTAParser.parse_dataframe 엔진 비교 벤치마크
+
+행 단위 엔진(iterrows)과 컬럼 단위 엔진을 같은 합성 시트로 실행하고
+실행 시간과 결과 일치 여부를 출력한다.
+
+    python scripts/bench_parse_engines.py [행 수]
+"""
+
+from pathlib import Path
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from kfta_excel.kfta_parser import KFTAParser
+
+
+def build_sheet(count: int) -> pd.DataFrame:
+    rng = random.Random(42)
+    regions = ["춘천", "원주", "강릉", "속초", "홍천", "인제", "양구", "철원"]
+    stems = ["남산", "중앙", "봉의", "새들", "월학", "신림", "교동", "사북"]
+    suffixes = ["초", "중", "고", "초등학교", "중학교", "고등학교", "병설유", "여고"]
+    positions = ["초등학교 교사", "중등학교 교사", "유치원 원감", "교감", "교사"]
+    subjects = ["국어", "영어", "수학", "", "휴직복직", "과학"]
+
+    def school():
+        kind = rng.random()
+        if kind < 0.4:
+            return rng.choice(regions) + " " + rng.choice(stems) + rng.choice(suffixes)
+        if kind < 0.8:
+            return rng.choice(stems) + rng.choice(suffixes)
+        return rng.choice(regions)
+
+    rows = []
+    for idx in range(count):
+        rows.append([
+            str(idx), "전보", rng.choice(["김 철수", "이영희", "박민수"]), "",
+            rng.choice(positions), school(), None, school(), rng.choice(subjects), rng.choice(["", school()]),
+        ])
+    return pd.DataFrame(rows, columns=[f"c{idx}" for idx in range(10)])
+
+
+def run(df: pd.DataFrame, engine: str, workdir: str):
+    parser = KFTAParser(use_ai=False, use_web_search=False)
+    parser.learned_mappings_file = os.path.join(workdir, f"{engine}_learned.json")
+    parser.failed_mappings_log = os.path.join(workdir, f"{engine}_failed.log")
+    with contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        result = parser.parse_dataframe(df, engine=engine)
+        elapsed = time.perf_counter() - started
+    return result, elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    df = build_sheet(count)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        row_result, row_time = run(df, "row", workdir)
+        columnar_result, columnar_time = run(df, "columnar", workdir)
+
+    print("=" * 60)
+    print(f"parse_dataframe 엔진 벤치마크 ({count:,}행)")
+    print("=" * 60)
+    print(f"행 단위 (iterrows) : {row_time:8.3f}s")
+    print(f"컬럼 단위          : {columnar_time:8.3f}s")
+    print(f"속도 향상          : {row_time / max(columnar_time, 1e-9):8.1f}x")
+    print(f"결과 일치          : {row_result.equals(columnar_result)}")
+
+
+if __name__ == "__main__":
+    main()
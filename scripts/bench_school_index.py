@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+학교명 조회 인덱스 마이크로 벤치마크
+
+기존 방식(호출마다 키워드/지역명 정렬 후 선형 검색)과
+SchoolResolutionIndex(해시 + 접두어 트라이 + Aho-Corasick)를 10만 건으로 비교한다.
+
+    python scripts/bench_school_index.py [건수]
+"""
+
+from pathlib import Path
+import random
+import sys
+import time
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from kfta_excel.kfta_parser import KFTAParser
+
+
+def legacy_lookup(name: str):
+    """기존 find_education_office_for_school의 1, 2-1, 2-2단계 검색"""
+    sorted_keywords = sorted(KFTAParser.MIDDLE_HIGH_SCHOOL_REGION_MAP.keys(), key=len, reverse=True)
+    for keyword in sorted_keywords:
+        if keyword in name:
+            return ("keyword", keyword)
+
+    sorted_regions = sorted(KFTAParser.GANGWON_REGIONS.keys(), key=len, reverse=True)
+    for region in sorted_regions:
+        if name.startswith(region):
+            return ("prefix", region)
+
+    return ("contains", tuple(region for region in sorted_regions if region in name))
+
+
+def indexed_lookup(index, name: str):
+    keyword = index.match_keyword(name)
+    if keyword is not None:
+        return ("keyword", keyword)
+
+    region = index.match_region_prefix(name)
+    if region is not None:
+        return ("prefix", region)
+
+    return ("contains", tuple(index.regions_in(name)))
+
+
+def build_workload(count: int):
+    rng = random.Random(42)
+    regions = list(KFTAParser.GANGWON_REGIONS.keys())
+    keywords = list(KFTAParser.MIDDLE_HIGH_SCHOOL_REGION_MAP.keys())
+    stems = ["남산", "중앙", "봉의", "새들", "월학", "신림", "교동", "성수", "동광", "사북"]
+    suffixes = ["초등학교", "중학교", "고등학교", "유치원", "초", "여고"]
+
+    names = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.3:
+            names.append(rng.choice(keywords) + rng.choice(suffixes))
+        elif kind < 0.6:
+            names.append(rng.choice(regions) + rng.choice(stems) + rng.choice(suffixes))
+        elif kind < 0.8:
+            names.append(rng.choice(stems) + rng.choice(regions) + rng.choice(suffixes))
+        else:
+            names.append(rng.choice(stems) + rng.choice(suffixes))
+    return names
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    names = build_workload(count)
+
+    started = time.perf_counter()
+    legacy = [legacy_lookup(name) for name in names]
+    legacy_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    index = KFTAParser.school_index()
+    indexed = [indexed_lookup(index, name) for name in names]
+    indexed_time = time.perf_counter() - started
+
+    mismatches = sum(1 for a, b in zip(legacy, indexed) if a != b)
+
+    print("=" * 60)
+    print(f"학교명 조회 벤치마크 ({count:,}건)")
+    print("=" * 60)
+    print(f"기존 선형 검색 : {legacy_time:8.3f}s")
+    print(f"사전 인덱스    : {indexed_time:8.3f}s (인덱스 생성 포함)")
+    print(f"속도 향상      : {legacy_time / max(indexed_time, 1e-9):8.1f}x")
+    print(f"결과 불일치    : {mismatches}건")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+유사도 점수 계산 벤치마크
+
+기준 학교명 하나와 후보 1,000 ~ 50,000개의 점수를 difflib.SequenceMatcher(기존 대체 구현),
+쌍마다 similarity_ratio 호출, SimilarityScorer 일괄 계산으로 구하고 시간과 결과 일치 여부를 출력한다.
+
+    python scripts/bench_similarity_scoring.py [기준 문자열 수 (기본 20)]
+"""
+
+from difflib import SequenceMatcher
+from pathlib import Path
+import random
+import sys
+import time
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from kfta_excel import similarity
+from kfta_excel.similarity import SimilarityScorer, similarity_ratio
+
+SIZES = [1000, 10000, 50000]
+
+REGIONS = ["춘천", "원주", "강릉", "속초", "홍천", "인제", "양구", "철원"]
+SUFFIXES = ["초", "중", "고", "초등학교", "중학교", "고등학교", "병설유치원", "여자고등학교"]
+
+
+def build_values(count: int):
+    rng = random.Random(42)
+    return [
+        rng.choice(REGIONS) + "".join(chr(0xAC00 + rng.randrange(11172)) for _ in range(2)) + rng.choice(SUFFIXES)
+        for _ in range(count)
+    ]
+
+
+def timed(func):
+    started = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - started
+
+
+def main():
+    query_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    backend = "rapidfuzz" if similarity.cdist is not None else "NumPy 비트 병렬"
+
+    print("=" * 76)
+    print(f"유사도 점수 계산 벤치마크 (기준 {query_count}개 × 후보, 일괄 계산: {backend})")
+    print("=" * 76)
+    print(f"{'후보 수':>8} | {'SequenceMatcher':>15} | {'similarity_ratio':>16} | {'일괄 계산':>9} | 결과 일치")
+    for size in SIZES:
+        values = build_values(size)
+        queries = values[:query_count]
+
+        _, difflib_time = timed(lambda: [
+            [int(SequenceMatcher(None, query, value).ratio() * 100) for value in values] for query in queries
+        ])
+        pairwise, pairwise_time = timed(lambda: [
+            [similarity_ratio(query, value) for value in values] for query in queries
+        ])
+        scorer = SimilarityScorer(values)
+        batch, batch_time = timed(lambda: scorer.matrix(queries))
+        print(f"{size:>8,} | {difflib_time:>14.3f}s | {pairwise_time:>15.3f}s | {batch_time:>8.3f}s | "
+              f"{batch.tolist() == pairwise}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ExcelUnifier.find_similar_values 값 그룹화 벤치마크
+
+서로 다른 학교명 1,000 ~ 20,000개로 기존 전수 비교 그리디 그룹화와
+역색인 차단 그리디('greedy'), union-find 연결 요소('cluster')를 비교한다.
+전수 비교는 시간이 오래 걸리므로 지정한 개수 이하에서만 실행하고 그리디 결과 일치 여부를 출력한다.
+
+    python scripts/bench_value_clustering.py [전수 비교 최대 값 수 (기본 2000)] [syllable|jamo (기본 syllable)]
+"""
+
+from pathlib import Path
+import random
+import sys
+import time
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from kfta_excel.excel_unifier import ExcelUnifier
+from kfta_excel.similarity import similarity_ratio, similarity_texts
+
+SIZES = [1000, 2000, 5000, 20000]
+THRESHOLD = 85
+
+REGIONS = ["춘천", "원주", "강릉", "속초", "홍천", "인제", "양구", "철원", "삼척", "태백", "정선", "평창"]
+SUFFIXES = ["초", "중", "고", "초등학교", "중학교", "고등학교", "병설유치원", "여자고등학교"]
+
+
+def build_values(count: int):
+    rng = random.Random(42)
+    stems = list(dict.fromkeys(
+        "".join(chr(0xAC00 + rng.randrange(11172)) for _ in range(2)) for _ in range(count)
+    ))
+    values = []
+    seen = set()
+    while len(values) < count:
+        value = rng.choice(REGIONS) + rng.choice(stems) + rng.choice(SUFFIXES)
+        if rng.random() < 0.3:
+            # 오타/띄어쓰기 변형
+            pos = rng.randrange(len(value))
+            value = value[:pos] + rng.choice([" ", "", chr(0xAC00 + rng.randrange(11172))]) + value[pos + 1:]
+        if value.strip() and value not in seen:
+            seen.add(value)
+            values.append(value)
+    return values
+
+
+def brute_force_greedy(values, threshold, mode):
+    """기존 방식: 모든 쌍에 similarity_ratio"""
+    keys = dict(zip(values, similarity_texts(values, mode)))
+    value_groups = {}
+    processed = set()
+    for val1 in values:
+        if val1 in processed:
+            continue
+        similar_vals = [val1]
+        processed.add(val1)
+        for val2 in values:
+            if val2 not in processed and similarity_ratio(keys[val1], keys[val2]) >= threshold:
+                similar_vals.append(val2)
+                processed.add(val2)
+        value_groups[max(similar_vals, key=len)] = similar_vals
+    return value_groups
+
+
+def timed(func, *args, **kwargs):
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+
+def main():
+    max_brute = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    mode = sys.argv[2] if len(sys.argv) > 2 else "syllable"
+    unifier = ExcelUnifier(similarity_threshold=THRESHOLD, similarity_mode=mode)
+
+    print("=" * 78)
+    print(f"find_similar_values 값 그룹화 벤치마크 (임계값 {THRESHOLD}, {mode})")
+    print("=" * 78)
+    print(f"{'값 수':>8} | {'전수 비교':>10} | {'greedy':>9} | {'cluster':>9} | "
+          f"{'그룹 수 (greedy/cluster)':>22} | 그리디 일치")
+    for size in SIZES:
+        values = build_values(size)
+        greedy, greedy_time = timed(unifier.find_similar_values, values, method="greedy")
+        cluster, cluster_time = timed(unifier.find_similar_values, values, method="cluster")
+        counts = f"{len(greedy):,} / {len(cluster):,}"
+        if size <= max_brute:
+            brute, brute_time = timed(brute_force_greedy, values, THRESHOLD, mode)
+            print(f"{size:>8,} | {brute_time:>9.3f}s | {greedy_time:>8.3f}s | {cluster_time:>8.3f}s | "
+                  f"{counts:>22} | {brute == greedy}")
+        else:
+            print(f"{size:>8,} | {'(생략)':>10} | {greedy_time:>8.3f}s | {cluster_time:>8.3f}s | "
+                  f"{counts:>22} | -")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,15 @@ try:
 except ImportError:
     from excel_unifier import ExcelUnifier
 
+try:
+    from .workbook_reader import read_workbook_sheets
+    from .workbook_writer import OUTPUT_EXTENSIONS, OUTPUT_MIME_TYPES, write_columnar
+    from .sheet_cache import SheetCache
+except ImportError:
+    from workbook_reader import read_workbook_sheets
+    from workbook_writer import OUTPUT_EXTENSIONS, OUTPUT_MIME_TYPES, write_columnar
+    from sheet_cache import SheetCache
+
 try:
     from dotenv import load_dotenv
 except ImportError:
@@ -30,6 +39,17 @@ except ImportError:
 __version__ = "1.5.0"
 __release_date__ = "2026-02-14"
 
+# 다운로드 형식 (표시 이름 → 출력 형식)
+DOWNLOAD_FORMATS = {
+    "Excel (xlsx)": "xlsx",
+    "CSV (UTF-8 BOM)": "csv",
+    "Parquet": "parquet",
+    "Feather": "feather",
+}
+
+# 업로드 파일 내용 해시 기준 시트 캐시 (같은 파일 재업로드 시 파싱 생략)
+SHEET_CACHE = SheetCache()
+
 st.set_page_config(
     page_title="KFTA Excel Unifier",
     page_icon="📄",
@@ -235,32 +255,20 @@ def _save_uploaded_files(uploaded_files):
         )
 
         try:
-            if file.name.endswith(".csv"):
-                df = pd.read_csv(tmp_path)
+            # 파일을 한 번만 열어 모든 시트를 순회 (CSV는 시트명 None)
+            # 미리보기에서 채운 시트 캐시는 통합 실행 시 그대로 재사용됨
+            for sheet_name, df in read_workbook_sheets(tmp_path, SHEET_CACHE):
+                if sheet_name is not None and (df.empty or len(df.columns) == 0):
+                    continue
                 file_info.append(
                     {
                         "파일명": file.name,
-                        "시트": "-",
+                        "시트": sheet_name if sheet_name is not None else "-",
                         "행 수": len(df),
                         "컬럼 수": len(df.columns),
                         "크기": f"{file.size / 1024:.1f} KB",
                     }
                 )
-            else:
-                excel_file = pd.ExcelFile(tmp_path)
-                for sheet_name in excel_file.sheet_names:
-                    df = pd.read_excel(tmp_path, sheet_name=sheet_name)
-                    if df.empty or len(df.columns) == 0:
-                        continue
-                    file_info.append(
-                        {
-                            "파일명": file.name,
-                            "시트": sheet_name,
-                            "행 수": len(df),
-                            "컬럼 수": len(df.columns),
-                            "크기": f"{file.size / 1024:.1f} KB",
-                        }
-                    )
         except Exception as error:
             st.error(f"{file.name} 읽기 실패: {error}")
 
@@ -297,6 +305,7 @@ def main():
                             similarity_threshold=threshold,
                             use_ai=use_ai,
                             gemini_model=gemini_model,
+                            sheet_cache=SHEET_CACHE,
                         )
                         file_paths = [f["path"] for f in st.session_state.uploaded_files_data]
 
@@ -396,16 +405,25 @@ def main():
         )
         st.plotly_chart(fig, use_container_width=True)
 
+        format_label = st.radio("다운로드 형식", list(DOWNLOAD_FORMATS), horizontal=True)
+        output_format = DOWNLOAD_FORMATS[format_label]
         output = io.BytesIO()
-        with pd.ExcelWriter(output, engine="openpyxl") as writer:
-            df.to_excel(writer, index=False, sheet_name="KFTA_통합결과")
+        if output_format == "xlsx":
+            with pd.ExcelWriter(output, engine="openpyxl") as writer:
+                df.to_excel(writer, index=False, sheet_name="KFTA_통합결과")
+        else:
+            try:
+                write_columnar(df, output, output_format)
+            except ImportError as e:
+                st.error(str(e))
+                return
         output.seek(0)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         st.download_button(
-            label="KFTA Excel 다운로드",
+            label=f"KFTA {format_label} 다운로드",
             data=output,
-            file_name=f"kfta_unified_{timestamp}.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            file_name=f"kfta_unified_{timestamp}{OUTPUT_EXTENSIONS[output_format]}",
+            mime=OUTPUT_MIME_TYPES[output_format],
             use_container_width=True,
         )
 
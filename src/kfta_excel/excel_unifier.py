@@ -4,13 +4,14 @@
 Excel Unifier - 통일되지 않은 엑셀 파일들을 분석하고 통합하는 도구
 """
 
+import numpy as np
 import pandas as pd
 import os
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 from collections import defaultdict
 import json
-from difflib import SequenceMatcher
+from concurrent.futures import ProcessPoolExecutor
 
 try:
     from dotenv import load_dotenv
@@ -18,15 +19,6 @@ except ImportError:
     def load_dotenv() -> bool:
         return False
 
-try:
-    from fuzzywuzzy import fuzz
-
-    def similarity_ratio(left: str, right: str) -> int:
-        return fuzz.ratio(left, right)
-except ImportError:
-    def similarity_ratio(left: str, right: str) -> int:
-        return int(SequenceMatcher(None, str(left), str(right)).ratio() * 100)
-
 # .env 파일 로드
 load_dotenv()
 
@@ -39,14 +31,107 @@ except ImportError:
     except ImportError:
         KFTAParser = None
 
+try:
+    from .workbook_reader import is_xlsx_path, read_workbook_sheets, sheet_outlines
+    from .workbook_writer import (
+        OUTPUT_EXTENSIONS, OUTPUT_FORMATS, TITLE_RANGE, TITLE_TEXT, WRITE_ENGINES, column_widths,
+        resolve_output_format, write_columnar, write_unified_workbook,
+    )
+    from .sheet_cache import SheetCache
+    from .similarity import (
+        SIMILARITY_MODES, cluster_groups, cluster_records, greedy_groups, initial_jamo, similarity_ratio,
+        similarity_texts,
+    )
+    from .text_index import KeywordAutomaton
+except ImportError:
+    from workbook_reader import is_xlsx_path, read_workbook_sheets, sheet_outlines
+    from workbook_writer import (
+        OUTPUT_EXTENSIONS, OUTPUT_FORMATS, TITLE_RANGE, TITLE_TEXT, WRITE_ENGINES, column_widths,
+        resolve_output_format, write_columnar, write_unified_workbook,
+    )
+    from sheet_cache import SheetCache
+    from similarity import (
+        SIMILARITY_MODES, cluster_groups, cluster_records, greedy_groups, initial_jamo, similarity_ratio,
+        similarity_texts,
+    )
+    from text_index import KeywordAutomaton
+
 
 class ExcelUnifier:
+    # 강원교총 표준 컬럼 순서
+    KFTA_COLUMNS = [
+        '현재교육청',
+        '현재분회',
+        '이름',
+        '발령교육청',
+        '발령분회',
+        '과목',
+        '직위',
+        '직종분류',
+        '분류명',
+        '취급코드',
+        '시군구분',
+        '교호기호등'
+    ]
+
+    # 스트리밍 파싱 시 한 번에 읽는 행 수
+    STREAM_CHUNK_SIZE = 5000
+
+    # 중복 제거 방식 (unify_dataframes의 dedup_mode)
+    DEDUP_MODES = ('exact', 'fuzzy')
+    # 중복 중 남길 행 (unify_dataframes의 dedup_keep)
+    DEDUP_KEEP = ('first', 'most_complete')
+
+    # 학교명 정규화 치환 (순서대로 적용)
+    SCHOOL_REPLACEMENTS = [
+        ('大學校', ''),
+        ('大学校', ''),
+        ('大学', ''),
+        ('대학교', ''),
+        ('대학', ''),
+        ('고등학교', ''),
+        ('고교', ''),
+        ('중학교', ''),
+        ('중학', ''),
+        (' ', ''),
+    ]
+
+    # 키워드 기반 컬럼 매핑 규칙
+    # 순서 중요: 더 구체적인 것을 먼저 배치
+    KEYWORD_MAPPINGS = {
+        # 강원교총 표준 매핑 (우선순위 높음)
+        '현재교육청': ['현재교육청', '현 교육청', '소속교육청', '원교육청', '현재 교육청'],
+        '현재분회': ['현재분회', '현재 분회', '현재본청', '현재 본청', '현재학교', '현 본청', '현재 학교', '소속학교', '소속본청'],
+        '이름': ['이름', '성명', '대응', '대 응'],
+        '발령교육청': ['발령교육청', '발령 교육청', '전입교육청', '배치교육청', '발령교 육청'],
+        '발령분회': ['발령분회', '발령 분회', '발령본청', '발령 본청', '전입학교', '배치학교', '발령학교', '발령 학교', '전보학교'],
+        '과목': ['과목', '교과', '담당과목', '과 목', '교 과'],
+        '직위': ['직위', '직 위', '보직', '직급'],
+        '직종분류': ['직종분류', '직종 분류', '직종', '교원구분', '교사구분', '교직원구분'],
+        '분류명': ['분류명', '분류 명', '분류'],
+        '취급코드': ['취급코드', '취급 코드', '구분코드'],
+        '시군구분': ['시군구분', '시군 구분', '시군', '지역구분'],
+        '교호기호등': ['교호기호등', '교호 기호등', '교호기호', '고호기호등'],
+
+        # 일반 매핑 (우선순위 낮음) - 이름은 이미 위에서 매핑됨
+        '학교': ['학교', '대학교', '소속대학', '대학', '학 교', '본청'],
+        '전공': ['전공', '전공분야', '전공과목', '학과', '전 공'],
+        '학년': ['학년', '학 년', '연차'],
+        '연락처': ['연락처', '전화번호', '휴대폰', '전화', '연 락 처', '핸드폰', 'HP', '휴대전화'],
+        '이메일': ['이메일', '메일', 'email', 'e-mail', '이 메 일'],
+        '주소': ['주소', '주 소', '거주지', '집주소'],
+    }
+
     def __init__(
         self,
         similarity_threshold: int = 85,
         use_ai: bool = False,
         gemini_api_key: Optional[str] = None,
         gemini_model: Optional[str] = None,
+        workers: Optional[int] = None,
+        sheet_cache=None,
+        similarity_mode: str = 'syllable',
+        stream_min_rows: Optional[int] = None,
     ):
         """
         엑셀 통합기 초기화
@@ -56,13 +141,29 @@ class ExcelUnifier:
             use_ai: AI 기반 매칭 사용 여부 (기본값 False)
             gemini_api_key: Gemini API 키 (없으면 환경변수에서 읽음)
             gemini_model: Gemini 모델명 (없으면 GEMINI_MODEL/기본 모델 사용)
+            workers: 파일 로딩과 KFTA 시트 파싱에 사용할 프로세스 수 (None 또는 1이면 순차 처리)
+            sheet_cache: 파싱된 시트 디스크 캐시 (SheetCache, 없으면 캐시 미사용)
+            similarity_mode: 유사도 비교 단위
+                - 'syllable': 음절 단위 (기본값)
+                - 'jamo': 자모 단위 ('강릉' ↔ '강능', '연락처' ↔ '연락쳐' 같은 오타/받침 차이에 관대)
+            stream_min_rows: 데이터 행이 이 수 이상인 KFTA 원본 XLSX 시트는 로드할 때 읽지 않고,
+                'kfta' 형식으로 통합할 때 청크 단위 스트리밍으로 파싱 (None 또는 0이면 사용 안 함)
         """
+        if similarity_mode not in SIMILARITY_MODES:
+            raise ValueError(f"지원하지 않는 유사도 모드입니다: {similarity_mode} (syllable 또는 jamo)")
+
         self.similarity_threshold = similarity_threshold
+        self.similarity_mode = similarity_mode
         self.use_ai = use_ai
         self.gemini_model = gemini_model
+        self.workers = workers
+        self.sheet_cache = sheet_cache
+        self.stream_min_rows = stream_min_rows
         self.dataframes = []
         self.column_mappings = {}
         self.unified_columns = []
+        # 실행 동안 공유하는 KFTA 파서 (DB 연결/학습 매핑/정규화 캐시를 시트마다 다시 만들지 않음)
+        self._kfta_parser = None
 
         # AI 모드 초기화
         self.ai_matcher = None
@@ -84,6 +185,19 @@ class ExcelUnifier:
                 print(f"⚠️  AI 모드 초기화 실패: {str(e)}. 기본 모드로 전환합니다.")
                 self.use_ai = False
 
+    def _get_kfta_parser(self):
+        """
+        공유 KFTA 파서 (최초 호출 시 한 번만 생성)
+
+        KFTA 시트 파싱과 교육청 보강이 같은 파서를 쓰므로, 앞 시트에서 데운 학교명 캐시와
+        학습 매핑이 다음 시트에도 그대로 쓰인다. KFTA 파서를 불러올 수 없으면 None.
+        """
+        if KFTAParser is None:
+            return None
+        if self._kfta_parser is None:
+            self._kfta_parser = KFTAParser(use_ai=self.use_ai, ai_matcher=self.ai_matcher, use_web_search=True)
+        return self._kfta_parser
+
     @staticmethod
     def _clean_text_value(value) -> str:
         """NaN/None/공백 값을 안전하게 정리."""
@@ -94,14 +208,6 @@ class ExcelUnifier:
             return ""
         return text
 
-    def _first_non_empty(self, row: pd.Series, candidates: List[str]) -> str:
-        for col in candidates:
-            if col in row.index:
-                value = self._clean_text_value(row[col])
-                if value:
-                    return value
-        return ""
-
     def _enrich_kfta_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         일반 컬럼 데이터를 KFTA 컬럼으로 보강해 빈 필드를 줄임.
@@ -124,38 +230,56 @@ class ExcelUnifier:
             "교호기호등": ["교호기호등", "교호기호", "고호기호등"],
         }
 
+        # 컬럼별로 한 번만 정리한 값 (보강 전 값 기준)
+        cleaned = {}
+
+        def clean_column(col: str) -> pd.Series:
+            if col not in cleaned:
+                # 범주형(CSV 사전 인코딩) 컬럼도 새 값을 쓸 수 있도록 object로 정리
+                cleaned[col] = enriched[col].astype(object).apply(self._clean_text_value)
+            return cleaned[col]
+
         # 컬럼이 없으면 미리 생성
         for target_col in alias_map.keys():
             if target_col not in enriched.columns:
                 enriched[target_col] = ""
-            enriched[target_col] = enriched[target_col].apply(self._clean_text_value)
+            enriched[target_col] = clean_column(target_col)
 
-        for idx in enriched.index:
-            row = enriched.loc[idx]
-            for target_col, candidates in alias_map.items():
-                if self._clean_text_value(row.get(target_col, "")):
+        # 별칭 컬럼을 순서대로 훑으며 아직 빈 칸만 채움 (행별 첫 번째 비어있지 않은 값)
+        for target_col, candidates in alias_map.items():
+            value = cleaned[target_col]
+            for col in candidates:
+                if col == target_col or col not in enriched.columns:
                     continue
-                value = self._first_non_empty(row, candidates)
-                if value:
-                    enriched.at[idx, target_col] = value
+                empty = value == ""
+                if not empty.any():
+                    break
+                value = value.where(~empty, clean_column(col))
+            enriched[target_col] = value
 
         # 교육청 자동 보강 (분회 값이 있을 때)
-        if KFTAParser is not None:
-            parser = KFTAParser(use_ai=False, use_web_search=False)
+        # 같은 학교가 수백 행 반복되므로 교육청이 빈 행의 학교명을 고유값 단위로 한 번씩만 조회
+        parser = self._get_kfta_parser()
+        if parser is not None:
+            no_hints = {"regions": [], "education_offices": []}
             for office_col, school_col in [("현재교육청", "현재분회"), ("발령교육청", "발령분회")]:
                 if office_col not in enriched.columns:
                     enriched[office_col] = ""
-                enriched[office_col] = enriched[office_col].apply(self._clean_text_value)
-
-                for idx in enriched.index:
-                    if self._clean_text_value(enriched.at[idx, office_col]):
-                        continue
-                    school = self._clean_text_value(enriched.at[idx, school_col]) if school_col in enriched.columns else ""
-                    if not school:
-                        continue
-                    edu = parser.find_education_office_for_school(school, {"regions": [], "education_offices": []})
-                    if edu:
-                        enriched.at[idx, office_col] = edu
+                offices = enriched[office_col].astype(object).apply(self._clean_text_value)
+
+                if school_col in enriched.columns:
+                    schools = enriched[school_col].astype(object).apply(self._clean_text_value)
+                    needs_office = (offices == "") & (schools != "")
+                    resolved = {
+                        school: parser.find_education_office_for_school(school, no_hints)
+                        for school in pd.unique(schools[needs_office])
+                    }
+                    found = schools.where(needs_office, "").map(resolved).fillna("")
+                    offices = offices.where(found == "", found)
+
+                enriched[office_col] = offices
+
+            parser.flush()
 
         return enriched
 
@@ -184,55 +308,206 @@ class ExcelUnifier:
         """
         if df is None or df.empty:
             return False
+        return ExcelUnifier._looks_like_kfta_columns(df.columns)
 
+    @staticmethod
+    def _looks_like_kfta_columns(columns) -> bool:
+        """컬럼명 중 KFTA 원본 표기가 3개 이상인지 확인"""
         kfta_markers = {
             "현재교육청", "현재분회", "이름", "발령교육청", "발령분회", "과목", "직위",
             "현 교육청", "현 본청", "대 응", "발령교 육청", "발령 본청", "과 목", "직 위",
         }
-        matched = sum(1 for col in df.columns if str(col).strip() in kfta_markers)
+        matched = sum(1 for col in columns if str(col).strip() in kfta_markers)
         return matched >= 3
 
-    def load_excel_files(self, file_paths: List[str]) -> None:
-        """여러 엑셀 파일 로드 (모든 시트 포함)"""
+    def load_excel_files(self, file_paths: List[str], workers: Optional[int] = None) -> None:
+        """
+        여러 엑셀 파일 로드 (모든 시트 포함)
+
+        Args:
+            file_paths: 로드할 파일 경로들
+            workers: 프로세스 풀 크기 (None이면 생성자 설정 사용, 1 이하이면 순차 처리)
+        """
         print(f"📂 {len(file_paths)}개의 파일을 로드합니다...")
 
+        if workers is None:
+            workers = self.workers
+
+        # 큰 KFTA 시트가 있는 XLSX는 스트리밍으로 따로 처리 (공유 파서를 쓰므로 순차 처리)
+        stream_plans = {}
         for file_path in file_paths:
-            try:
-                # 엑셀 파일 읽기 (.xlsx, .xls 모두 지원)
-                if file_path.endswith('.csv'):
-                    df = pd.read_csv(file_path)
-                    self.dataframes.append({
-                        'path': file_path,
-                        'sheet': None,
-                        'data': df,
-                        'columns': list(df.columns)
-                    })
-                    print(f"  ✓ {os.path.basename(file_path)}: {len(df)}행, {len(df.columns)}개 컬럼")
-                else:
-                    # 엑셀 파일의 모든 시트 읽기
-                    excel_file = pd.ExcelFile(file_path)
-                    sheet_names = excel_file.sheet_names
+            outlines = self._stream_outlines(file_path)
+            if outlines is not None:
+                stream_plans[file_path] = outlines
+        read_paths = [file_path for file_path in file_paths if file_path not in stream_plans]
+
+        if workers and workers > 1 and len(read_paths) > 1:
+            results = self._read_files_parallel(read_paths, workers, self.sheet_cache)
+        else:
+            results = (self._read_file_safely(file_path, self.sheet_cache) for file_path in read_paths)
+        results = iter(results)
+
+        # 결과는 항상 입력 파일 순서대로 등록 (병렬 모드에서도 순서 보장)
+        for file_path in file_paths:
+            if file_path in stream_plans:
+                try:
+                    self._load_file_streaming(file_path, stream_plans[file_path])
+                except Exception as e:
+                    print(f"  ✗ {file_path} 로드 실패: {str(e)}")
+                continue
 
-                    print(f"  📄 {os.path.basename(file_path)}: {len(sheet_names)}개 시트 발견")
+            sheets, error = next(results)
+            if error is not None:
+                print(f"  ✗ {file_path} 로드 실패: {str(error)}")
+                continue
+            self._register_loaded_sheets(file_path, sheets)
 
-                    for sheet_name in sheet_names:
-                        df = pd.read_excel(file_path, sheet_name=sheet_name)
+    def _should_stream(self, row_count: Optional[int], header: tuple) -> bool:
+        """행 수가 기준 이상이고 헤더가 KFTA 원본 형식인 시트인지 확인"""
+        if not self.stream_min_rows or row_count is None or row_count < self.stream_min_rows:
+            return False
+        return self._looks_like_kfta_columns(value for value in header if value is not None)
 
-                        # 빈 시트 건너뛰기
-                        if df.empty or len(df.columns) == 0:
-                            print(f"    ⊘ 시트 '{sheet_name}': 빈 시트 (건너뜀)")
-                            continue
+    def _stream_outlines(self, file_path: str) -> Optional[List[Tuple[str, Optional[int], tuple]]]:
+        """스트리밍으로 파싱할 시트가 있으면 파일의 시트 개요 목록, 없으면 None"""
+        if not self.stream_min_rows or KFTAParser is None or not is_xlsx_path(file_path):
+            return None
+        try:
+            outlines = sheet_outlines(file_path)
+        except Exception:
+            # 열 수 없는 파일은 일반 로딩 경로에서 오류를 보고
+            return None
+        if any(self._should_stream(row_count, header) for _, row_count, header in outlines):
+            return outlines
+        return None
+
+    def _load_file_streaming(self, file_path: str, outlines: List[Tuple[str, Optional[int], tuple]]) -> None:
+        """
+        큰 KFTA 시트는 헤더만 읽어 등록하고, 나머지 시트는 기존처럼 데이터프레임으로 읽어 등록
 
-                        self.dataframes.append({
-                            'path': file_path,
-                            'sheet': sheet_name,
-                            'data': df,
-                            'columns': list(df.columns)
-                        })
-                        print(f"    ✓ 시트 '{sheet_name}': {len(df)}행, {len(df.columns)}개 컬럼")
+        큰 시트는 'stream'으로 표시해 두고 데이터는 통합할 때 읽는다.
+        ('kfta' 형식이면 청크 단위 스트리밍 파싱, 그 외 형식이면 원본 시트 전체를 읽어 일반 경로로 처리)
+        """
+        file_name = os.path.basename(file_path)
+        print(f"  📄 {file_name}: {len(outlines)}개 시트 발견")
 
-            except Exception as e:
-                print(f"  ✗ {file_path} 로드 실패: {str(e)}")
+        small_sheets = [name for name, row_count, header in outlines if not self._should_stream(row_count, header)]
+        frames = pd.read_excel(file_path, sheet_name=small_sheets) if small_sheets else {}
+
+        for sheet_name, row_count, header in outlines:
+            if sheet_name in frames:
+                self._register_sheet(file_path, sheet_name, frames[sheet_name])
+                continue
+
+            # 컬럼명은 pd.read_excel과 같게 (빈 헤더/중복 헤더 이름 처리 포함)
+            columns = list(pd.read_excel(file_path, sheet_name=sheet_name, nrows=0).columns)
+            self.dataframes.append({
+                'path': file_path,
+                'sheet': sheet_name,
+                'data': None,
+                'columns': columns,
+                'rows': row_count,
+                'stream': True,
+            })
+            print(f"    ✓ 시트 '{sheet_name}': {row_count}행, {len(columns)}개 컬럼 (통합 시 스트리밍)")
+
+    @staticmethod
+    def _sheet_row_count(df_info: dict) -> int:
+        """등록된 시트의 데이터 행 수 (스트리밍 대상 시트는 시트 범위 기준)"""
+        if df_info.get('stream'):
+            return df_info['rows']
+        return len(df_info['data'])
+
+    @staticmethod
+    def _read_file_safely(
+        file_path: str,
+        sheet_cache=None,
+    ) -> Tuple[List[Tuple[Optional[str], pd.DataFrame]], Optional[Exception]]:
+        try:
+            return read_workbook_sheets(file_path, sheet_cache), None
+        except Exception as e:
+            return [], e
+
+    @staticmethod
+    def _read_files_parallel(
+        file_paths: List[str],
+        workers: int,
+        sheet_cache=None,
+    ) -> List[Tuple[List[Tuple[Optional[str], pd.DataFrame]], Optional[Exception]]]:
+        """파일 단위 작업을 프로세스 풀에 분배하고 입력 순서대로 결과 수집"""
+        print(f"  ⚙️  병렬 로딩: 프로세스 {min(workers, len(file_paths))}개")
+        results = []
+        with ProcessPoolExecutor(max_workers=min(workers, len(file_paths))) as executor:
+            futures = [executor.submit(read_workbook_sheets, file_path, sheet_cache) for file_path in file_paths]
+            for future in futures:
+                try:
+                    results.append((future.result(), None))
+                except Exception as e:
+                    results.append(([], e))
+        return results
+
+    def _register_loaded_sheets(self, file_path: str, sheets: List[Tuple[Optional[str], pd.DataFrame]]) -> None:
+        """읽어온 시트들을 self.dataframes에 등록 (빈 시트 제외)"""
+        file_name = os.path.basename(file_path)
+
+        # CSV 파일 (시트 없음)
+        if len(sheets) == 1 and sheets[0][0] is None:
+            df = sheets[0][1]
+            self.dataframes.append({
+                'path': file_path,
+                'sheet': None,
+                'data': df,
+                'columns': list(df.columns)
+            })
+            print(f"  ✓ {file_name}: {len(df)}행, {len(df.columns)}개 컬럼")
+            return
+
+        print(f"  📄 {file_name}: {len(sheets)}개 시트 발견")
+
+        for sheet_name, df in sheets:
+            self._register_sheet(file_path, sheet_name, df)
+
+    def _register_sheet(self, file_path: str, sheet_name: str, df: pd.DataFrame) -> None:
+        """시트 하나를 self.dataframes에 등록 (빈 시트 제외)"""
+        if df.empty or len(df.columns) == 0:
+            print(f"    ⊘ 시트 '{sheet_name}': 빈 시트 (건너뜀)")
+            return
+
+        self.dataframes.append({
+            'path': file_path,
+            'sheet': sheet_name,
+            'data': df,
+            'columns': list(df.columns)
+        })
+        print(f"    ✓ 시트 '{sheet_name}': {len(df)}행, {len(df.columns)}개 컬럼")
+
+    @staticmethod
+    def _normalize_header(text: str) -> str:
+        """키워드 비교용 컬럼명 정규화 (공백 제거, 소문자)"""
+        return text.strip().replace(' ', '').lower()
+
+    @classmethod
+    def _compiled_keywords(cls) -> Tuple[KeywordAutomaton, List[Tuple[str, str]]]:
+        """
+        정규화한 키워드 매핑을 한 번만 컴파일한 검색기
+
+        rank는 KEYWORD_MAPPINGS의 통합 컬럼 순서, 그 안의 키워드 순서를 따르므로
+        가장 작은 rank가 기존 우선순위(구체적인 통합 컬럼 우선)와 같다.
+
+        Returns:
+            (KeywordAutomaton, rank별 (통합 컬럼명, 원본 키워드) 목록)
+        """
+        compiled = cls.__dict__.get('_keyword_table')
+        if compiled is None:
+            entries = [
+                (unified_name, keyword)
+                for unified_name, keywords in cls.KEYWORD_MAPPINGS.items()
+                for keyword in keywords
+            ]
+            automaton = KeywordAutomaton(cls._normalize_header(keyword) for _, keyword in entries)
+            compiled = (automaton, entries)
+            cls._keyword_table = compiled
+        return compiled
 
     def analyze_columns(self) -> Dict[str, List[str]]:
         """
@@ -243,32 +518,6 @@ class ExcelUnifier:
         """
         print("\n🔍 컬럼명 분석 중...")
 
-        # 키워드 기반 컬럼 매핑 규칙
-        # 순서 중요: 더 구체적인 것을 먼저 배치
-        keyword_mappings = {
-            # 강원교총 표준 매핑 (우선순위 높음)
-            '현재교육청': ['현재교육청', '현 교육청', '소속교육청', '원교육청', '현재 교육청'],
-            '현재분회': ['현재분회', '현재 분회', '현재본청', '현재 본청', '현재학교', '현 본청', '현재 학교', '소속학교', '소속본청'],
-            '이름': ['이름', '성명', '대응', '대 응'],
-            '발령교육청': ['발령교육청', '발령 교육청', '전입교육청', '배치교육청', '발령교 육청'],
-            '발령분회': ['발령분회', '발령 분회', '발령본청', '발령 본청', '전입학교', '배치학교', '발령학교', '발령 학교', '전보학교'],
-            '과목': ['과목', '교과', '담당과목', '과 목', '교 과'],
-            '직위': ['직위', '직 위', '보직', '직급'],
-            '직종분류': ['직종분류', '직종 분류', '직종', '교원구분', '교사구분', '교직원구분'],
-            '분류명': ['분류명', '분류 명', '분류'],
-            '취급코드': ['취급코드', '취급 코드', '구분코드'],
-            '시군구분': ['시군구분', '시군 구분', '시군', '지역구분'],
-            '교호기호등': ['교호기호등', '교호 기호등', '교호기호', '고호기호등'],
-
-            # 일반 매핑 (우선순위 낮음) - 이름은 이미 위에서 매핑됨
-            '학교': ['학교', '대학교', '소속대학', '대학', '학 교', '본청'],
-            '전공': ['전공', '전공분야', '전공과목', '학과', '전 공'],
-            '학년': ['학년', '학 년', '연차'],
-            '연락처': ['연락처', '전화번호', '휴대폰', '전화', '연 락 처', '핸드폰', 'HP', '휴대전화'],
-            '이메일': ['이메일', '메일', 'email', 'e-mail', '이 메 일'],
-            '주소': ['주소', '주 소', '거주지', '집주소'],
-        }
-
         # 모든 컬럼명 수집
         all_columns = []
         for df_info in self.dataframes:
@@ -289,20 +538,21 @@ class ExcelUnifier:
         processed = set()
 
         # 먼저 키워드 기반 매핑 적용
-        for unified_name, keywords in keyword_mappings.items():
+        # 컬럼마다 한 번의 검색으로 (통합 컬럼 순서, 키워드 순서)가 가장 앞선 키워드를 찾음
+        automaton, keyword_entries = self._compiled_keywords()
+        keyword_matches = defaultdict(list)
+        for col in unique_columns:
+            rank = automaton.first_rank(self._normalize_header(col))
+            if rank is not None:
+                unified_name, keyword = keyword_entries[rank]
+                keyword_matches[unified_name].append((col, keyword))
+
+        for unified_name in self.KEYWORD_MAPPINGS:
             matched_cols = []
-            for col in unique_columns:
-                if col in processed:
-                    continue
-                col_normalized = col.strip().replace(' ', '').lower()
-                for keyword in keywords:
-                    keyword_normalized = keyword.strip().replace(' ', '').lower()
-                    # 정확히 일치하거나 포함하는 경우
-                    if col_normalized == keyword_normalized or keyword_normalized in col_normalized:
-                        matched_cols.append(col)
-                        processed.add(col)
-                        print(f"  ✓ '{col}' → '{unified_name}' (키워드: '{keyword}')")
-                        break
+            for col, keyword in keyword_matches.get(unified_name, []):
+                matched_cols.append(col)
+                processed.add(col)
+                print(f"  ✓ '{col}' → '{unified_name}' (키워드: '{keyword}')")
 
             if matched_cols:
                 column_groups[unified_name] = matched_cols
@@ -310,44 +560,22 @@ class ExcelUnifier:
                     print(f"  📌 '{unified_name}' ← {matched_cols}")
 
         # 나머지 컬럼들은 유사도 기반으로 매핑
-        for i, col1 in enumerate(unique_columns):
-            if col1 in processed:
-                continue
-
-            # 현재 컬럼과 유사한 컬럼들 찾기
-            similar_cols = [col1]
-            processed.add(col1)
-
-            for col2 in unique_columns[i+1:]:
-                if col2 in processed:
-                    continue
+        remaining_columns = [col for col in unique_columns if col not in processed]
 
-                # 유사도 계산 (AI 모드 또는 기본 모드)
-                is_similar = False
-
-                if self.use_ai and self.ai_matcher:
-                    # AI 기반 유사도 계산
-                    try:
-                        result = self.ai_matcher.calculate_semantic_similarity(
-                            col1, col2,
-                            context="엑셀 컬럼명"
-                        )
-                        is_similar = result['is_similar']
-                        if is_similar:
-                            print(f"  🤖 AI 매칭: '{col1}' ↔ '{col2}' ({result['similarity']}%, {result['reason']})")
-                    except Exception as e:
-                        print(f"  ⚠️  AI 분석 실패, 기본 모드로 전환: {str(e)}")
-                        # 실패 시 기본 모드로 fallback
-                        similarity = similarity_ratio(col1, col2)
-                        is_similar = similarity >= self.similarity_threshold
-                else:
-                    # 기본 모드: Levenshtein Distance
-                    similarity = similarity_ratio(col1, col2)
-                    is_similar = similarity >= self.similarity_threshold
+        if self.use_ai and self.ai_matcher:
+            similar_groups = self._iter_ai_column_groups(remaining_columns)
+        else:
+            # 기본 모드: 문자 역색인으로 임계값에 도달할 수 있는 컬럼 쌍만 골라 한꺼번에 유사도 계산
+            # (결과는 전수 비교와 동일)
+            similar_groups = (
+                [remaining_columns[idx] for idx in group]
+                for group in greedy_groups(
+                    similarity_texts(remaining_columns, self.similarity_mode), self.similarity_threshold
+                )
+            )
 
-                if is_similar:
-                    similar_cols.append(col2)
-                    processed.add(col2)
+        for similar_cols in similar_groups:
+            processed.update(similar_cols)
 
             # 가장 빈도가 높은 컬럼명을 대표 컬럼명으로 선택
             representative = max(similar_cols, key=lambda x: column_freq[x])
@@ -384,30 +612,76 @@ class ExcelUnifier:
         # 학교명 정규화
         if value_type == 'school':
             # 대학교, 대학, 고등학교, 중학교 등 통일
-            replacements = [
-                ('大學校', ''),
-                ('大学校', ''),
-                ('大学', ''),
-                ('대학교', ''),
-                ('대학', ''),
-                ('고등학교', ''),
-                ('고교', ''),
-                ('중학교', ''),
-                ('중학', ''),
-                (' ', ''),
-            ]
-            for old, new in replacements:
+            for old, new in self.SCHOOL_REPLACEMENTS:
                 value = value.replace(old, new)
 
         return value.lower()
 
-    def find_similar_values(self, values: List[str], threshold: int = None) -> Dict[str, List[str]]:
+    def normalize_values(self, values: pd.Series, value_type: str = 'general') -> pd.Series:
+        """
+        컬럼 단위 값 정규화 (normalize_value와 같은 결과)
+
+        문자열로 바꾼 뒤 고유값만 정규화하고 코드로 다시 펼치므로,
+        같은 학교명이 수천 번 나와도 치환은 한 번만 한다.
+        """
+        missing = values.isna().to_numpy()
+        codes, uniques = pd.factorize(values.astype(str))
+        normalized = np.array([self.normalize_value(value, value_type) for value in uniques] + [""], dtype=object)
+        # 코드 -1(결측)은 마지막 빈 문자열을 가리킴
+        result = normalized[codes]
+        result[missing] = ""
+        return pd.Series(result, index=values.index, dtype=object)
+
+    def _iter_ai_column_groups(self, columns: List[str]):
+        """
+        AI 모드 유사도 그룹화: 앞의 컬럼을 기준으로 AI가 유사하다고 판단한 뒤쪽 컬럼을 묶음
+
+        AI 호출 로그가 그룹 출력과 섞이도록 그룹을 하나씩 반환한다.
+        """
+        processed = set()
+        for i, col1 in enumerate(columns):
+            if col1 in processed:
+                continue
+
+            # 현재 컬럼과 유사한 컬럼들 찾기
+            similar_cols = [col1]
+            processed.add(col1)
+
+            for col2 in columns[i+1:]:
+                if col2 in processed:
+                    continue
+
+                try:
+                    result = self.ai_matcher.calculate_semantic_similarity(
+                        col1, col2,
+                        context="엑셀 컬럼명"
+                    )
+                    is_similar = result['is_similar']
+                    if is_similar:
+                        print(f"  🤖 AI 매칭: '{col1}' ↔ '{col2}' ({result['similarity']}%, {result['reason']})")
+                except Exception as e:
+                    print(f"  ⚠️  AI 분석 실패, 기본 모드로 전환: {str(e)}")
+                    # 실패 시 기본 모드로 fallback
+                    similarity = similarity_ratio(*similarity_texts([col1, col2], self.similarity_mode))
+                    is_similar = similarity >= self.similarity_threshold
+
+                if is_similar:
+                    similar_cols.append(col2)
+                    processed.add(col2)
+
+            yield similar_cols
+
+    def find_similar_values(self, values: List[str], threshold: int = None,
+                            method: str = 'cluster') -> Dict[str, List[str]]:
         """
         유사한 값들을 그룹화
 
         Args:
             values: 값 리스트
             threshold: 유사도 임계값
+            method: 그룹화 방식
+                - 'cluster': 유사한 쌍을 모두 이어 연결 요소로 묶음 (입력 순서와 무관, 기본값)
+                - 'greedy': 앞의 값을 기준으로 기준과 유사한 값만 묶음 (기존 방식)
 
         Returns:
             {대표값: [유사한 값들]} 딕셔너리
@@ -415,34 +689,27 @@ class ExcelUnifier:
         if threshold is None:
             threshold = self.similarity_threshold
 
-        unique_values = list(set([str(v) for v in values if pd.notna(v) and str(v).strip()]))
-
-        value_groups = {}
-        processed = set()
-
-        for i, val1 in enumerate(unique_values):
-            if val1 in processed:
-                continue
-
-            similar_vals = [val1]
-            processed.add(val1)
-
-            for val2 in unique_values[i+1:]:
-                if val2 in processed:
-                    continue
+        if method == 'cluster':
+            group_indices = cluster_groups
+        elif method == 'greedy':
+            group_indices = greedy_groups
+        else:
+            raise ValueError(f"지원하지 않는 그룹화 방식입니다: {method} (cluster 또는 greedy)")
 
-                similarity = similarity_ratio(val1, val2)
-                if similarity >= threshold:
-                    similar_vals.append(val2)
-                    processed.add(val2)
+        # 처음 나온 순서대로 중복 제거 (실행마다 같은 결과가 나오도록)
+        unique_values = list(dict.fromkeys(str(v) for v in values if pd.notna(v) and str(v).strip()))
 
+        value_groups = {}
+        for group in group_indices(similarity_texts(unique_values, self.similarity_mode), threshold):
+            similar_vals = [unique_values[idx] for idx in group]
             # 가장 긴 값을 대표값으로 (보통 더 완전한 형태)
             representative = max(similar_vals, key=len)
             value_groups[representative] = similar_vals
 
         return value_groups
 
-    def unify_dataframes(self, key_columns: List[str] = None, output_format: str = 'auto') -> pd.DataFrame:
+    def unify_dataframes(self, key_columns: List[str] = None, output_format: str = 'auto',
+                         dedup_mode: str = 'exact', dedup_keep: Optional[str] = None) -> pd.DataFrame:
         """
         모든 데이터프레임을 통합
 
@@ -452,10 +719,21 @@ class ExcelUnifier:
                 - 'auto': 자동 감지 (기본값)
                 - 'standard': 모든 컬럼 포함
                 - 'kfta': 강원교총 표준 형식 (12개 컬럼)
+            dedup_mode: 중복 판단 방식
+                - 'exact': 정규화한 키 값이 같은 행 (기본값)
+                - 'fuzzy': 키 값이 모두 유사도 임계값 이상인 행 (오타/표기 차이 허용)
+            dedup_keep: 중복 중 남길 행
+                - 'first': 먼저 나온 행 (exact 기본값)
+                - 'most_complete': KFTA 표준 컬럼이 가장 많이 채워진 행, 같으면 먼저 나온 행 (fuzzy 기본값)
 
         Returns:
             통합된 데이터프레임
         """
+        if dedup_mode not in self.DEDUP_MODES:
+            raise ValueError(f"지원하지 않는 중복 제거 방식입니다: {dedup_mode} (exact 또는 fuzzy)")
+        if dedup_keep is not None and dedup_keep not in self.DEDUP_KEEP:
+            raise ValueError(f"지원하지 않는 중복 행 선택 방식입니다: {dedup_keep} (first 또는 most_complete)")
+
         print("\n🔄 데이터 통합 중...")
 
         if not self.column_mappings:
@@ -466,7 +744,23 @@ class ExcelUnifier:
 
         # 각 파일의 데이터를 통일된 컬럼명으로 변환
         for df_info in self.dataframes:
-            df = df_info['data'].copy()
+            file_name = os.path.basename(df_info['path'])
+            sheet_info = f" (시트: {df_info['sheet']})" if df_info.get('sheet') else ""
+
+            if df_info.get('stream'):
+                # 큰 KFTA 시트: 'kfta' 형식이면 원본을 메모리에 올리지 않고 청크 단위로 파싱
+                if output_format == 'kfta':
+                    df_unified = self._get_kfta_parser().parse_excel_streaming(
+                        df_info['path'], sheet_name=df_info['sheet'], chunk_size=self.STREAM_CHUNK_SIZE
+                    )
+                    if not df_unified.empty:
+                        unified_data.append(df_unified)
+                    print(f"  ✓ {file_name}{sheet_info}: {len(df_unified)}행 스트리밍 변환 (KFTA 파서 사용)")
+                    continue
+                # 그 외 형식은 원본 컬럼이 필요하므로 시트 전체를 읽어 일반 경로로 처리
+                df = pd.read_excel(df_info['path'], sheet_name=df_info['sheet'])
+            else:
+                df = df_info['data'].copy()
 
             # KFTA 형식이고 입력이 KFTA 원본일 때만 특수 파싱 적용
             if (
@@ -474,11 +768,8 @@ class ExcelUnifier:
                 and KFTAParser is not None
                 and self._looks_like_kfta_dataframe(df)
             ):
-                parser = KFTAParser(use_ai=self.use_ai, ai_matcher=self.ai_matcher, use_web_search=True)
-                df_unified = parser.parse_dataframe(df)
+                df_unified = self._get_kfta_parser().parse_dataframe(df, workers=self.workers)
 
-                file_name = os.path.basename(df_info['path'])
-                sheet_info = f" (시트: {df_info['sheet']})" if df_info.get('sheet') else ""
                 print(f"  ✓ {file_name}{sheet_info}: {len(df_unified)}행 변환 (KFTA 파서 사용)")
 
                 unified_data.append(df_unified)
@@ -509,8 +800,6 @@ class ExcelUnifier:
             unified_data.append(df_unified)
 
             # 시트 정보 포함하여 출력
-            file_name = os.path.basename(df_info['path'])
-            sheet_info = f" (시트: {df_info['sheet']})" if df_info.get('sheet') else ""
             print(f"  ✓ {file_name}{sheet_info}: {len(df_unified)}행 변환")
 
         # 모든 데이터 결합
@@ -541,7 +830,7 @@ class ExcelUnifier:
 
             if valid_keys:
                 before_count = len(result_df)
-                result_df = self._remove_duplicates_smart(result_df, valid_keys)
+                result_df = self._remove_duplicates_smart(result_df, valid_keys, mode=dedup_mode, keep=dedup_keep)
                 after_count = len(result_df)
                 removed = before_count - after_count
 
@@ -552,34 +841,119 @@ class ExcelUnifier:
 
         return result_df
 
-    def _remove_duplicates_smart(self, df: pd.DataFrame, key_columns: List[str]) -> pd.DataFrame:
+    def _remove_duplicates_smart(self, df: pd.DataFrame, key_columns: List[str],
+                                 mode: str = 'exact', keep: Optional[str] = None) -> pd.DataFrame:
         """
         스마트 중복 제거 - 유사한 값도 같은 것으로 간주
+
+        Args:
+            df: 데이터프레임
+            key_columns: 중복 판단 키 컬럼
+            mode: 'exact'(정규화 값이 같은 행) 또는 'fuzzy'(블록 안에서 유사도로 묶은 행)
+            keep: 'first'(먼저 나온 행) 또는 'most_complete'(가장 많이 채워진 행),
+                None이면 exact는 'first', fuzzy는 'most_complete'
         """
-        # 정규화된 키 컬럼 생성
-        normalized_df = df.copy()
+        if keep is None:
+            keep = 'most_complete' if mode == 'fuzzy' else 'first'
+
+        # 키 컬럼만 정규화 (원본 프레임은 복사하지 않음)
+        normalized = pd.DataFrame(
+            {
+                col: self.normalize_values(df[col], 'school' if '학교' in col else 'general')
+                for col in key_columns if col in df.columns
+            },
+            index=df.index,
+        )
+        if normalized.columns.empty:
+            return df
 
-        for col in key_columns:
-            if col in df.columns:
-                # 값 정규화
-                col_type = 'school' if '학교' in col else 'general'
-                normalized_df[f'{col}_normalized'] = df[col].apply(
-                    lambda x: self.normalize_value(x, col_type)
-                )
+        # 정규화 키 조합 → 정수 키 (첫 등장 순서로 번호)
+        key_codes = self._composite_key_codes(normalized)
 
-        # 정규화된 값으로 중복 제거
-        normalized_keys = [f'{col}_normalized' for col in key_columns if col in df.columns]
+        if mode == 'fuzzy':
+            name_column = '이름' if '이름' in normalized.columns else normalized.columns[0]
+            offices = df['현재교육청'] if '현재교육청' in df.columns else None
+            key_codes = self._fuzzy_duplicate_clusters(normalized, key_codes, name_column, offices)
 
-        if normalized_keys:
-            # 중복 중 첫 번째 행 유지 (가장 완전한 데이터를 가진 행 선택)
-            result_df = normalized_df.drop_duplicates(subset=normalized_keys, keep='first')
+        return df.iloc[self._cluster_survivors(df, key_codes, keep)]
 
-            # 정규화 컬럼 제거
-            result_df = result_df.drop(columns=normalized_keys)
-        else:
-            result_df = df
+    @staticmethod
+    def _composite_key_codes(normalized: pd.DataFrame) -> np.ndarray:
+        """
+        여러 키 컬럼 값 조합을 하나의 int64 코드로 (같은 조합 = 같은 코드, 첫 등장 순서로 번호)
 
-        return result_df
+        해시 대신 컬럼별 factorize 코드를 이어 붙여 다시 factorize하므로 충돌이 없다.
+        """
+        codes = np.zeros(len(normalized), dtype=np.int64)
+        for col in normalized.columns:
+            column_codes, uniques = pd.factorize(normalized[col])
+            codes, _ = pd.factorize(codes * max(len(uniques), 1) + column_codes)
+        return codes.astype(np.int64)
+
+    def _fuzzy_duplicate_clusters(self, normalized: pd.DataFrame, key_codes: np.ndarray, name_column: str,
+                                  offices: Optional[pd.Series] = None) -> np.ndarray:
+        """
+        유사 중복 클러스터 번호 (행별)
+
+        1. 정규화 키 조합이 같은 행은 하나의 레코드로 묶는다 (exact 모드의 중복은 항상 같은 클러스터).
+        2. 레코드를 (이름 첫 글자 초성, 현재교육청) 블록으로 나누고, 블록 안에서만
+           모든 키 컬럼의 유사도가 임계값 이상인 레코드를 union-find로 묶는다.
+        블록 크기가 데이터 크기와 무관하게 유지되므로 전체 비용은 행 수에 비례한다.
+        """
+        # key_codes는 첫 등장 순서로 번호가 매겨져 있으므로 첫 등장 위치도 오름차순
+        first_rows = np.unique(key_codes, return_index=True)[1]
+        records = normalized.iloc[first_rows]
+
+        block_keys = [initial_jamo(name) for name in records[name_column]]
+        if offices is not None:
+            first_offices = offices.iloc[first_rows].fillna('').astype(str).str.strip()
+            block_keys = [f"{office}\x1f{initial}" for office, initial in zip(first_offices, block_keys)]
+
+        compare_columns = [similarity_texts(records[col].tolist(), self.similarity_mode) for col in records.columns]
+        labels = np.arange(len(records))
+        for positions in pd.Series(block_keys).groupby(block_keys, sort=False).indices.values():
+            if len(positions) < 2:
+                continue
+            block_columns = [[column[pos] for pos in positions] for column in compare_columns]
+            for group in cluster_records(block_columns, self.similarity_threshold):
+                labels[positions[group]] = positions[group[0]]
+
+        merged = len(records) - len(np.unique(labels))
+        if merged:
+            print(f"  ≈ 유사 중복 {merged}건 묶음 (블록 {len(set(block_keys))}개)")
+        return labels[key_codes]
+
+    def _row_completeness(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        행별로 비어 있지 않은 KFTA 표준 컬럼 수 (표준 컬럼이 없으면 전체 컬럼 기준)
+
+        컬럼마다 한 번의 벡터 연산으로 계산한다.
+        """
+        columns = [col for col in self.KFTA_COLUMNS if col in df.columns] or list(df.columns)
+        filled = np.zeros(len(df), dtype=np.int64)
+        for col in columns:
+            values = df[col]
+            if isinstance(values, pd.DataFrame):
+                values = values.iloc[:, 0]
+            filled += (values.notna() & (values.astype(str).str.strip() != '')).to_numpy()
+        return filled
+
+    def _cluster_survivors(self, df: pd.DataFrame, cluster_ids: np.ndarray, keep: str = 'most_complete') -> np.ndarray:
+        """
+        클러스터(중복 묶음)마다 남길 행 위치 (원래 순서)
+
+        Args:
+            df: 데이터프레임
+            cluster_ids: 행별 클러스터 번호
+            keep: 'first'(먼저 나온 행) 또는 'most_complete'(가장 많이 채워진 행, 같으면 먼저 나온 행)
+        """
+        if keep == 'first':
+            survivors = np.unique(cluster_ids, return_index=True)[1]
+        else:
+            # 클러스터별 최댓값의 첫 위치 (전체 정렬 없이 해시 groupby 한 번)
+            completeness = pd.Series(self._row_completeness(df))
+            survivors = completeness.groupby(cluster_ids, sort=False).idxmax().to_numpy()
+        return np.sort(survivors)
 
     def _apply_kfta_format(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -601,99 +975,60 @@ class ExcelUnifier:
         """
         print("\n📋 강원교총 표준 형식 적용 중...")
 
-        # 표준 컬럼 순서
-        KFTA_COLUMNS = [
-            '현재교육청',
-            '현재분회',
-            '이름',
-            '발령교육청',
-            '발령분회',
-            '과목',
-            '직위',
-            '직종분류',
-            '분류명',
-            '취급코드',
-            '시군구분',
-            '교호기호등'
-        ]
-
         result_df = df.copy()
 
         # 일반 컬럼을 KFTA 컬럼으로 먼저 보강
         result_df = self._enrich_kfta_dataframe(result_df)
 
         # 누락된 컬럼 추가 (빈 값으로)
-        for col in KFTA_COLUMNS:
+        for col in self.KFTA_COLUMNS:
             if col not in result_df.columns:
                 result_df[col] = ""
                 print(f"  ℹ 컬럼 '{col}' 추가 (빈 값)")
 
         # 표준 순서대로 컬럼 재정렬
-        result_df = result_df[KFTA_COLUMNS]
+        result_df = result_df[self.KFTA_COLUMNS]
 
-        print(f"  ✓ 표준 형식 적용 완료: {len(KFTA_COLUMNS)}개 컬럼")
+        print(f"  ✓ 표준 형식 적용 완료: {len(self.KFTA_COLUMNS)}개 컬럼")
 
         return result_df
 
-    def save_unified_excel(self, output_path: str, df: pd.DataFrame = None) -> None:
-        """통합된 데이터를 엑셀 파일로 저장"""
+    def save_unified_excel(self, output_path: str, df: pd.DataFrame = None, engine: str = 'streaming',
+                           width_sample_rows: Optional[int] = None, output_format: Optional[str] = None) -> None:
+        """
+        통합된 데이터를 엑셀 파일(또는 Parquet/Feather/CSV)로 저장
+
+        Args:
+            output_path: 저장할 파일 경로
+            df: 저장할 데이터프레임 (None이면 unify_dataframes() 결과)
+            engine: 'streaming'(쓰기 전용 모드 + 공용 스타일, 기본값) 또는 'cell'(셀 단위 기록, 기존 방식)
+            width_sample_rows: 컬럼 너비를 추정할 표본 행 수 (None이면 전체 행, 대용량 출력용)
+            output_format: 'xlsx' / 'parquet' / 'feather' / 'csv' (None이면 output_path 확장자 기준, 그 외 xlsx)
+        """
+        if engine not in WRITE_ENGINES:
+            raise ValueError(f"지원하지 않는 저장 방식입니다: {engine} (streaming 또는 cell)")
+        output_format = resolve_output_format(output_path, output_format)
+
         if df is None:
             df = self.unify_dataframes()
 
         print(f"\n💾 결과 저장 중: {output_path}")
 
+        # 적재용 컬럼 형식은 스타일 없이 데이터만 저장
+        if output_format != 'xlsx':
+            write_columnar(df, output_path, output_format)
+            print(f"  ✓ 저장 완료 ({output_format}): {len(df)}행, {len(df.columns)}개 컬럼")
+            return
+
         # 엑셀로 저장
         # Fix 3: 제목줄 삽입 (붉은색 표시)
         # openpyxl을 사용하여 제목줄 추가 및 스타일링
         try:
-            from openpyxl import Workbook
-            from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-            from openpyxl.utils.dataframe import dataframe_to_rows
-            
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "통합결과"
-            
-            # 1. 제목줄 추가 (1행)
-            # "2025. 3. 1.자 유․특수․초등․중등 교(원)감, 교사 인사발령 현황 "
-            title_text = "2025. 3. 1.자 유․특수․초등․중등 교(원)감, 교사 인사발령 현황"
-            ws.merge_cells('A1:L1')  # A부터 L까지 병합 (12개 컬럼 기준)
-            cell = ws['A1']
-            cell.value = title_text
-            cell.font = Font(size=14, bold=True, color="FF0000")  # 붉은색 글씨
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-            
-            # 2. 데이터 프레임 헤더 추가 (2행)
-            for col_idx, column_title in enumerate(df.columns, 1):
-                cell = ws.cell(row=2, column=col_idx, value=column_title)
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
-                cell.alignment = Alignment(horizontal='center')
-                # 테두리 설정
-                thin_border = Border(left=Side(style='thin'), 
-                                    right=Side(style='thin'), 
-                                    top=Side(style='thin'), 
-                                    bottom=Side(style='thin'))
-                cell.border = thin_border
+            if engine == 'streaming':
+                write_unified_workbook(df, output_path, width_sample_rows=width_sample_rows)
+            else:
+                self._save_excel_cells(output_path, df, width_sample_rows)
 
-            # 3. 데이터 추가 (3행부터)
-            for r_idx, row in enumerate(dataframe_to_rows(df, index=False, header=False), 3):
-                for c_idx, value in enumerate(row, 1):
-                    cell = ws.cell(row=r_idx, column=c_idx, value=value)
-                    cell.border = thin_border
-                    
-            # 컬럼 너비 자동 조정 (대략적)
-            from openpyxl.utils import get_column_letter
-            for col_idx in range(1, ws.max_column + 1):
-                col_letter = get_column_letter(col_idx)
-                values = []
-                for row_idx in range(1, ws.max_row + 1):
-                    cell_value = ws.cell(row=row_idx, column=col_idx).value
-                    values.append(len(str(cell_value) if cell_value is not None else ""))
-                ws.column_dimensions[col_letter].width = min(max(values) + 2, 50)
-                
-            wb.save(output_path)
-            
         except ImportError:
             # openpyxl이 없으면 기본 pandas 저장 사용
             print("⚠️ openpyxl이 설치되지 않아 기본 저장 방식을 사용합니다.")
@@ -701,6 +1036,49 @@ class ExcelUnifier:
 
         print(f"  ✓ 저장 완료: {len(df)}행, {len(df.columns)}개 컬럼")
 
+    def _save_excel_cells(self, output_path: str, df: pd.DataFrame, width_sample_rows: Optional[int] = None) -> None:
+        """셀 단위로 값/스타일을 기록하는 기존 저장 방식"""
+        from openpyxl import Workbook
+        from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+        from openpyxl.utils.dataframe import dataframe_to_rows
+
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "통합결과"
+
+        # 1. 제목줄 추가 (1행)
+        ws.merge_cells(TITLE_RANGE)  # A부터 L까지 병합 (12개 컬럼 기준)
+        cell = ws['A1']
+        cell.value = TITLE_TEXT
+        cell.font = Font(size=14, bold=True, color="FF0000")  # 붉은색 글씨
+        cell.alignment = Alignment(horizontal='center', vertical='center')
+
+        # 2. 데이터 프레임 헤더 추가 (2행)
+        for col_idx, column_title in enumerate(df.columns, 1):
+            cell = ws.cell(row=2, column=col_idx, value=column_title)
+            cell.font = Font(bold=True)
+            cell.fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
+            cell.alignment = Alignment(horizontal='center')
+            # 테두리 설정
+            thin_border = Border(left=Side(style='thin'),
+                                 right=Side(style='thin'),
+                                 top=Side(style='thin'),
+                                 bottom=Side(style='thin'))
+            cell.border = thin_border
+
+        # 3. 데이터 추가 (3행부터)
+        for r_idx, row in enumerate(dataframe_to_rows(df, index=False, header=False), 3):
+            for c_idx, value in enumerate(row, 1):
+                cell = ws.cell(row=r_idx, column=c_idx, value=value)
+                cell.border = thin_border
+
+        # 컬럼 너비 자동 조정 (셀을 다시 읽지 않고 데이터프레임에서 계산)
+        from openpyxl.utils import get_column_letter
+        for col_idx, width in enumerate(column_widths(df, width_sample_rows), 1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = width
+
+        wb.save(output_path)
+
     def generate_report(self, output_path: str = None) -> str:
         """분석 리포트 생성"""
         report = []
@@ -709,7 +1087,7 @@ class ExcelUnifier:
         report.append("=" * 60)
         report.append(f"\n총 파일 수: {len(self.dataframes)}")
 
-        total_rows = sum(len(df_info['data']) for df_info in self.dataframes)
+        total_rows = sum(self._sheet_row_count(df_info) for df_info in self.dataframes)
         report.append(f"총 행 수: {total_rows}")
 
         report.append(f"\n컬럼 매핑:")
@@ -743,20 +1121,51 @@ def main():
     )
     parser.add_argument(
         '-o', '--output',
-        default='unified_output.xlsx',
-        help='출력 파일명 (기본값: unified_output.xlsx)'
+        default=None,
+        help='출력 파일명, 확장자(.xlsx/.parquet/.feather/.csv)로 형식 결정 (기본값: unified_output.xlsx)'
+    )
+    parser.add_argument(
+        '--format',
+        choices=list(OUTPUT_FORMATS),
+        default=None,
+        help='출력 형식: xlsx(스타일 적용 엑셀), parquet, feather, csv(UTF-8 BOM) (기본값: -o 확장자, 그 외 xlsx)'
+    )
+    parser.add_argument(
+        '--layout',
+        choices=['auto', 'standard', 'kfta'],
+        default='auto',
+        help='통합 양식: auto(자동 감지, 기본값), standard(모든 컬럼), kfta(강원교총 표준 12개 컬럼)'
     )
     parser.add_argument(
         '-k', '--key-columns',
         nargs='+',
         help='중복 판단에 사용할 키 컬럼명들 (예: 이름 학교)'
     )
+    parser.add_argument(
+        '--dedup-mode',
+        choices=['exact', 'fuzzy'],
+        default='exact',
+        help='중복 판단 방식: exact(정규화 값 일치, 기본값) 또는 fuzzy(유사도 임계값 이상, 오타 허용)'
+    )
+    parser.add_argument(
+        '--dedup-keep',
+        choices=['first', 'most_complete'],
+        default=None,
+        help='중복 중 남길 행: first(먼저 나온 행) 또는 most_complete(가장 많이 채워진 행) '
+             '(기본값: exact는 first, fuzzy는 most_complete)'
+    )
     parser.add_argument(
         '-t', '--threshold',
         type=int,
         default=85,
         help='유사도 임계값 0-100 (기본값: 85)'
     )
+    parser.add_argument(
+        '--similarity-mode',
+        choices=['syllable', 'jamo'],
+        default='syllable',
+        help='유사도 비교 단위: syllable(음절, 기본값) 또는 jamo(자모 분해, 오타/받침 차이에 관대)'
+    )
     parser.add_argument(
         '-r', '--report',
         help='분석 리포트 저장 경로'
@@ -775,24 +1184,72 @@ def main():
         default=None,
         help='Gemini 모델명 (기본: gemini-3-flash, 실패 시 자동 폴백)'
     )
+    parser.add_argument(
+        '-w', '--workers',
+        type=int,
+        default=1,
+        help='파일 로딩/KFTA 시트 파싱 프로세스 수 (기본값: 1, 순차 처리)'
+    )
+    parser.add_argument(
+        '--stream-rows',
+        type=int,
+        default=None,
+        help='--layout kfta일 때 데이터 행이 이 수 이상인 KFTA 원본 XLSX 시트는 전체를 읽지 않고 '
+             '청크 단위로 스트리밍 파싱 (기본값: 사용 안 함)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='파싱된 시트 캐시를 사용하지 않고 항상 원본을 다시 읽음'
+    )
+    parser.add_argument(
+        '--clear-cache',
+        action='store_true',
+        help='실행 전에 파싱된 시트 캐시를 모두 삭제'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        default=None,
+        help='시트 캐시 디렉터리 (기본값: KFTA_CACHE_DIR 또는 ~/.cache/kfta_excel/sheets)'
+    )
 
     args = parser.parse_args()
+    if args.output is None:
+        args.output = 'unified_output' + OUTPUT_EXTENSIONS[args.format or 'xlsx']
+    try:
+        resolve_output_format(args.output, args.format)
+    except ValueError as e:
+        parser.error(str(e))
+
+    sheet_cache = SheetCache(cache_dir=args.cache_dir)
+    if args.clear_cache:
+        sheet_cache.clear()
+        print(f"🧹 시트 캐시 삭제: {sheet_cache.cache_dir}")
 
     # ExcelUnifier 실행
     unifier = ExcelUnifier(
         similarity_threshold=args.threshold,
+        similarity_mode=args.similarity_mode,
         use_ai=args.ai,
         gemini_api_key=args.api_key,
         gemini_model=args.gemini_model,
+        workers=args.workers,
+        sheet_cache=None if args.no_cache else sheet_cache,
+        stream_min_rows=args.stream_rows,
     )
     unifier.load_excel_files(args.files)
     unifier.analyze_columns()
 
     # 데이터 통합
-    unified_df = unifier.unify_dataframes(key_columns=args.key_columns)
+    unified_df = unifier.unify_dataframes(
+        key_columns=args.key_columns,
+        output_format=args.layout,
+        dedup_mode=args.dedup_mode,
+        dedup_keep=args.dedup_keep,
+    )
 
     # 결과 저장
-    unifier.save_unified_excel(args.output, unified_df)
+    unifier.save_unified_excel(args.output, unified_df, output_format=args.format)
 
     # 리포트 생성
     report = unifier.generate_report(args.report)
@@ -5,17 +5,60 @@ KFTA Excel Parser - 강원교총 전용 엑셀 파서
 특정 필드 위치 기반으로 데이터 추출 및 변환
 """
 
+import numpy as np
 import pandas as pd
 import re
 import json
 import os
-from typing import Dict, List, Optional
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 from datetime import datetime
 try:
     import libsql_experimental as libsql
 except ImportError:
     libsql = None
 
+try:
+    from .workbook_reader import iter_sheet_row_chunks
+    from .text_index import KeywordAutomaton, PrefixTrie
+except ImportError:
+    from workbook_reader import iter_sheet_row_chunks
+    from text_index import KeywordAutomaton, PrefixTrie
+
+
+class SchoolResolutionIndex:
+    """
+    학교명 → 교육청 조회용 사전 컴파일 인덱스 (프로세스당 한 번 생성)
+
+    find_education_office_for_school의 우선순위를 그대로 유지한다.
+    - 중고등학교 키워드: 긴 키워드 우선 (같은 길이는 정의 순서)
+    - 지역명 접두어: 가장 긴 지역명
+    - 지역명 포함: 긴 지역명 우선
+    """
+
+    def __init__(self, middle_high_keywords, regions, abbreviations=None):
+        self.sorted_keywords = sorted(middle_high_keywords, key=len, reverse=True)
+        self.sorted_abbreviations = sorted((abbreviations or {}).items(), key=lambda x: len(x[0]), reverse=True)
+        self.sorted_regions = sorted(regions, key=len, reverse=True)
+        self._keyword_automaton = KeywordAutomaton(self.sorted_keywords)
+        self._region_automaton = KeywordAutomaton(self.sorted_regions)
+        self._region_prefix = PrefixTrie(self.sorted_regions)
+
+    def match_keyword(self, school_name: str) -> Optional[str]:
+        """학교명에 포함된 중고등학교 키워드 중 가장 우선순위가 높은 것"""
+        return self._keyword_automaton.first_match(school_name)
+
+    def match_region_prefix(self, school_name: str) -> Optional[str]:
+        """학교명이 시작하는 지역명 (가장 긴 것)"""
+        return self._region_prefix.longest_prefix(school_name)
+
+    def regions_in(self, school_name: str) -> List[str]:
+        """학교명에 포함된 지역명 목록 (긴 지역명 우선)"""
+        return [self.sorted_regions[rank] for rank in self._region_automaton.find_ranks(school_name)]
+
 
 class KFTAParser:
     """강원교총 엑셀 파일 파서"""
@@ -976,6 +1019,15 @@ class KFTAParser:
         '유치원원감': '유치원감',
     }
 
+    # 헤더 행 판별 키워드 (대응, 성명, 이름, 비고, 발령사항 등)
+    HEADER_KEYWORDS = ['성명', '이름', '대응', '대 응', '비고', '발령사항', '발령', '현소속', '현 소속']
+
+    # parse_row_to_kfta가 읽는 위치별 필드 수 (인덱스 0~9)
+    PARSED_FIELD_COUNT = 10
+
+    # 병렬 파싱 최소 행 수 (이보다 작으면 프로세스 기동 비용이 더 커서 순차 처리)
+    PARSE_SHARD_MIN_ROWS = 2000
+
     GANGWON_ALL_SCHOOLS = {} # Placeholder, assuming it's populated elsewhere
     GANGWON_REGIONS = { # Placeholder, assuming it's populated elsewhere
         '춘천': '강원특별자치도춘천교육지원청',
@@ -988,17 +1040,54 @@ class KFTAParser:
         '동해': '강원특별자치도동해교육지원청',
     }
 
-    def __init__(self, use_ai: bool = False, ai_matcher=None, use_web_search: bool = True):
+    @classmethod
+    def school_index(cls) -> SchoolResolutionIndex:
+        """클래스별 학교명 조회 인덱스 (최초 호출 시 한 번만 생성)"""
+        index = cls.__dict__.get('_school_index')
+        if index is None:
+            index = SchoolResolutionIndex(
+                cls.MIDDLE_HIGH_SCHOOL_REGION_MAP.keys(),
+                cls.GANGWON_REGIONS.keys(),
+                cls.SCHOOL_ABBR_MAPPINGS,
+            )
+            cls._school_index = index
+        return index
+
+    def __init__(self, use_ai: bool = False, ai_matcher=None, use_web_search: bool = True,
+                 school_cache_size: int = 4096, flush_every: int = 500, flush_interval: float = 30.0,
+                 failed_log_jsonl: bool = False, learned_mappings: Optional[Dict[str, str]] = None):
         """
         Args:
             use_ai: AI 기반 학교명 검증 사용 여부
             ai_matcher: GeminiMatcher 인스턴스 (use_ai=True일 때 필요)
             use_web_search: 웹 검색 기반 학교명 → 교육청 매핑 사용 여부
+            school_cache_size: 학교명 정규화 결과 LRU 캐시 크기
+            flush_every: 학습 매핑을 이 개수만큼 모으면 DB/파일에 저장 (0이면 개수 기준 저장 안 함)
+            flush_interval: 마지막 저장 후 이 시간(초)이 지나면 저장 (0이면 시간 기준 저장 안 함)
+            failed_log_jsonl: 매핑 실패 로그를 JSONL 파일(failed_mappings.jsonl)로도 기록할지 여부
+            learned_mappings: 이미 로드된 학습 매핑 (주어지면 DB 연결과 파일 로드를 생략, 병렬 파싱 작업자용)
         """
         self.use_ai = use_ai
         self.ai_matcher = ai_matcher
         self.use_web_search = use_web_search
 
+        # 학습 매핑 쓰기 지연 버퍼 (파싱 종료 시 또는 N개/T초마다 한 번에 저장)
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._pending_mappings: Dict[str, str] = {}
+        self._last_flush = time.monotonic()
+
+        # 매핑 실패 버퍼 (학교명별 발생 횟수 집계 후 한 번에 기록)
+        self.failed_log_jsonl = failed_log_jsonl
+        self._failed_mappings: Dict[str, dict] = {}
+
+        # 학교명 정규화 체인(약칭 확장 → 교육청 조회 → 지역명 제거) 단계별 메모이제이션
+        # 한 파일 안에서 같은 학교 문자열이 수천 번 반복되므로 원문 + 힌트 기준으로 재사용
+        self.school_cache_size = school_cache_size
+        self._expand_cache = lru_cache(maxsize=school_cache_size)(self.expand_school_abbreviation)
+        self._resolve_cache = lru_cache(maxsize=school_cache_size)(self._resolve_school_uncached)
+        self._strip_region_cache = lru_cache(maxsize=school_cache_size)(self.remove_region_prefix_from_school_name)
+
         # 학교명 → 교육청 매핑 캐시 (웹 검색 결과 저장)
         self.school_edu_office_cache = {}
 
@@ -1007,7 +1096,7 @@ class KFTAParser:
         self.db_token = os.getenv('TURSO_AUTH_TOKEN')
         self.conn = None
         
-        if self.db_url and libsql:
+        if self.db_url and libsql and learned_mappings is None:
             try:
                 self.conn = libsql.connect(self.db_url, auth_token=self.db_token)
                 self.conn.execute("""
@@ -1026,9 +1115,13 @@ class KFTAParser:
         self.base_dir = os.path.dirname(os.path.abspath(__file__))
         self.learned_mappings_file = os.path.join(self.base_dir, 'learned_school_mappings.json')
         self.failed_mappings_log = os.path.join(self.base_dir, 'failed_mappings.log') # Corrected from 'failed_mappings_file'
+        self.failed_mappings_jsonl = os.path.join(self.base_dir, 'failed_mappings.jsonl')
 
         # 학습된 매핑 자동 로드
-        self.load_learned_mappings()
+        if learned_mappings is None:
+            self.load_learned_mappings()
+        else:
+            self.school_edu_office_cache.update(learned_mappings)
 
         if use_ai and not ai_matcher:
             try:
@@ -1068,22 +1161,48 @@ class KFTAParser:
             print("📚 학습된 매핑 파일 없음 (새로 시작)")
 
     def save_learned_mapping(self, school_name: str, education_office: str):
-        """성공한 매핑을 DB 및 JSON 파일에 저장 (자동 학습)"""
+        """
+        성공한 매핑을 학습 (자동 학습)
+
+        메모리 캐시는 즉시 갱신하고, DB/JSON 저장은 버퍼에 모았다가 flush()에서 한 번에 처리한다.
+        이미 같은 값으로 학습된 매핑은 다시 저장하지 않는다.
+        """
         if not school_name or not education_office:
             return
 
+        if self.school_edu_office_cache.get(school_name) == education_office:
+            return
+
         # 메모리 캐시 업데이트
         self.school_edu_office_cache[school_name] = education_office
-        
-        # 1. DB 저장
+        self._pending_mappings[school_name] = education_office
+        self._auto_flush_learned_mappings()
+
+    def _auto_flush_learned_mappings(self):
+        """버퍼가 flush_every개 이상이거나 마지막 저장 후 flush_interval초가 지났으면 저장"""
+        if self.flush_every and len(self._pending_mappings) >= self.flush_every:
+            self.flush_learned_mappings()
+        elif self.flush_interval and time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush_learned_mappings()
+
+    def flush_learned_mappings(self):
+        """버퍼에 모인 학습 매핑을 DB(일괄 트랜잭션)와 JSON 파일(원자적 교체)에 저장"""
+        self._last_flush = time.monotonic()
+        if not self._pending_mappings:
+            return
+
+        pending = self._pending_mappings
+        self._pending_mappings = {}
+
+        # 1. DB 저장 (executemany 한 번 + commit 한 번)
         if self.conn:
             try:
-                self.conn.execute(
+                self.conn.executemany(
                     "INSERT OR REPLACE INTO school_mappings (school_name, education_office) VALUES (?, ?)",
-                    (school_name, education_office)
+                    list(pending.items())
                 )
                 self.conn.commit()  # 변경사항 확정 (libsql에서는 필요할 수 있음)
-                print(f"  💾 Turso DB 저장: '{school_name}' → '{education_office}'")
+                print(f"  💾 Turso DB 저장: 학습 매핑 {len(pending)}개")
             except Exception as e:
                 print(f"  ⚠️ DB 저장 실패: {e}")
 
@@ -1094,32 +1213,83 @@ class KFTAParser:
             if os.path.exists(self.learned_mappings_file):
                 with open(self.learned_mappings_file, 'r', encoding='utf-8') as f:
                     current_data = json.load(f)
-            
+
             # 업데이트
-            current_data[school_name] = education_office
-            
-            # 저장
-            with open(self.learned_mappings_file, 'w', encoding='utf-8') as f:
+            current_data.update(pending)
+
+            # 같은 디렉터리의 임시 파일에 쓴 뒤 교체 (중간에 실패해도 기존 파일 보존)
+            target_dir = os.path.dirname(os.path.abspath(self.learned_mappings_file))
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=target_dir,
+                                             suffix='.tmp', delete=False) as f:
                 json.dump(current_data, f, ensure_ascii=False, indent=2)
-                
-            print(f"  💾 로컬 학습 저장: '{school_name}' → '{education_office}'")
-            
+                tmp_path = f.name
+            os.replace(tmp_path, self.learned_mappings_file)
+
+            print(f"  💾 로컬 학습 저장: 학습 매핑 {len(pending)}개")
+
         except Exception as e:
             print(f"  ⚠️  매핑 저장 실패: {str(e)}")
 
+    def flush(self):
+        """쓰기 지연 중인 학습 매핑과 실패 로그를 모두 저장"""
+        self.flush_learned_mappings()
+        self.flush_failed_mappings()
+
     def log_failed_mapping(self, school_name: str, hints: dict = None):
-        """실패한 매핑을 로그 파일에 기록"""
+        """
+        실패한 매핑을 버퍼에 기록 (flush() 시 로그 파일에 한 번에 저장)
+
+        같은 학교명은 한 줄로 합치고 발생 횟수를 센다. 힌트는 처음 실패했을 때의 값을 남긴다.
+        """
         if not school_name:
             return
 
-        try:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            hints_str = f"regions={hints.get('regions', [])}, edu_offices={hints.get('education_offices', [])}" if hints else "no hints"
+        entry = self._failed_mappings.get(school_name)
+        if entry is not None:
+            entry['count'] += 1
+            return
+
+        self._failed_mappings[school_name] = {
+            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'school_name': school_name,
+            'regions': list(hints.get('regions', [])) if hints else None,
+            'education_offices': list(hints.get('education_offices', [])) if hints else None,
+            'count': 1,
+        }
 
-            log_entry = f"[{timestamp}] 매핑 실패: '{school_name}' | {hints_str}\n"
+    def _merge_failed_mapping(self, failed: dict):
+        """다른 파서(병렬 파싱 작업자)에서 모은 실패 항목을 버퍼에 합침"""
+        entry = self._failed_mappings.get(failed['school_name'])
+        if entry is None:
+            self._failed_mappings[failed['school_name']] = dict(failed)
+        else:
+            entry['count'] += failed['count']
+
+    def flush_failed_mappings(self):
+        """버퍼에 모인 매핑 실패를 텍스트 로그(및 선택적으로 JSONL)에 한 번에 추가"""
+        if not self._failed_mappings:
+            return
+
+        entries = list(self._failed_mappings.values())
+        self._failed_mappings = {}
+
+        try:
+            lines = []
+            for entry in entries:
+                if entry['regions'] is None:
+                    hints_str = "no hints"
+                else:
+                    hints_str = f"regions={entry['regions']}, edu_offices={entry['education_offices']}"
+                count_str = f" | {entry['count']}회" if entry['count'] > 1 else ""
+                lines.append(f"[{entry['timestamp']}] 매핑 실패: '{entry['school_name']}' | {hints_str}{count_str}\n")
 
             with open(self.failed_mappings_log, 'a', encoding='utf-8') as f:
-                f.write(log_entry)
+                f.writelines(lines)
+
+            if self.failed_log_jsonl:
+                with open(self.failed_mappings_jsonl, 'a', encoding='utf-8') as f:
+                    for entry in entries:
+                        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
 
         except Exception as e:
             print(f"⚠️  실패 로그 기록 실패: {str(e)}")
@@ -1155,10 +1325,8 @@ class KFTAParser:
 
         school_name = str(school_name).strip()
 
-        # 강원도 지역명을 길이 역순으로 정렬 (긴 지역명부터 매칭)
-        sorted_regions = sorted(self.GANGWON_REGIONS.keys(), key=len, reverse=True)
-
-        for region in sorted_regions:
+        # 강원도 지역명을 길이 역순으로 정렬 (긴 지역명부터 매칭, 인덱스에 미리 정렬됨)
+        for region in self.school_index().sorted_regions:
             # Fix 2: 지역명 뒤에 공백이 있는 경우에만 제거 (예: "춘천 " -> "")
             # "춘천초등학교" -> "춘천초등학교" (유지)
             # "춘천 초등학교" -> "초등학교" (제거)
@@ -1309,49 +1477,44 @@ class KFTAParser:
             self.school_edu_office_cache[school_name] = result  # 캐시 저장
             return result
 
+        index = self.school_index()
+
         # 1. MIDDLE_HIGH_SCHOOL_REGION_MAP에서 중고등학교 키워드 매칭
         # 긴 키워드부터 매칭 (예: "강릉제일"이 "강릉"보다 먼저)
-        sorted_keywords = sorted(self.MIDDLE_HIGH_SCHOOL_REGION_MAP.keys(),
-                                key=len, reverse=True)
-
-        for keyword in sorted_keywords:
-            if keyword in school_name:
-                result = self.MIDDLE_HIGH_SCHOOL_REGION_MAP[keyword]
-                self.save_learned_mapping(school_name, result)  # 자동 학습
-                return result
+        keyword = index.match_keyword(school_name)
+        if keyword is not None:
+            result = self.MIDDLE_HIGH_SCHOOL_REGION_MAP[keyword]
+            self.save_learned_mapping(school_name, result)  # 자동 학습
+            return result
 
         # 2. 초등학교/유치원: 학교명 앞부분에서 지역명 추출
         # 예: "춘천남산초등학교" → "춘천" 추출
         # 예: "강원특별자치도춘천교육지원청속초유치원" → "속초" 추출
 
-        # 강원도 지역명을 길이 역순으로 정렬 (긴 지역명부터 매칭)
-        sorted_regions = sorted(self.GANGWON_REGIONS.keys(), key=len, reverse=True)
-
-        # 2-1. 학교명이 지역명으로 시작하는지 확인
-        for region in sorted_regions:
-            if school_name.startswith(region):
-                result = self.get_education_office(region)
-                self.save_learned_mapping(school_name, result)  # 자동 학습
-                return result
+        # 2-1. 학교명이 지역명으로 시작하는지 확인 (긴 지역명부터 매칭)
+        region = index.match_region_prefix(school_name)
+        if region is not None:
+            result = self.get_education_office(region)
+            self.save_learned_mapping(school_name, result)  # 자동 학습
+            return result
 
         # 2-2. 학교명에 지역명이 포함되어 있는지 확인 (앞부분 우선)
-        for region in sorted_regions:
-            if region in school_name:
-                # 중복 학교명 데이터베이스에서 확인
-                if school_name in self.GANGWON_SCHOOL_DATABASE:
-                    edu_office = self.get_education_office(region)
-                    school_mappings = self.GANGWON_SCHOOL_DATABASE[school_name]
-                    if edu_office in school_mappings:
-                        self.save_learned_mapping(school_name, edu_office)  # 자동 학습
-                        return edu_office
-                else:
-                    # 일반 학교명인 경우 첫 번째 매칭된 지역 반환
-                    # 단, 학교명 앞쪽에서 발견된 경우에만
-                    region_index = school_name.find(region)
-                    if region_index <= 10:  # 학교명 앞부분 10자 이내
-                        result = self.get_education_office(region)
-                        self.save_learned_mapping(school_name, result)  # 자동 학습
-                        return result
+        for region in index.regions_in(school_name):
+            # 중복 학교명 데이터베이스에서 확인
+            if school_name in self.GANGWON_SCHOOL_DATABASE:
+                edu_office = self.get_education_office(region)
+                school_mappings = self.GANGWON_SCHOOL_DATABASE[school_name]
+                if edu_office in school_mappings:
+                    self.save_learned_mapping(school_name, edu_office)  # 자동 학습
+                    return edu_office
+            else:
+                # 일반 학교명인 경우 첫 번째 매칭된 지역 반환
+                # 단, 학교명 앞쪽에서 발견된 경우에만
+                region_index = school_name.find(region)
+                if region_index <= 10:  # 학교명 앞부분 10자 이내
+                    result = self.get_education_office(region)
+                    self.save_learned_mapping(school_name, result)  # 자동 학습
+                    return result
 
         # 3. Fallback: hints 정보에서 교육청 추출
         if hints:
@@ -1395,6 +1558,72 @@ class KFTAParser:
         self.log_failed_mapping(school_name, hints)
         return ''
 
+    @staticmethod
+    def _hint_signature(hints: dict = None) -> Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]]:
+        """힌트 딕셔너리를 캐시 키로 쓸 수 있는 튜플로 변환 (순서 유지)"""
+        if hints is None:
+            return None
+        return (tuple(hints.get('regions', [])), tuple(hints.get('education_offices', [])))
+
+    def _resolve_school_uncached(self, school_name: str, hint_signature, learned_value) -> str:
+        # learned_value는 캐시 키 용도로만 사용 (학습 캐시가 바뀌면 다시 계산되도록)
+        hints = None
+        if hint_signature is not None:
+            hints = {'regions': list(hint_signature[0]), 'education_offices': list(hint_signature[1])}
+        return self.find_education_office_for_school(school_name, hints)
+
+    def normalize_school_name(self, raw_text: str, hints: dict = None, expand: bool = True) -> Tuple[str, str]:
+        """
+        학교명 정규화 체인: 약칭 확장 → 교육청 조회 (LRU 캐시)
+
+        약칭 확장은 원문 기준, 교육청 조회는 (학교명, 힌트, 현재 학습 매핑값) 기준으로 캐시한다.
+        조회 결과는 학습 매핑 캐시에 의존할 수 있으므로 해당 학교의 학습값이 바뀌면 다시 계산된다.
+        캐시 적중으로 조회를 건너뛴 실패도 실패 로그의 발생 횟수에는 더한다.
+
+        Args:
+            raw_text: 셀 원문 학교명
+            hints: extract_all_region_hints 결과
+            expand: False면 약칭 확장 없이 교육청 조회만 수행
+
+        Returns:
+            (학교명, 교육청명) 튜플
+        """
+        school_name = self._expand_cache(raw_text) if expand else raw_text
+        if not isinstance(school_name, str) or not school_name:
+            return school_name, self.find_education_office_for_school(school_name, hints)
+
+        misses = self._resolve_cache.cache_info().misses
+        education_office = self._resolve_cache(
+            school_name,
+            self._hint_signature(hints),
+            self.school_edu_office_cache.get(school_name),
+        )
+        # 캐시 적중 시 find_education_office_for_school이 실행되지 않으므로 실패 횟수를 여기서 기록
+        if not education_office and self._resolve_cache.cache_info().misses == misses:
+            self.log_failed_mapping(school_name, hints)
+        # 조회 성공 후에는 학습 캐시가 항상 결과값을 가리키므로, 캐시 적중 시에도 같은 상태를 유지
+        if education_office and self.school_edu_office_cache.get(school_name) != education_office:
+            self.save_learned_mapping(school_name, education_office)
+        return school_name, education_office
+
+    def strip_region_prefix(self, school_name: str) -> str:
+        """remove_region_prefix_from_school_name의 캐시 버전"""
+        if not isinstance(school_name, str):
+            return self.remove_region_prefix_from_school_name(school_name)
+        return self._strip_region_cache(school_name)
+
+    def school_cache_stats(self) -> Dict[str, int]:
+        """학교명 정규화 캐시 적중/미스 횟수"""
+        stats = {'hits': 0, 'misses': 0}
+        for name, cache in [('expand', self._expand_cache), ('resolve', self._resolve_cache),
+                            ('strip', self._strip_region_cache)]:
+            info = cache.cache_info()
+            stats[f'{name}_hits'] = info.hits
+            stats[f'{name}_misses'] = info.misses
+            stats['hits'] += info.hits
+            stats['misses'] += info.misses
+        return stats
+
     def lookup_school_with_region(self, region: str, school_name: str) -> tuple:
         """
         지역명과 학교명을 사용하여 정확한 학교명과 교육청 조회
@@ -1623,12 +1852,8 @@ class KFTAParser:
         if school_name == '속초유':
             return '속초유치원'
 
-        # 3. 약칭 매핑을 길이 순으로 정렬 (긴 것부터 매칭)
-        sorted_mappings = sorted(self.SCHOOL_ABBR_MAPPINGS.items(),
-                                key=lambda x: len(x[0]),
-                                reverse=True)
-
-        for abbr, full_name in sorted_mappings:
+        # 3. 약칭 매핑을 길이 순으로 정렬 (긴 것부터 매칭, 인덱스에 미리 정렬됨)
+        for abbr, full_name in self.school_index().sorted_abbreviations:
             if school_name.endswith(abbr):
                 # 약칭을 정식 명칭으로 교체
                 base_name = school_name[:-len(abbr)]
@@ -1811,7 +2036,7 @@ class KFTAParser:
             return False
 
         # 헤더 키워드 목록 (대응, 성명, 이름, 비고, 발령사항 등)
-        header_keywords = ['성명', '이름', '대응', '대 응', '비고', '발령사항', '발령', '현소속', '현 소속']
+        header_keywords = self.HEADER_KEYWORDS
         value_str = str(value).strip()
 
         # 헤더 키워드와 정확히 일치하면 헤더 행으로 판단
@@ -1858,21 +2083,27 @@ class KFTAParser:
                 continue
 
             value_str = str(value).strip()
+            found_regions, is_education_office = self._text_region_hints(value_str)
 
             # 교육청 키워드 발견
-            if '교육청' in value_str or '교육지원청' in value_str:
+            if is_education_office:
                 education_offices.append(value_str)
 
             # 지역명 발견
-            for region in self.GANGWON_REGIONS.keys():
-                if region in value_str:
-                    regions.append(region)
+            regions.extend(found_regions)
 
+        # 중복 제거 (처음 발견된 순서 유지 - 실행마다 힌트 순서가 바뀌지 않도록)
         return {
-            'regions': list(set(regions)),  # 중복 제거
-            'education_offices': list(set(education_offices))
+            'regions': list(dict.fromkeys(regions)),
+            'education_offices': list(dict.fromkeys(education_offices))
         }
 
+    def _text_region_hints(self, value_str: str) -> Tuple[List[str], bool]:
+        """셀 문자열에 포함된 지역명 목록과 교육청 키워드 포함 여부"""
+        is_education_office = '교육청' in value_str or '교육지원청' in value_str
+        regions = [region for region in self.GANGWON_REGIONS.keys() if region in value_str]
+        return regions, is_education_office
+
     def parse_row_to_kfta(self, row: pd.Series) -> Dict[str, str]:
         """
         행 데이터를 강원교총 표준 형식으로 변환
@@ -1888,6 +2119,46 @@ class KFTAParser:
         # 먼저 행 전체에서 지역 및 교육청 힌트 추출
         hints = self.extract_all_region_hints(row)
 
+        width = len(row)
+        fields = [
+            str(row.iloc[idx]).strip() if idx < width and pd.notna(row.iloc[idx]) else ''
+            for idx in range(self.PARSED_FIELD_COUNT)
+        ]
+        return self._parse_kfta_fields(fields, width, hints, self.classify_fields(fields))
+
+    def classify_fields(self, fields: Sequence[str]) -> Dict[str, bool]:
+        """
+        위치별 필드의 학교명/지역명/중고등학교 판별 결과
+
+        Args:
+            fields: 앞뒤 공백을 제거한 위치별 필드 값 (빈 셀은 '')
+        """
+        return {
+            'school_6': self.is_school_name(fields[5]),
+            'middle_high_6': self.is_middle_high_text(fields[5]),
+            'region_only_8': self.is_region_name_only(fields[7]),
+            'school_8': self.is_school_name(fields[7]),
+            'middle_high_8': self.is_middle_high_text(fields[7]),
+            'school_9': self.is_school_name(fields[8]),
+            'school_10': self.is_school_name(fields[9]),
+        }
+
+    @staticmethod
+    def is_middle_high_text(text: str) -> bool:
+        """중학교/고등학교 표기인지 확인 (예: "춘천중학교", "원주고")"""
+        return '중학' in text or '고등' in text or text.endswith('중') or text.endswith('고')
+
+    def _parse_kfta_fields(self, fields: Sequence[str], width: int, hints: dict,
+                           flags: Dict[str, bool]) -> Dict[str, str]:
+        """
+        정리된 위치별 필드 값으로 강원교총 표준 형식 행 생성 (행 단위/컬럼 단위 엔진 공용)
+
+        Args:
+            fields: 앞뒤 공백을 제거한 위치별 필드 값 (빈 셀은 '')
+            width: 원본 행의 필드 수
+            hints: extract_all_region_hints() 결과
+            flags: classify_fields() 결과
+        """
         result = {
             '현재교육청': '',
             '현재분회': '',
@@ -1900,24 +2171,24 @@ class KFTAParser:
         }
 
         # 3번째 필드 → 이름 (성명) - 공백 제거
-        if len(row) > 2:
-            name = str(row.iloc[2]).strip() if pd.notna(row.iloc[2]) else ''
+        if width > 2:
+            name = fields[2]
             # 이름 사이의 공백 제거 (예: "이  준" → "이준")
             result['이름'] = name.replace(' ', '')
 
         # 5번째 필드 → 직위 (정규화 적용)
-        if len(row) > 4:
-            position = str(row.iloc[4]).strip() if pd.notna(row.iloc[4]) else ''
+        if width > 4:
+            position = fields[4]
             result['직위'] = self.normalize_position(position)
 
         # 6번째 필드 → 발령분회 및 발령교육청
-        if len(row) > 5:
-            field_6 = str(row.iloc[5]).strip() if pd.notna(row.iloc[5]) else ''
+        if width > 5:
+            field_6 = fields[5]
 
             # 먼저 학교명인지 확인
-            if field_6 and self.is_school_name(field_6):
+            if field_6 and flags['school_6']:
                 # 중고등학교는 AI 검증 우선 시도 (use_ai=True인 경우)
-                is_middle_high = '중학' in field_6 or '고등' in field_6 or field_6.endswith('중') or field_6.endswith('고')
+                is_middle_high = flags['middle_high_6']
 
                 if is_middle_high and self.use_ai:
                     # AI로 학교명 검증 및 확장
@@ -1935,27 +2206,18 @@ class KFTAParser:
                         result['발령교육청'] = edu_office
                         result['발령분회'] = school_name
                     else:
-                        # 일반 형식 처리
-                        result['발령분회'] = self.expand_school_abbreviation(field_6)
-
-                        # 중고등학교 교육지원청 자동 매핑
-                        if is_middle_high:
-                            edu_office = self.find_education_office_for_school(result['발령분회'], hints)
-                            if edu_office:
-                                result['발령교육청'] = edu_office
-                        else:
-                            # 초등학교/유치원: 지역명 추출 → 발령교육청
-                            # find_education_office_for_school() 사용 (hints fallback 포함)
-                            edu_office = self.find_education_office_for_school(result['발령분회'], hints)
-                            if edu_office:
-                                result['발령교육청'] = edu_office
+                        # 일반 형식 처리: 약칭 확장 → 교육지원청 자동 매핑
+                        # 중고등학교/초등학교/유치원 모두 find_education_office_for_school() 사용 (hints fallback 포함)
+                        result['발령분회'], edu_office = self.normalize_school_name(field_6, hints)
+                        if edu_office:
+                            result['발령교육청'] = edu_office
             # field_6이 학교명이 아니면 과목으로 간주
             elif field_6:
                 result['과목'] = field_6
 
         # 8번째 필드 처리
-        if len(row) > 7:
-            field_8 = str(row.iloc[7]).strip() if pd.notna(row.iloc[7]) else ''
+        if width > 7:
+            field_8 = fields[7]
 
             # 유치원 신규원감 발령 특수 처리
             # 직위에 "유치원"과 "원감" 또는 "신규"가 포함된 경우
@@ -1966,9 +2228,9 @@ class KFTAParser:
                 is_principal = '원감' in position_lower or '신규' in position_lower
                 is_kindergarten_principal = is_kindergarten and is_principal
 
-            if is_kindergarten_principal and len(row) > 9:
+            if is_kindergarten_principal and width > 9:
                 # 유치원 신규원감의 경우 비고란(10번째 필드)에서 현재분회 정보 추출
-                field_10 = str(row.iloc[9]).strip() if pd.notna(row.iloc[9]) else ''
+                field_10 = fields[9]
 
                 if field_10:
                     edu_office, school_name = self.parse_bigo_for_kindergarten(field_10)
@@ -1981,18 +2243,16 @@ class KFTAParser:
                     # print(f"  🏫 유치원 신규원감 파싱: '{field_10}' → 교육청={edu_office}, 분회={school_name}")
 
             # 8번째 필드가 지역명만 있는 경우 (일반 케이스)
-            elif self.is_region_name_only(field_8):
+            elif flags['region_only_8']:
                 # 10번째 필드(인덱스 9) 참고 - 비고란에 실제 학교명
-                if len(row) > 9:
-                    field_10 = str(row.iloc[9]).strip() if pd.notna(row.iloc[9]) else ''
+                if width > 9:
+                    field_10 = fields[9]
 
-                    if field_10 and self.is_school_name(field_10):  # 비고에 학교명이 있으면
-                        # 학교 약칭 확장
-                        school_name = self.expand_school_abbreviation(field_10)
+                    if field_10 and flags['school_10']:  # 비고에 학교명이 있으면
+                        # 학교 약칭 확장 → 중고등학교 교육지원청 자동 매핑
+                        school_name, edu_office = self.normalize_school_name(field_10, hints)
                         result['현재분회'] = school_name
 
-                        # 중고등학교 교육지원청 자동 매핑
-                        edu_office = self.find_education_office_for_school(school_name, hints)
                         if edu_office:
                             result['현재교육청'] = edu_office
                         else:
@@ -2006,9 +2266,9 @@ class KFTAParser:
                         if region_8:
                             result['현재교육청'] = self.get_education_office(region_8)
             # field_8이 학교명인지 확인
-            elif field_8 and self.is_school_name(field_8):
+            elif field_8 and flags['school_8']:
                 # 중고등학교는 AI 검증 우선 시도
-                is_middle_high = '중학' in field_8 or '고등' in field_8 or field_8.endswith('중') or field_8.endswith('고')
+                is_middle_high = flags['middle_high_8']
 
                 if is_middle_high and self.use_ai:
                     # AI로 학교명 검증 및 확장
@@ -2027,21 +2287,20 @@ class KFTAParser:
                         result['현재분회'] = school_name
                     else:
                         # 8번째 필드가 지역명만이 아니면 → 현재분회
-                        result['현재분회'] = self.expand_school_abbreviation(field_8)
-
                         # 중고등학교 교육지원청 자동 매핑
                         if is_middle_high:
-                            edu_office = self.find_education_office_for_school(result['현재분회'], hints)
+                            result['현재분회'], edu_office = self.normalize_school_name(field_8, hints)
                             if edu_office:
                                 result['현재교육청'] = edu_office
                         else:
+                            result['현재분회'] = self.expand_school_abbreviation(field_8)
                             if edu_office:
                                 result['현재교육청'] = edu_office
 
             # Fix 5 & 9: 타시도전입자 등 비고란에서 이전 학교명/교육청 파악
             # 현재분회/교육청이 비어있고 비고란(10번째 필드)이 있는 경우
-            if (not result['현재분회'] or not result['현재교육청']) and len(row) > 9:
-                field_10 = str(row.iloc[9]).strip() if pd.notna(row.iloc[9]) else ''
+            if (not result['현재분회'] or not result['현재교육청']) and width > 9:
+                field_10 = fields[9]
                 
                 if field_10:
                     # 1. "전입(이전학교)" 형식 파악
@@ -2062,16 +2321,15 @@ class KFTAParser:
                                 result['현재교육청'] = edu
                             elif not edu and school:
                                 # 학교명에서 교육청 찾기 시도
-                                edu = self.find_education_office_for_school(school, hints)
+                                _, edu = self.normalize_school_name(school, hints, expand=False)
                                 if edu:
                                     result['현재교육청'] = edu
                                     
                     # 2. 단순히 학교명이 적혀있는 경우
-                    if not result['현재분회'] and self.is_school_name(field_10):
-                        school = self.expand_school_abbreviation(field_10)
+                    if not result['현재분회'] and flags['school_10']:
+                        # 약칭 확장 및 교육청 찾기
+                        school, edu = self.normalize_school_name(field_10, hints)
                         result['현재분회'] = school
-                        # 교육청 찾기
-                        edu = self.find_education_office_for_school(school, hints)
                         if edu:
                             result['현재교육청'] = edu
                             
@@ -2088,8 +2346,8 @@ class KFTAParser:
 
         # 9번째 필드 → 과목 처리 (학교명 감지 및 이동)
         # 이 부분은 발령분회/현재분회가 모두 처리된 후에 실행됨
-        if len(row) > 8:
-            subject_field = str(row.iloc[8]).strip() if pd.notna(row.iloc[8]) else ''
+        if width > 8:
+            subject_field = fields[8]
 
             if subject_field:
                 # 먼저 "xxx병설유 교사" 같은 패턴인지 확인
@@ -2101,7 +2359,7 @@ class KFTAParser:
 
                     # 학교명 처리
                     if school_part:
-                        edu_office = self.find_education_office_for_school(school_part, hints)
+                        _, edu_office = self.normalize_school_name(school_part, hints, expand=False)
 
                         # 발령분회가 비어있으면 발령분회로 이동
                         if not result['발령분회']:
@@ -2122,12 +2380,9 @@ class KFTAParser:
                     result['과목'] = ''
 
                 # 학교명인지 확인
-                elif self.is_school_name(subject_field):
-                    # 학교명을 올바른 형식으로 확장
-                    school_name = self.expand_school_abbreviation(subject_field)
-
-                    # 교육지원청 찾기
-                    edu_office = self.find_education_office_for_school(school_name, hints)
+                elif flags['school_9']:
+                    # 학교명을 올바른 형식으로 확장하고 교육지원청 찾기
+                    school_name, edu_office = self.normalize_school_name(subject_field, hints)
 
                     # 발령분회가 비어있으면 발령분회로 이동
                     if not result['발령분회']:
@@ -2164,7 +2419,7 @@ class KFTAParser:
 
         # 2. 발령분회가 있으면 발령교육청 자동 채우기 (아직 비어있는 경우)
         if result['발령분회'] and not result['발령교육청']:
-            edu_office = self.find_education_office_for_school(result['발령분회'], hints)
+            _, edu_office = self.normalize_school_name(result['발령분회'], hints, expand=False)
 
             if not edu_office:
                 # 지역명 추출 시도 (학교명에서)
@@ -2188,7 +2443,7 @@ class KFTAParser:
 
         # 3. 현재분회가 있으면 현재교육청 자동 채우기 (아직 비어있는 경우)
         if result['현재분회'] and not result['현재교육청']:
-            edu_office = self.find_education_office_for_school(result['현재분회'], hints)
+            _, edu_office = self.normalize_school_name(result['현재분회'], hints, expand=False)
 
             if not edu_office:
                 # 지역명 추출 시도 (학교명에서)
@@ -2246,10 +2501,10 @@ class KFTAParser:
 
         # 5. 현재분회와 발령분회에서 지역명 제거
         if result['현재분회']:
-            result['현재분회'] = self.remove_region_prefix_from_school_name(result['현재분회'])
+            result['현재분회'] = self.strip_region_prefix(result['현재분회'])
 
         if result['발령분회']:
-            result['발령분회'] = self.remove_region_prefix_from_school_name(result['발령분회'])
+            result['발령분회'] = self.strip_region_prefix(result['발령분회'])
 
         # 6. 중복 학교명일 때는 힌트가 전혀 없는 경우에만 교육청 비움
         # 기존에는 무조건 비워서 빈 필드가 과도하게 증가했음.
@@ -2262,16 +2517,350 @@ class KFTAParser:
 
         return result
 
-    def parse_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+    def parse_dataframe(self, df: pd.DataFrame, engine: str = 'columnar',
+                        workers: Optional[int] = None) -> pd.DataFrame:
         """
         DataFrame 전체를 파싱하여 강원교총 표준 형식으로 변환
+
+        Args:
+            df: 원본 시트 데이터프레임
+            engine: 'columnar'(컬럼 단위 전처리, 기본값) 또는 'row'(iterrows 행 단위 처리).
+                    두 엔진의 결과는 같다.
+            workers: 병렬 파싱 프로세스 수 (None 또는 1이면 순차 처리).
+                     AI 모드이거나 행 수가 PARSE_SHARD_MIN_ROWS 미만이면 순차 처리한다.
         """
-        parsed_rows = []
+        if engine not in ('columnar', 'row'):
+            raise ValueError(f"지원하지 않는 파싱 엔진입니다: {engine} (columnar 또는 row)")
+
+        parsed_rows = None
+        if workers and workers > 1 and not self.use_ai and len(df) >= self.PARSE_SHARD_MIN_ROWS:
+            try:
+                parsed_rows, stats = self._parse_sharded(df, engine, workers)
+            except Exception as e:
+                print(f"  ⚠️  병렬 파싱 실패, 순차 처리로 전환: {e}")
+
+        if parsed_rows is None:
+            parsed_rows = self._parse_rows(df, engine)
+            stats = self.school_cache_stats()
 
-        for idx, row in df.iterrows():
+        if stats['hits'] or stats['misses']:
+            print(f"  🧠 학교명 정규화 캐시: 적중 {stats['hits']}회 / 미스 {stats['misses']}회")
+
+        self.flush()
+
+        return pd.DataFrame(parsed_rows)
+
+    def _parse_rows(self, df: pd.DataFrame, engine: str) -> List[Dict[str, str]]:
+        """지정한 엔진으로 유효한 데이터 행을 파싱 (저장/통계 출력 없음)"""
+        return [parsed_data for _, parsed_data in self._iter_parsed_rows(df, engine)]
+
+    def _iter_parsed_rows(self, df: pd.DataFrame, engine: str) -> Iterator[Tuple[int, Dict[str, str]]]:
+        """유효한 데이터 행을 (행 위치, 변환 결과) 순서대로 생성"""
+        if engine == 'columnar':
+            yield from self._iter_columnar(df)
+            return
+
+        for position, (idx, row) in enumerate(df.iterrows()):
             # 유효한 데이터 행만 처리
             if self.is_valid_data_row(row):
-                parsed_data = self.parse_row_to_kfta(row)
+                yield position, self.parse_row_to_kfta(row)
+
+    def _parse_sharded(self, df: pd.DataFrame, engine: str, workers: int) -> Tuple[List[Dict[str, str]], Dict[str, int]]:
+        """
+        유효한 행을 연속 구간(샤드)으로 나눠 프로세스 풀에서 파싱
+
+        작업자는 현재 학습 매핑 스냅샷으로 파서를 한 번만 만들고(DB 연결 없음), 행마다 결과와 함께
+        학습 매핑 캐시 조회/변경 내역, 새로 학습한 매핑, 매핑 실패를 돌려준다.
+
+        순차 파싱에서는 앞 행에서 학습한 매핑이 뒤 행의 교육청 조회에 쓰일 수 있으므로, 결과를 행 순서대로
+        합치면서 작업자가 본 캐시 값이 순차 처리 시점의 캐시 값과 같은지 확인한다. 다른 행만 이 파서에서
+        다시 파싱하므로 결과는 순차 파싱과 같고, 학습 매핑과 실패 로그는 flush()에서 한 번에 저장된다.
+
+        Returns:
+            (파싱된 행 목록, 작업자 캐시 적중/미스 합계)
+        """
+        values = df.values
+        columns = [self._clean_text_column(values[:, idx]) for idx in range(df.shape[1])]
+        rows = np.flatnonzero(self._valid_row_mask(columns, len(df)))
+        stats = {'hits': 0, 'misses': 0}
+        if len(rows) == 0:
+            return [], stats
+
+        shard_rows = np.array_split(rows, min(workers, len(rows)))
+        options = {
+            'use_web_search': self.use_web_search,
+            'school_cache_size': self.school_cache_size,
+        }
+        print(f"  ⚙️  병렬 파싱: 프로세스 {len(shard_rows)}개, 유효 행 {len(rows)}개")
+
+        with ProcessPoolExecutor(
+            max_workers=len(shard_rows),
+            initializer=_init_parse_worker,
+            initargs=(type(self), options, dict(self.school_edu_office_cache)),
+        ) as executor:
+            results = list(executor.map(
+                _parse_shard, [df.iloc[positions] for positions in shard_rows], [engine] * len(shard_rows)
+            ))
+
+        parsed_rows = []
+        reparsed = 0
+        for positions, (shard_records, shard_stats) in zip(shard_rows, results):
+            for position, parsed_data, journal, learned, failed in shard_records:
+                if self._journal_matches(journal):
+                    self._apply_shard_row(journal, learned, failed)
+                else:
+                    # 앞 샤드에서 학습한 매핑에 영향을 받는 행: 순차 처리와 같은 캐시 상태로 다시 파싱
+                    row = pd.Series(values[positions[position]], index=df.columns)
+                    parsed_data = self.parse_row_to_kfta(row)
+                    reparsed += 1
                 parsed_rows.append(parsed_data)
+            stats['hits'] += shard_stats['hits']
+            stats['misses'] += shard_stats['misses']
+
+        if reparsed:
+            print(f"  ⚙️  학습 매핑 순서 보정: {reparsed}행 다시 파싱")
+        return parsed_rows, stats
+
+    def _journal_matches(self, journal: List[tuple]) -> bool:
+        """작업자가 행을 파싱하며 조회한 학습 매핑 값이 현재 캐시 상태와 같은지 확인"""
+        cache = self.school_edu_office_cache
+        overlay = {}
+        for kind, school_name, value in journal:
+            if kind == 'set':
+                overlay[school_name] = value
+                continue
+            if school_name in overlay:
+                present, current = True, overlay[school_name]
+            else:
+                present, current = school_name in cache, cache.get(school_name)
+            if present != (kind == 'get') or (present and current != value):
+                return False
+        return True
 
-        return pd.DataFrame(parsed_rows)
+    def _apply_shard_row(self, journal: List[tuple], learned: Optional[Dict[str, str]],
+                         failed: Optional[List[dict]]):
+        """검증된 작업자 행의 캐시 변경, 학습 매핑, 매핑 실패를 이 파서에 반영"""
+        cache = self.school_edu_office_cache
+        for kind, school_name, value in journal:
+            if kind == 'set':
+                cache[school_name] = value
+        if learned:
+            self._pending_mappings.update(learned)
+            self._auto_flush_learned_mappings()
+        for entry in failed or ():
+            self._merge_failed_mapping(entry)
+
+    @staticmethod
+    def _clean_text_column(values: np.ndarray) -> np.ndarray:
+        """
+        컬럼 값을 str(value).strip() 결과 배열로 변환 (결측값은 '')
+
+        문자열 컬럼은 고유값만 정리한 뒤 코드로 펼친다. 숫자가 섞인 컬럼은 1과 1.0이 같은
+        고유값으로 묶여 문자열 표현이 달라지므로 셀마다 변환한다.
+        """
+        if pd.api.types.infer_dtype(values, skipna=True) in ('string', 'empty'):
+            codes, uniques = pd.factorize(values)
+            cleaned = np.array([value.strip() for value in uniques] + [''], dtype=object)
+            return cleaned[codes]  # 결측값 코드(-1)는 마지막 '' 항목
+        return np.array([str(value).strip() if pd.notna(value) else '' for value in values], dtype=object)
+
+    @staticmethod
+    def _map_unique(column: np.ndarray, func, dtype=bool) -> np.ndarray:
+        """정리된 문자열 컬럼의 고유값에만 func를 적용하고 행 단위 배열로 펼침"""
+        codes, uniques = pd.factorize(column)
+        return np.array([func(value) for value in uniques], dtype=dtype)[codes]
+
+    def _valid_row_mask(self, columns: List[np.ndarray], row_count: int, name_col_idx: int = 2) -> np.ndarray:
+        """is_valid_data_row()와 같은 판별을 컬럼 단위로 수행"""
+        if len(columns) <= name_col_idx:
+            return np.zeros(row_count, dtype=bool)
+
+        header_keywords = self.HEADER_KEYWORDS
+        names = pd.Series(columns[name_col_idx], dtype=object)
+        valid = (names != '').to_numpy() & ~names.isin(header_keywords).to_numpy()
+
+        # 행 전체에서 헤더 키워드가 3개 이상이면 헤더 행
+        header_count = np.zeros(row_count, dtype=np.int64)
+        for column in columns:
+            header_count += pd.Series(column, dtype=object).isin(header_keywords).to_numpy()
+        valid &= header_count < 3
+
+        # 비고 컬럼(인덱스 3)이 "비고" 또는 "비고(전소속)" 형식이면 헤더 행
+        if len(columns) > 3:
+            valid &= ~self._map_unique(
+                columns[3], lambda bigo: ('비고' in bigo and '전소속' in bigo) or bigo == '비고'
+            )
+
+        return valid
+
+    def _row_hints_columnar(self, columns: List[np.ndarray], rows: np.ndarray) -> List[dict]:
+        """extract_all_region_hints()와 같은 힌트를 셀 고유값 단위로 계산해 행별로 조합"""
+        hint_tables = []
+        for column in columns:
+            table = {}
+            for text in pd.unique(column):
+                found_regions, is_education_office = self._text_region_hints(text)
+                if found_regions or is_education_office:
+                    table[text] = (found_regions, text if is_education_office else None)
+            if table:
+                hint_tables.append((column, table))
+
+        row_hints = []
+        for row_idx in rows:
+            regions = []
+            education_offices = []
+            for column, table in hint_tables:
+                hit = table.get(column[row_idx])
+                if hit is not None:
+                    regions.extend(hit[0])
+                    if hit[1] is not None:
+                        education_offices.append(hit[1])
+            row_hints.append({
+                'regions': list(dict.fromkeys(regions)),
+                'education_offices': list(dict.fromkeys(education_offices)),
+            })
+        return row_hints
+
+    def _iter_columnar(self, df: pd.DataFrame) -> Iterator[Tuple[int, Dict[str, str]]]:
+        """
+        컬럼 단위 파싱 엔진 ((행 위치, 변환 결과) 생성)
+
+        위치별 컬럼을 한 번에 문자열 배열로 정리하고, 유효 행 판별과 학교명/지역명/중고등학교
+        판별은 컬럼의 고유값에만 수행한 뒤 행마다 조합한다. 행별 변환 규칙은 행 단위 엔진과
+        같은 _parse_kfta_fields()를 사용하므로 결과가 같다.
+        """
+        width = df.shape[1]
+        row_count = df.shape[0]
+        # iterrows()와 같은 값 변환(공통 dtype 승격)을 위해 df.values 사용
+        values = df.values
+        columns = [self._clean_text_column(values[:, idx]) for idx in range(width)]
+
+        rows = np.flatnonzero(self._valid_row_mask(columns, row_count))
+        if len(rows) == 0:
+            return
+
+        empty = np.full(row_count, '', dtype=object)
+        fields_by_idx = [columns[idx] if idx < width else empty for idx in range(self.PARSED_FIELD_COUNT)]
+
+        flag_columns = {
+            'school_6': self._map_unique(fields_by_idx[5], self.is_school_name),
+            'middle_high_6': self._map_unique(fields_by_idx[5], self.is_middle_high_text),
+            'region_only_8': self._map_unique(fields_by_idx[7], self.is_region_name_only),
+            'school_8': self._map_unique(fields_by_idx[7], self.is_school_name),
+            'middle_high_8': self._map_unique(fields_by_idx[7], self.is_middle_high_text),
+            'school_9': self._map_unique(fields_by_idx[8], self.is_school_name),
+            'school_10': self._map_unique(fields_by_idx[9], self.is_school_name),
+        }
+        row_hints = self._row_hints_columnar(columns, rows)
+
+        for row_idx, hints in zip(rows, row_hints):
+            fields = [column[row_idx] for column in fields_by_idx]
+            flags = {key: bool(flag_column[row_idx]) for key, flag_column in flag_columns.items()}
+            yield int(row_idx), self._parse_kfta_fields(fields, width, hints, flags)
+
+    def parse_row_chunks(self, chunks: Iterable[Sequence[tuple]]) -> Iterator[pd.DataFrame]:
+        """
+        행 튜플 묶음을 청크마다 컬럼 단위 엔진으로 파싱하여 강원교총 표준 형식 데이터프레임을 생성
+
+        Args:
+            chunks: 행 값 튜플 목록의 반복자 (예: iter_sheet_row_chunks 결과)
+        """
+        for chunk in chunks:
+            parsed_rows = self._parse_rows(pd.DataFrame(chunk, dtype=object), 'columnar')
+            # 청크 단위로 학습 결과 저장
+            self.flush()
+            if parsed_rows:
+                yield pd.DataFrame(parsed_rows)
+
+    def parse_excel_streaming(self, file_path: str, sheet_name: Optional[str] = None,
+                              chunk_size: int = 5000) -> pd.DataFrame:
+        """
+        대용량 시트를 스트리밍으로 파싱 (openpyxl 읽기 전용 모드)
+
+        원본 시트 전체를 메모리에 올리지 않고 chunk_size행씩 읽어 바로 파싱한 뒤
+        청크별 결과 데이터프레임만 이어 붙인다.
+        결과는 parse_dataframe(pd.read_excel(...))과 같은 형식이다.
+        """
+        chunks = iter_sheet_row_chunks(file_path, sheet_name=sheet_name, chunk_size=chunk_size)
+        frames = list(self.parse_row_chunks(chunks))
+
+        stats = self.school_cache_stats()
+        if stats['hits'] or stats['misses']:
+            print(f"  🧠 학교명 정규화 캐시: 적중 {stats['hits']}회 / 미스 {stats['misses']}회")
+
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+
+class _JournaledCache(dict):
+    """조회/변경 내역(journal)을 남기는 학습 매핑 캐시 (병렬 파싱 작업자 전용)"""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.journal: List[tuple] = []
+
+    def _record_read(self, key):
+        if dict.__contains__(self, key):
+            self.journal.append(('get', key, dict.__getitem__(self, key)))
+        else:
+            self.journal.append(('miss', key, None))
+
+    def get(self, key, default=None):
+        self._record_read(key)
+        return dict.get(self, key, default)
+
+    def __contains__(self, key):
+        self._record_read(key)
+        return dict.__contains__(self, key)
+
+    def __getitem__(self, key):
+        self._record_read(key)
+        return dict.__getitem__(self, key)
+
+    def __setitem__(self, key, value):
+        self.journal.append(('set', key, value))
+        dict.__setitem__(self, key, value)
+
+
+# 병렬 파싱 작업자 프로세스별 파서 (초기화 시 한 번만 생성)
+_WORKER_PARSER = None
+
+
+def _init_parse_worker(parser_class, options: dict, learned_mappings: Dict[str, str]):
+    """작업자 프로세스 초기화: 학습 매핑 스냅샷으로 파서와 학교명 인덱스를 한 번만 준비"""
+    global _WORKER_PARSER
+    # 작업자는 저장하지 않고 학습 결과를 부모 프로세스에 돌려줌 (자동 저장 비활성화)
+    _WORKER_PARSER = parser_class(
+        use_ai=False, flush_every=0, flush_interval=0, learned_mappings=learned_mappings, **options
+    )
+    _WORKER_PARSER.school_edu_office_cache = _JournaledCache(_WORKER_PARSER.school_edu_office_cache)
+    parser_class.school_index()
+
+
+def _parse_shard(shard: pd.DataFrame, engine: str):
+    """
+    샤드 하나를 파싱
+
+    Returns:
+        ([(샤드 내 행 위치, 변환 결과, 캐시 조회/변경 내역, 새 학습 매핑, 매핑 실패)], 캐시 통계 증가분)
+    """
+    parser = _WORKER_PARSER
+    cache = parser.school_edu_office_cache
+    before = parser.school_cache_stats()
+
+    records = []
+    cache.journal = []
+    for position, parsed_data in parser._iter_parsed_rows(shard, engine):
+        learned = parser._pending_mappings or None
+        failed = list(parser._failed_mappings.values()) or None
+        records.append((position, parsed_data, cache.journal, learned, failed))
+        cache.journal = []
+        if learned:
+            parser._pending_mappings = {}
+        if failed:
+            parser._failed_mappings = {}
+
+    after = parser.school_cache_stats()
+    stats = {key: after[key] - before[key] for key in ('hits', 'misses')}
+    return records, stats
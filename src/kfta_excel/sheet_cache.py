@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sheet Cache - 파싱된 시트를 디스크에 보관하는 콘텐츠 해시 기반 캐시
+같은 원본 파일로 여러 번 통합을 돌릴 때 XLSX 파싱 비용을 한 번만 지불
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  (Parquet 저장 엔진)
+    HAS_PARQUET = True
+except ImportError:
+    HAS_PARQUET = False
+
+
+DEFAULT_CACHE_DIR = os.path.join(Path.home(), '.cache', 'kfta_excel', 'sheets')
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512MB
+
+
+class SheetCache:
+    """
+    파일 내용 해시 + 시트명을 키로 파싱 결과를 저장하는 디스크 캐시
+
+    - 파일 하나당 매니페스트(JSON)에 시트 순서와 저장 파일을 기록
+    - 시트 데이터는 Parquet으로 저장 (pyarrow 미설치 또는 변환 불가 시 pickle)
+    - 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 파일부터 제거 (LRU)
+    """
+
+    MANIFEST_SUFFIX = '.manifest.json'
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir: 캐시 디렉터리 (없으면 KFTA_CACHE_DIR 환경변수 또는 ~/.cache/kfta_excel/sheets)
+            max_bytes: 캐시 최대 크기 (바이트)
+        """
+        self.cache_dir = cache_dir or os.getenv('KFTA_CACHE_DIR') or DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def file_digest(file_path: str) -> str:
+        """파일 내용의 SHA-256 해시"""
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _manifest_path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, digest + self.MANIFEST_SUFFIX)
+
+    def _sheet_stem(self, digest: str, sheet_name: Optional[str]) -> str:
+        key = f"{digest}\0{'' if sheet_name is None else sheet_name}"
+        return os.path.join(self.cache_dir, digest[:16] + '-' + hashlib.sha1(key.encode('utf-8')).hexdigest())
+
+    def load(self, digest: str) -> Optional[List[Tuple[Optional[str], pd.DataFrame]]]:
+        """
+        캐시된 시트 목록 조회
+
+        Returns:
+            [(시트명, 데이터프레임)] 목록. 캐시에 없거나 일부가 손상되었으면 None
+        """
+        manifest_path = self._manifest_path(digest)
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+
+            sheets = []
+            touched = [manifest_path]
+            for entry in manifest['sheets']:
+                data_path = os.path.join(self.cache_dir, entry['file'])
+                if entry['file'].endswith('.parquet'):
+                    df = pd.read_parquet(data_path)
+                else:
+                    df = pd.read_pickle(data_path)
+                sheets.append((entry['name'], df))
+                touched.append(data_path)
+        except (OSError, ValueError, KeyError):
+            return None
+        except Exception as e:
+            print(f"  ⚠️  캐시 읽기 실패 (원본에서 다시 읽음): {e}")
+            return None
+
+        # LRU 갱신: 사용 시각을 수정 시각으로 기록
+        for path in touched:
+            try:
+                os.utime(path, None)
+            except OSError:
+                pass
+        return sheets
+
+    def store(self, digest: str, sheets: List[Tuple[Optional[str], pd.DataFrame]]) -> None:
+        """시트 목록을 캐시에 저장하고 크기 상한을 넘으면 오래된 항목 제거"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            entries = []
+            for sheet_name, df in sheets:
+                stem = self._sheet_stem(digest, sheet_name)
+                entries.append({'name': sheet_name, 'file': os.path.basename(self._write_frame(stem, df))})
+
+            # 매니페스트는 시트 파일이 모두 기록된 뒤 원자적으로 교체
+            manifest_path = self._manifest_path(digest)
+            tmp_path = manifest_path + f'.{os.getpid()}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'sheets': entries}, f, ensure_ascii=False)
+            os.replace(tmp_path, manifest_path)
+        except Exception as e:
+            print(f"  ⚠️  캐시 저장 실패: {e}")
+            return
+
+        self.evict()
+
+    @staticmethod
+    def _write_frame(stem: str, df: pd.DataFrame) -> str:
+        """Parquet 저장을 시도하고, 혼합 타입 등으로 실패하면 pickle로 저장"""
+        if HAS_PARQUET:
+            path = stem + '.parquet'
+            try:
+                df.to_parquet(path, index=True)
+                return path
+            except Exception:
+                if os.path.exists(path):
+                    os.remove(path)
+
+        path = stem + '.pkl'
+        df.to_pickle(path)
+        return path
+
+    def evict(self) -> None:
+        """캐시 크기가 상한을 넘으면 가장 오래 사용하지 않은 파일 묶음부터 제거"""
+        if not os.path.isdir(self.cache_dir):
+            return
+
+        groups = {}
+        total = 0
+        for entry in os.scandir(self.cache_dir):
+            if not entry.is_file():
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            # 파일명 앞 16자리는 원본 파일 해시 접두사 (매니페스트와 시트 파일 공통)
+            group = groups.setdefault(entry.name[:16], {'size': 0, 'mtime': 0.0, 'paths': []})
+            group['size'] += stat.st_size
+            group['mtime'] = max(group['mtime'], stat.st_mtime)
+            group['paths'].append(entry.path)
+            total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        for group in sorted(groups.values(), key=lambda g: g['mtime']):
+            if total <= self.max_bytes:
+                break
+            for path in group['paths']:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= group['size']
+
+    def clear(self) -> None:
+        """캐시 디렉터리 전체 삭제"""
+        if os.path.isdir(self.cache_dir):
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
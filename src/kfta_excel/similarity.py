@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Similarity - 문자열 유사도 계산과 비교 후보 차단(blocking)
+컬럼명/값 그룹화에서 모든 쌍을 비교하지 않도록 임계값에 도달할 수 있는 쌍만 골라냄
+"""
+
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    from rapidfuzz.distance import Indel
+    from rapidfuzz.process import cdist
+except ImportError:
+    # rapidfuzz가 없으면 비트 병렬 LCS(파이썬 정수 / NumPy)로 계산
+    Indel = None
+    cdist = None
+
+# NumPy 커널이 한 번에 처리하는 기준 문자열 최대 길이 (uint64 비트 수)
+WORD_BITS = 64
+
+# 유사도 비교 단위: 음절('춘천') 또는 자모('ㅊㅜㄴㅊㅓㄴ')
+SIMILARITY_MODES = ("syllable", "jamo")
+
+# 한글 음절(가-힣) → 조합형 자모 (초성 U+1100, 중성 U+1161, 종성 U+11A8)
+# 초성 ㄱ과 종성 ㄱ은 다른 문자로 두어 위치가 다른 자모끼리 맞춰지지 않게 한다
+_JAMO_TABLE = {
+    0xAC00 + code: chr(0x1100 + code // 588) + chr(0x1161 + code % 588 // 28)
+    + (chr(0x11A7 + code % 28) if code % 28 else "")
+    for code in range(11172)
+}
+
+
+def _lcs_length(left: str, right: str) -> int:
+    """최장 공통 부분 수열 길이 (비트 병렬, Allison-Dix)"""
+    if Indel is not None:
+        return (len(left) + len(right) - Indel.distance(left, right)) // 2
+
+    masks: Dict[str, int] = {}
+    for pos, char in enumerate(left):
+        masks[char] = masks.get(char, 0) | (1 << pos)
+    full = (1 << len(left)) - 1
+    row = full
+    for char in right:
+        match = row & masks.get(char, 0)
+        row = ((row + match) | (row - match)) & full
+    return len(left) - bin(row).count("1")
+
+
+def similarity_ratio(left: str, right: str) -> int:
+    """
+    두 문자열의 유사도 (0-100)
+
+    fuzz.ratio(python-Levenshtein 0.21 이상 사용 시)와 같은 값:
+    round(100 × (1 - Indel 거리 / 두 문자열 길이 합)), Indel 거리 = 길이 합 - 2 × LCS
+    """
+    left, right = str(left), str(right)
+    if left == right:
+        return 100
+    if not left or not right:
+        return 0
+    lensum = len(left) + len(right)
+    distance = lensum - 2 * _lcs_length(left, right)
+    # 부동소수점 계산 순서까지 Levenshtein.ratio와 같게 (반올림 경계값이 달라지지 않도록)
+    return int(round(100 * (1.0 - distance / lensum)))
+
+
+@lru_cache(maxsize=65536)
+def decompose_jamo(text: str) -> str:
+    """한글 음절을 초성/중성/종성 자모로 분해 (한글 음절이 아닌 문자는 그대로)"""
+    return text.translate(_JAMO_TABLE)
+
+
+def initial_jamo(text: str) -> str:
+    """첫 글자의 초성 (한글 음절이 아니면 첫 글자 그대로, 빈 문자열이면 '')"""
+    if not text:
+        return ""
+    code = ord(text[0]) - 0xAC00
+    if 0 <= code < 11172:
+        return chr(0x1100 + code // 588)
+    return text[0]
+
+
+def similarity_texts(texts: Sequence[str], mode: str = "syllable") -> List[str]:
+    """
+    유사도 비교에 쓸 문자열
+
+    Args:
+        texts: 원본 문자열
+        mode: 'syllable'(그대로) 또는 'jamo'(자모 분해, 같은 문자열은 한 번만 분해)
+
+    Returns:
+        texts와 같은 순서의 비교용 문자열
+    """
+    if mode == "syllable":
+        return [str(text) for text in texts]
+    if mode == "jamo":
+        return [decompose_jamo(str(text)) for text in texts]
+    raise ValueError(f"지원하지 않는 유사도 모드입니다: {mode} (syllable 또는 jamo)")
+
+
+class SimilarityScorer:
+    """
+    similarity_ratio 일괄 계산기
+
+    후보 문자열을 한 번 정수 코드 배열로 바꿔 두고, 기준 문자열 하나와 여러 후보의 점수를
+    NumPy 배열 연산으로 한꺼번에 계산한다 (쌍마다 파이썬 함수를 호출하지 않음).
+    rapidfuzz가 설치되어 있으면 그 C 구현으로 거리를 계산한다. 점수는 similarity_ratio와 같다.
+    """
+
+    def __init__(self, texts: Sequence[str]):
+        self.texts = [str(text) for text in texts]
+        self.lengths = np.array([len(text) for text in self.texts], dtype=np.int64)
+
+        # 문자 → 코드 (0은 패딩)
+        self._char_codes: Dict[str, int] = {}
+        width = int(self.lengths.max()) if len(self.texts) else 0
+        self._codes = np.zeros((len(self.texts), width), dtype=np.int32)
+        for idx, text in enumerate(self.texts):
+            self._codes[idx, :len(text)] = [
+                self._char_codes.setdefault(char, len(self._char_codes) + 1) for char in text
+            ]
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def scores(self, query: str, indices: Optional[Sequence[int]] = None,
+               score_cutoff: float = 0) -> np.ndarray:
+        """
+        query와 후보들의 유사도
+
+        Args:
+            query: 기준 문자열
+            indices: 비교할 후보 번호 (None이면 전체)
+            score_cutoff: 이 값보다 낮은 점수는 0으로 반환 (길이만으로 도달할 수 없는 후보는 계산 생략)
+
+        Returns:
+            후보 순서대로 점수를 담은 int32 배열
+        """
+        query = str(query)
+        indices = np.arange(len(self.texts)) if indices is None else np.asarray(indices, dtype=np.int64)
+        result = np.zeros(len(indices), dtype=np.int32)
+        if len(indices) == 0:
+            return result
+
+        length = len(query)
+        other_lengths = self.lengths[indices]
+        lensum = length + other_lengths
+        # 공통 부분 수열은 짧은 쪽 길이를 넘지 못함 (반올림 여유 0.5 포함)
+        reachable = 200 * np.minimum(length, other_lengths) >= (score_cutoff - 0.5) * lensum
+        reachable &= other_lengths > 0
+        if length == 0 or not reachable.any():
+            result[(other_lengths == 0) & (length == 0)] = 100
+            return result
+
+        positions = np.flatnonzero(reachable)
+        lcs = self._lcs_lengths(query, indices[positions])
+        result[positions] = _scores_from_distances(lensum[positions] - 2 * lcs, lensum[positions], score_cutoff)
+        return result
+
+    def matrix(self, queries: Sequence[str], indices: Optional[Sequence[int]] = None,
+               score_cutoff: float = 0) -> np.ndarray:
+        """queries × 후보 유사도 행렬 (int32)"""
+        if cdist is not None and len(queries):
+            # rapidfuzz: 전체 거리 행렬을 한 번에 계산
+            indices = np.arange(len(self.texts)) if indices is None else np.asarray(indices, dtype=np.int64)
+            choices = [self.texts[idx] for idx in indices]
+            queries = [str(query) for query in queries]
+            distances = cdist(queries, choices, scorer=Indel.distance, dtype=np.int64)
+            lensum = np.array([len(query) for query in queries], dtype=np.int64)[:, None] + self.lengths[indices]
+            return _scores_from_distances(distances, lensum, score_cutoff)
+
+        width = len(self.texts) if indices is None else len(indices)
+        result = np.zeros((len(queries), width), dtype=np.int32)
+        for row, query in enumerate(queries):
+            result[row] = self.scores(query, indices, score_cutoff)
+        return result
+
+    def _lcs_lengths(self, query: str, indices: np.ndarray) -> np.ndarray:
+        if cdist is not None:
+            choices = [self.texts[idx] for idx in indices]
+            distances = cdist([query], choices, scorer=Indel.distance, dtype=np.int64)[0]
+            return (len(query) + self.lengths[indices] - distances) // 2
+        if len(query) > WORD_BITS:
+            return np.array([_lcs_length(query, self.texts[idx]) for idx in indices], dtype=np.int64)
+
+        # query의 문자 위치 비트마스크를 후보 문자 코드로 조회 (query에 없는 문자는 0)
+        mask_table = np.zeros(len(self._char_codes) + 1, dtype=np.uint64)
+        for pos, char in enumerate(query):
+            code = self._char_codes.get(char)
+            if code is not None:
+                mask_table[code] |= np.uint64(1 << pos)
+
+        full = np.uint64((1 << len(query)) - 1)
+        rows = np.full(len(indices), full, dtype=np.uint64)
+        codes = self._codes[indices, :int(self.lengths[indices].max())]
+        for column in codes.T:
+            # 패딩(0)은 마스크가 0이라 rows가 바뀌지 않음
+            match = rows & mask_table[column]
+            rows = ((rows + match) | (rows - match)) & full
+        return len(query) - _popcount(rows)
+
+
+def _scores_from_distances(distances: np.ndarray, lensum: np.ndarray, score_cutoff: float) -> np.ndarray:
+    """Indel 거리 → similarity_ratio 점수 (부동소수점 계산 순서도 similarity_ratio와 같음)"""
+    safe_lensum = np.where(lensum == 0, 1, lensum)
+    scores = np.rint(100 * (1.0 - distances / safe_lensum)).astype(np.int32)
+    # 두 문자열이 모두 비어 있으면 같은 문자열이므로 100
+    scores[lensum == 0] = 100
+    scores[scores < score_cutoff] = 0
+    return scores
+
+
+def _popcount(values: np.ndarray) -> np.ndarray:
+    """uint64 배열 원소별 1 비트 개수"""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values).astype(np.int64)
+    bits = np.unpackbits(values.view(np.uint8).reshape(-1, 8), axis=1)
+    return bits.sum(axis=1).astype(np.int64)
+
+
+def similarity_scores(query: str, choices: Sequence[str], score_cutoff: float = 0) -> np.ndarray:
+    """query 하나와 choices 각각의 similarity_ratio (int32 배열)"""
+    return SimilarityScorer(choices).scores(query, score_cutoff=score_cutoff)
+
+
+def similarity_matrix(queries: Sequence[str], choices: Optional[Sequence[str]] = None,
+                      score_cutoff: float = 0) -> np.ndarray:
+    """queries × choices similarity_ratio 행렬 (choices가 없으면 queries끼리)"""
+    return SimilarityScorer(queries if choices is None else choices).matrix(queries, score_cutoff=score_cutoff)
+
+
+class CharCountIndex:
+    """
+    문자 역색인 기반 후보 차단기
+
+    similarity_ratio는 100 × 2 × (최장 공통 부분 수열 길이) / (두 문자열 길이 합)이고,
+    공통 부분 수열 길이는 두 문자열의 공통 문자 개수(중복 포함)를 넘을 수 없다.
+    이 상한으로 임계값에 도달할 수 없는 쌍을 유사도 계산 없이 걸러내므로 결과는 전수 비교와 같다.
+
+    문자별 역색인(문자열 번호, 문자 개수)을 NumPy 배열로 두고 기준 문자열의 문자마다
+    공통 문자 수를 배열 연산으로 누적한다. 자모 모드처럼 문자 종류가 적어 대부분의 문자열이
+    같은 문자를 공유하는 경우에도 후보 하나하나를 파이썬으로 검사하지 않는다.
+    """
+
+    def __init__(self, texts: Sequence[str]):
+        self.texts = [str(text) for text in texts]
+        self._lengths = np.array([len(text) for text in self.texts], dtype=np.int64)
+        self._counts = [Counter(text) for text in self.texts]
+
+        # 문자 → (문자열 번호 오름차순 배열, 해당 문자 개수 배열)
+        posting_ids: Dict[str, List[int]] = defaultdict(list)
+        posting_counts: Dict[str, List[int]] = defaultdict(list)
+        for idx, counts in enumerate(self._counts):
+            for char, count in counts.items():
+                posting_ids[char].append(idx)
+                posting_counts[char].append(count)
+        self._postings = {
+            char: (np.array(ids, dtype=np.int64), np.array(posting_counts[char], dtype=np.int64))
+            for char, ids in posting_ids.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def candidates(self, idx: int, threshold: float, start: int = 0) -> List[int]:
+        """
+        idx번째 문자열과 유사도가 threshold 이상일 수 있는 문자열 번호 (start 이상, 오름차순)
+
+        fuzz.ratio의 반올림까지 고려해 상한이 threshold - 0.5 이상인 쌍을 모두 남긴다.
+        """
+        if threshold <= 0.5:
+            # 공통 문자가 없어도 통과할 수 있는 임계값: 차단하지 않음
+            return [other for other in range(start, len(self.texts)) if other != idx]
+
+        limit = threshold - 0.5
+        if start >= len(self.texts):
+            return []
+
+        shared = np.zeros(len(self.texts) - start, dtype=np.int64)
+        for char, count in self._counts[idx].items():
+            ids, counts = self._postings[char]
+            begin = ids.searchsorted(start)
+            shared[ids[begin:] - start] += np.minimum(counts[begin:], count)
+
+        reachable = (shared > 0) & (200 * shared >= limit * (self._lengths[idx] + self._lengths[start:]))
+        if idx >= start:
+            reachable[idx - start] = False
+        return (np.flatnonzero(reachable) + start).tolist()
+
+
+def greedy_groups(texts: Sequence[str], threshold: float) -> List[List[int]]:
+    """
+    앞에서부터 기준 문자열을 정하고, 기준과 유사도가 threshold 이상인 뒤쪽 문자열을 묶음
+
+    기존 전수 비교 그룹화와 같은 결과를 내되 CharCountIndex로 비교 후보만 골라
+    SimilarityScorer로 한꺼번에 점수를 계산한다.
+
+    Returns:
+        문자열 번호 그룹 목록 (그룹 순서와 그룹 내 순서는 입력 순서)
+    """
+    index = CharCountIndex(texts)
+    scorer = SimilarityScorer(index.texts)
+    assigned = [False] * len(index)
+    groups = []
+    for idx in range(len(index)):
+        if assigned[idx]:
+            continue
+        assigned[idx] = True
+        group = [idx]
+        others = [other for other in index.candidates(idx, threshold, start=idx + 1) if not assigned[other]]
+        scores = scorer.scores(index.texts[idx], others, score_cutoff=threshold)
+        for other, score in zip(others, scores):
+            if score >= threshold:
+                assigned[other] = True
+                group.append(other)
+        groups.append(group)
+    return groups
+
+
+def cluster_groups(texts: Sequence[str], threshold: float) -> List[List[int]]:
+    """
+    유사도가 threshold 이상인 쌍을 간선으로 보고 연결 요소(union-find)로 묶음
+
+    입력 순서와 무관하게 같은 그룹이 나온다. 후보는 CharCountIndex로 좁히고,
+    이미 같은 그룹에 속한 쌍은 점수를 계산하지 않는다.
+
+    Returns:
+        문자열 번호 그룹 목록 (그룹은 첫 원소의 입력 순서, 그룹 내는 입력 순서)
+    """
+    return cluster_records([texts], threshold)
+
+
+def cluster_records(columns: Sequence[Sequence[str]], threshold: float) -> List[List[int]]:
+    """
+    여러 컬럼으로 이루어진 레코드를 union-find로 묶음
+
+    모든 컬럼의 유사도가 threshold 이상인 레코드 쌍을 간선으로 본다. 후보는 첫 번째 컬럼의
+    CharCountIndex로 좁히고(모든 컬럼을 통과해야 하므로 손실 없음), 나머지 컬럼은 앞 컬럼을
+    통과한 후보만 계산한다.
+
+    Args:
+        columns: 컬럼별 값 목록 (모두 같은 길이)
+        threshold: 유사도 임계값
+
+    Returns:
+        레코드 번호 그룹 목록 (그룹은 첫 원소의 입력 순서, 그룹 내는 입력 순서)
+    """
+    index = CharCountIndex(columns[0])
+    scorers = [SimilarityScorer(column) for column in columns]
+    parent = list(range(len(index)))
+
+    def find(node: int) -> int:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for idx in range(len(index)):
+        root = find(idx)
+        others = np.array(
+            [other for other in index.candidates(idx, threshold, start=idx + 1) if find(other) != root],
+            dtype=np.int64,
+        )
+        for scorer in scorers:
+            if not len(others):
+                break
+            scores = scorer.scores(scorer.texts[idx], others, score_cutoff=threshold)
+            others = others[scores >= threshold]
+        for other in others.tolist():
+            root, other_root = find(idx), find(other)
+            parent[max(root, other_root)] = min(root, other_root)
+
+    groups: Dict[int, List[int]] = {}
+    for idx in range(len(index)):
+        groups.setdefault(find(idx), []).append(idx)
+    return list(groups.values())
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Text Index - 키워드 다중 검색용 자료구조
+학교명/컬럼명 분류에서 키워드 목록을 매번 순회하지 않도록 한 번만 컴파일해 재사용
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick 다중 패턴 검색기
+
+    키워드 목록의 순서가 곧 우선순위(rank)이며, 텍스트 길이에 비례하는 시간에
+    텍스트에 포함된 모든 키워드의 rank를 찾는다.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        for keyword in keywords:
+            self._insert(keyword, len(self.keywords))
+            self.keywords.append(keyword)
+        self._build_failure_links()
+
+    def _insert(self, keyword: str, rank: int) -> None:
+        if not keyword:
+            return
+        node = 0
+        for char in keyword:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+        self._output[node].append(rank)
+
+    def _build_failure_links(self) -> None:
+        # 실패 링크를 미리 펼쳐 상태 전이표(DFA)로 만든다: 검색 시 문자당 dict 조회 1회
+        self._delta: List[Dict[str, int]] = [dict(self._goto[0])]
+        self._delta.extend({} for _ in range(len(self._goto) - 1))
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+            transitions = dict(self._delta[self._fail[node]]) if node else self._delta[0]
+            transitions.update(self._goto[node])
+            self._delta[node] = transitions
+
+        self._best = [min(ranks) if ranks else None for ranks in self._output]
+
+    def find_ranks(self, text: str) -> List[int]:
+        """텍스트에 포함된 키워드의 rank 목록 (오름차순, 중복 없음)"""
+        delta, output = self._delta, self._output
+        found = set()
+        node = 0
+        for char in text:
+            node = delta[node].get(char, 0)
+            if output[node]:
+                found.update(output[node])
+        return sorted(found)
+
+    def first_rank(self, text: str) -> Optional[int]:
+        """텍스트에 포함된 키워드 중 가장 작은 rank (없으면 None)"""
+        delta, best_of = self._delta, self._best
+        best = None
+        node = 0
+        for char in text:
+            node = delta[node].get(char, 0)
+            rank = best_of[node]
+            if rank is not None and (best is None or rank < best):
+                best = rank
+        return best
+
+    def first_match(self, text: str) -> Optional[str]:
+        """텍스트에 포함된 키워드 중 우선순위가 가장 높은 키워드"""
+        best = self.first_rank(text)
+        return self.keywords[best] if best is not None else None
+
+
+class PrefixTrie:
+    """텍스트 앞부분과 일치하는 가장 긴 키워드를 찾는 트라이"""
+
+    _END = object()
+
+    def __init__(self, keywords: Iterable[str]):
+        self._root: Dict = {}
+        for keyword in keywords:
+            node = self._root
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[self._END] = keyword
+
+    def longest_prefix(self, text: str) -> Optional[str]:
+        """text가 시작하는 키워드 중 가장 긴 것 (없으면 None)"""
+        node = self._root
+        match = None
+        for char in text:
+            node = node.get(char)
+            if node is None:
+                break
+            match = node.get(self._END, match)
+        return match
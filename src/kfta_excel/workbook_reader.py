@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Workbook Reader - 엑셀/CSV 파일을 한 번만 열어 모든 시트를 읽는 공용 리더
+CLI 로더(ExcelUnifier)와 Streamlit 업로드 미리보기가 함께 사용
+"""
+
+from typing import Iterator, List, Optional, Tuple
+
+import pandas as pd
+from pandas.api.types import is_object_dtype, is_string_dtype
+
+# CSV 청크 크기와 범주형(사전 인코딩) 변환 기준
+CSV_CHUNK_SIZE = 50000
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+# pd.read_excel이 결측값으로 읽는 문자열 (pandas 기본 na_values와 같은 목록) + 엑셀 오류 값
+# openpyxl로 직접 읽는 행도 pd.read_excel과 같은 값이 되도록 None으로 바꾼다
+EXCEL_NA_STRINGS = frozenset({
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+    '#NULL!', '#DIV/0!', '#VALUE!', '#REF!', '#NAME?', '#NUM!',
+})
+
+
+def is_csv_path(file_path: str) -> bool:
+    """CSV 파일 경로인지 확인"""
+    return str(file_path).lower().endswith('.csv')
+
+
+def is_xlsx_path(file_path: str) -> bool:
+    """openpyxl로 읽을 수 있는 XLSX 계열 파일 경로인지 확인 (스트리밍 파싱 대상)"""
+    return str(file_path).lower().endswith(('.xlsx', '.xlsm'))
+
+
+def iter_workbook_sheets(file_path: str) -> Iterator[Tuple[Optional[str], pd.DataFrame]]:
+    """
+    파일의 모든 시트를 (시트명, 데이터프레임) 순서대로 생성
+
+    XLSX 압축 파일은 pd.ExcelFile로 한 번만 열고, 같은 핸들에서 시트를 차례로 파싱한다.
+    (시트마다 pd.read_excel(path, sheet_name=...)을 호출하면 매번 전체 파일을 다시 연다)
+
+    Args:
+        file_path: .xlsx/.xls/.csv 파일 경로
+
+    Yields:
+        (시트명, 데이터프레임) 튜플. CSV는 시트명이 None인 항목 하나만 생성
+    """
+    if is_csv_path(file_path):
+        yield None, read_csv_chunked(file_path)
+        return
+
+    with pd.ExcelFile(file_path) as excel_file:
+        for sheet_name in excel_file.sheet_names:
+            yield sheet_name, excel_file.parse(sheet_name)
+
+
+def _is_low_cardinality(series: pd.Series, max_unique_ratio: float) -> bool:
+    """문자열 컬럼 중 고유값 비율이 낮은 컬럼인지 확인 (예: 현재교육청, 직위, 시군구분)"""
+    if not (is_object_dtype(series.dtype) or is_string_dtype(series.dtype)):
+        return False
+    non_null = series.count()
+    if non_null < 2:
+        return False
+    return series.nunique(dropna=True) <= non_null * max_unique_ratio
+
+
+def read_csv_chunked(
+    file_path: str,
+    chunksize: int = CSV_CHUNK_SIZE,
+    max_unique_ratio: float = CATEGORY_MAX_UNIQUE_RATIO,
+) -> pd.DataFrame:
+    """
+    CSV를 청크 단위로 읽으면서 저카디널리티 문자열 컬럼을 범주형으로 인코딩
+
+    교육청/직위/시군구분처럼 고유값이 수십 개뿐인 컬럼은 셀마다 파이썬 문자열을 두지 않고
+    사전(카테고리) + 정수 코드로 저장해 메모리를 줄인다. 인코딩 대상 컬럼은 첫 청크로 결정한다.
+
+    Args:
+        file_path: CSV 파일 경로
+        chunksize: 한 번에 읽을 행 수
+        max_unique_ratio: 고유값 수 / 값 개수가 이 비율 이하인 문자열 컬럼을 범주형으로 변환
+    """
+    chunks = []
+    category_columns = None
+
+    for chunk in pd.read_csv(file_path, chunksize=chunksize):
+        if category_columns is None:
+            category_columns = [
+                col for col in chunk.columns if _is_low_cardinality(chunk[col], max_unique_ratio)
+            ]
+        for col in category_columns:
+            chunk[col] = chunk[col].astype('category')
+        chunks.append(chunk)
+
+    # 헤더만 있는 CSV
+    if not chunks:
+        return pd.read_csv(file_path)
+
+    # 청크마다 다른 카테고리를 합집합으로 맞춰야 concat 후에도 범주형이 유지됨
+    for col in category_columns:
+        categories = _union_categories([chunk[col] for chunk in chunks])
+        for chunk in chunks:
+            if categories is None:
+                chunk[col] = chunk[col].astype(object)
+            else:
+                chunk[col] = chunk[col].cat.set_categories(categories)
+
+    return pd.concat(chunks, ignore_index=True)
+
+
+def _union_categories(columns: List[pd.Series]) -> Optional[pd.Index]:
+    """
+    청크별 범주형 컬럼의 카테고리 합집합
+
+    값이 모두 비어 있는 청크(카테고리 없음)는 카테고리 dtype이 달라도 건너뛴다.
+    뒤쪽 청크에 숫자만 있는 등 카테고리 dtype이 섞이면 None을 돌려 object 컬럼으로 되돌리게 한다
+    (pd.read_csv 한 번으로 읽을 때와 같은 값 유지).
+    """
+    categories = [column.cat.categories for column in columns if len(column.cat.categories)]
+    if not categories:
+        return None
+    if any(index.dtype != categories[0].dtype for index in categories[1:]):
+        return None
+    return categories[0].append(categories[1:]).unique()
+
+
+def read_workbook_sheets(file_path: str, cache=None) -> List[Tuple[Optional[str], pd.DataFrame]]:
+    """
+    파일의 모든 시트를 목록으로 읽음
+
+    병렬 로딩 시 프로세스 풀 작업 단위로 쓰이므로 모듈 최상위 함수로 둔다.
+
+    Args:
+        file_path: .xlsx/.xls/.csv 파일 경로
+        cache: SheetCache 인스턴스 (있으면 엑셀 파일 내용이 같을 때 파싱 결과 재사용)
+    """
+    if cache is None or is_csv_path(file_path):
+        return list(iter_workbook_sheets(file_path))
+
+    digest = cache.file_digest(file_path)
+    sheets = cache.load(digest)
+    if sheets is None:
+        sheets = list(iter_workbook_sheets(file_path))
+        cache.store(digest, sheets)
+    return sheets
+
+
+def iter_sheet_row_chunks(
+    file_path: str,
+    sheet_name: Optional[str] = None,
+    chunk_size: int = 5000,
+    skip_header: bool = True,
+) -> Iterator[List[tuple]]:
+    """
+    openpyxl 읽기 전용 모드로 시트의 행 튜플을 chunk_size개씩 생성
+
+    전체 시트를 데이터프레임으로 만들지 않으므로 수십만 행 시트도 메모리 사용량이 일정하다.
+
+    Args:
+        file_path: .xlsx 파일 경로
+        sheet_name: 시트명 (없으면 첫 번째 시트)
+        chunk_size: 한 번에 생성할 최대 행 수
+        skip_header: 첫 행(헤더)을 건너뛸지 여부 (pd.read_excel 기본 동작과 동일)
+
+    Yields:
+        행 값 튜플 목록 (빈 셀, 공백뿐인 셀, EXCEL_NA_STRINGS 값은 None)
+    """
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet_name] if sheet_name is not None else workbook.worksheets[0]
+        rows = worksheet.iter_rows(values_only=True)
+        if skip_header:
+            next(rows, None)
+
+        chunk = []
+        for row in rows:
+            chunk.append(tuple(_blank_to_none(value) for value in row))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    finally:
+        workbook.close()
+
+
+def _blank_to_none(value):
+    """결측값 문자열과 공백뿐인 문자열을 None으로 변환 (나머지 값은 그대로)"""
+    if isinstance(value, str) and (value in EXCEL_NA_STRINGS or not value.strip()):
+        return None
+    return value
+
+
+def sheet_outlines(file_path: str) -> List[Tuple[str, Optional[int], tuple]]:
+    """
+    XLSX 파일의 시트별 (시트명, 데이터 행 수, 헤더 행)을 셀 데이터를 읽지 않고 확인
+
+    행 수는 시트에 기록된 범위(dimension) 기준이며, 범위가 없는 시트는 None이다.
+    스트리밍 파싱 대상 시트를 고를 때 사용한다.
+
+    Args:
+        file_path: .xlsx 파일 경로
+    """
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        outlines = []
+        for worksheet in workbook.worksheets:
+            header = next(worksheet.iter_rows(max_row=1, values_only=True), ())
+            max_row = worksheet.max_row
+            outlines.append((worksheet.title, None if max_row is None else max(max_row - 1, 0), header))
+        return outlines
+    finally:
+        workbook.close()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Workbook Writer - 통합 결과를 제목줄/헤더 스타일이 적용된 엑셀 파일로 저장하는 공용 라이터
+openpyxl 쓰기 전용(write-only) 모드로 행을 바로 파일 스트림에 기록
+다른 시스템에 적재할 결과는 Parquet/Feather/CSV로도 저장
+"""
+
+from pathlib import Path
+from typing import BinaryIO, List, Optional, Union
+import re
+
+import pandas as pd
+
+# 제목줄 문구와 병합 범위 (12개 컬럼 기준)
+TITLE_TEXT = "2025. 3. 1.자 유․특수․초등․중등 교(원)감, 교사 인사발령 현황"
+TITLE_RANGE = 'A1:L1'
+
+# 저장 방식: 'streaming'(쓰기 전용 모드 + 공용 스타일) 또는 'cell'(셀 단위 기록, 기존 방식)
+WRITE_ENGINES = ('streaming', 'cell')
+
+# 출력 형식: 사람이 보는 스타일 XLSX + 적재용 컬럼 형식
+OUTPUT_FORMATS = ('xlsx', 'parquet', 'feather', 'csv')
+OUTPUT_EXTENSIONS = {'xlsx': '.xlsx', 'parquet': '.parquet', 'feather': '.feather', 'csv': '.csv'}
+OUTPUT_MIME_TYPES = {
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'parquet': 'application/vnd.apache.parquet',
+    'feather': 'application/vnd.apache.arrow.file',
+    'csv': 'text/csv',
+}
+# 확장자 → 형식 (목록에 없는 확장자는 xlsx)
+_FORMAT_BY_EXTENSION = {
+    '.xlsx': 'xlsx', '.xlsm': 'xlsx',
+    '.parquet': 'parquet', '.pq': 'parquet',
+    '.feather': 'feather', '.arrow': 'feather',
+    '.csv': 'csv',
+}
+
+# 컬럼 너비 = 최대 표시 폭 + 여백, 최대 50 (한글/한자 등 전각 문자는 폭 2)
+COLUMN_WIDTH_PADDING = 2
+MAX_COLUMN_WIDTH = 50
+
+# East Asian Width가 W(전각)/F(전폭)인 주요 블록 (Unicode EastAsianWidth.txt 기준, 블록 단위로 묶음)
+_WIDE_CHAR_RANGES = (
+    (0x1100, 0x115F),    # 한글 자모 (초성)
+    (0x2E80, 0x303E),    # CJK 부수, 한자 구조 기호, CJK 기호와 구두점
+    (0x3041, 0x33FF),    # 히라가나, 가타카나, 주음부호, 한글 호환 자모, 괄호/원 문자, CJK 호환
+    (0x3400, 0x4DBF),    # CJK 통합 한자 확장 A
+    (0x4E00, 0x9FFF),    # CJK 통합 한자
+    (0xA000, 0xA4CF),    # 이 문자
+    (0xA960, 0xA97F),    # 한글 자모 확장 A
+    (0xAC00, 0xD7A3),    # 한글 음절
+    (0xF900, 0xFAFF),    # CJK 호환 한자
+    (0xFE10, 0xFE19),    # 세로쓰기 형태
+    (0xFE30, 0xFE6F),    # CJK 호환 형태, 작은 형태
+    (0xFF00, 0xFF60),    # 전각 ASCII
+    (0xFFE0, 0xFFE6),    # 전각 기호 (￠￡￥ 등)
+    (0x1B000, 0x1B2FF),  # 가나 보충
+    (0x1F300, 0x1F64F),  # 그림 문자, 이모티콘
+    (0x1F900, 0x1F9FF),  # 보충 그림 문자
+    (0x20000, 0x2FFFD),  # CJK 통합 한자 확장 B~F, 호환 한자 보충
+    (0x30000, 0x3FFFD),  # CJK 통합 한자 확장 G~
+)
+_WIDE_CHAR_PATTERN = re.compile(
+    '[' + ''.join(f"{re.escape(chr(start))}-{re.escape(chr(end))}" for start, end in _WIDE_CHAR_RANGES) + ']'
+)
+
+
+def display_widths(values: pd.Series) -> pd.Series:
+    """
+    문자열 표시 폭 (전각 문자 2, 나머지 1, 결측값 0)
+
+    글자 수에 전각 문자 수를 더하는 벡터 연산 두 번으로 계산한다.
+    """
+    texts = values.astype(str)
+    widths = texts.str.len() + texts.str.count(_WIDE_CHAR_PATTERN)
+    return widths.where(values.notna(), 0)
+
+
+def column_widths(df: pd.DataFrame, sample_rows: Optional[int] = None) -> List[int]:
+    """
+    컬럼별 너비를 데이터프레임에서 바로 계산 (헤더/데이터 중 표시 폭이 가장 긴 값 기준)
+
+    쓰기 전용 시트는 컬럼 너비를 행보다 먼저 기록해야 하므로 저장 전에 계산한다.
+    셀을 다시 읽지 않고 컬럼마다 고유값의 표시 폭 최댓값만 구한다.
+    제목줄은 A1:L1에 병합되므로 첫 컬럼 너비에 넣지 않는다.
+
+    Args:
+        df: 저장할 데이터프레임
+        sample_rows: 지정하면 행이 이보다 많을 때 이 개수만 무작위(고정 시드) 추출해 추정
+            (표본 밖의 더 긴 값은 잘려 보일 수 있음)
+    """
+    if sample_rows is not None and len(df) > sample_rows:
+        df = df.sample(n=sample_rows, random_state=0)
+
+    widths = []
+    for col_idx, column in enumerate(df.columns):
+        uniques = pd.Series(df.iloc[:, col_idx].unique(), dtype=object)
+        longest = int(display_widths(pd.Series([column], dtype=object)).iloc[0])
+        if len(uniques):
+            longest = max(longest, int(display_widths(uniques).max()))
+        widths.append(min(longest + COLUMN_WIDTH_PADDING, MAX_COLUMN_WIDTH))
+    return widths
+
+
+def resolve_output_format(output_path: str, output_format: Optional[str] = None) -> str:
+    """
+    저장 형식 결정 (지정한 형식 또는 출력 경로 확장자 기준)
+
+    지정한 형식이 경로의 알려진 확장자와 다르면(예: out.xlsx에 csv) 열 수 없는 파일이 되므로 오류를 낸다.
+
+    Args:
+        output_path: 출력 파일 경로
+        output_format: 'xlsx' / 'parquet' / 'feather' / 'csv' 또는 None
+    """
+    extension_format = _FORMAT_BY_EXTENSION.get(Path(output_path).suffix.lower())
+    if output_format is None:
+        return extension_format or 'xlsx'
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"지원하지 않는 출력 형식입니다: {output_format} (xlsx, parquet, feather, csv)")
+    if extension_format is not None and extension_format != output_format:
+        raise ValueError(
+            f"출력 형식({output_format})과 파일 확장자({Path(output_path).suffix})가 다릅니다: "
+            f"{OUTPUT_EXTENSIONS[output_format]} 확장자를 사용하세요"
+        )
+    return output_format
+
+
+def write_columnar(df: pd.DataFrame, target: Union[str, BinaryIO], output_format: str) -> None:
+    """
+    스타일 없이 데이터만 Parquet/Feather/CSV로 저장
+
+    - Parquet/Feather: pyarrow 필요. 값 형식이 섞인 object 컬럼은 문자열(결측값 유지)로 바꿔 저장
+    - CSV: 엑셀에서 한글이 깨지지 않도록 UTF-8 BOM(utf-8-sig)으로 저장
+
+    Args:
+        df: 저장할 데이터프레임
+        target: 파일 경로 또는 바이너리 버퍼 (Streamlit 다운로드용)
+        output_format: 'parquet' / 'feather' / 'csv'
+    """
+    if output_format == 'csv':
+        df.to_csv(target, index=False, encoding='utf-8-sig')
+        return
+    if output_format not in ('parquet', 'feather'):
+        raise ValueError(f"컬럼 형식이 아닌 출력 형식입니다: {output_format} (parquet, feather, csv)")
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ImportError(f"{output_format} 저장에는 pyarrow가 필요합니다: pip install pyarrow") from None
+
+    object_columns = df.columns[df.dtypes == object]
+    if len(object_columns):
+        df = df.astype({col: 'string' for col in object_columns})
+    if output_format == 'parquet':
+        df.to_parquet(target, index=False)
+    else:
+        df.reset_index(drop=True).to_feather(target)
+
+
+def _named_styles():
+    """제목줄/헤더/데이터 셀 공용 스타일 (셀마다 Font/Border 객체를 만들지 않음)"""
+    from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+    from openpyxl.styles.fonts import DEFAULT_FONT
+
+    thin = Side(style='thin')
+    thin_border = Border(left=thin, right=thin, top=thin, bottom=thin)
+
+    title = NamedStyle(name='kfta_title')
+    title.font = Font(size=14, bold=True, color="FF0000")  # 붉은색 글씨
+    title.alignment = Alignment(horizontal='center', vertical='center')
+
+    header = NamedStyle(name='kfta_header')
+    header.font = Font(bold=True)
+    header.fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
+    header.alignment = Alignment(horizontal='center')
+    header.border = thin_border
+
+    data = NamedStyle(name='kfta_data')
+    data.font = DEFAULT_FONT
+    data.border = thin_border
+
+    return title, header, data
+
+
+def write_unified_workbook(
+    df: pd.DataFrame,
+    output_path: str,
+    title: str = TITLE_TEXT,
+    sheet_title: str = "통합결과",
+    width_sample_rows: Optional[int] = None,
+) -> None:
+    """
+    제목줄(1행, 붉은색 굵은 글씨, A1:L1 병합) + 헤더(2행) + 데이터(3행부터)를 스트리밍으로 저장
+
+    셀 객체를 시트에 쌓아 두지 않고 행 단위로 파일에 기록하므로 메모리 사용량이 행 수와 무관하다.
+    스타일은 이름 있는 공용 스타일 하나씩을 모든 셀이 참조한다.
+
+    Args:
+        df: 저장할 데이터프레임
+        output_path: 저장할 .xlsx 경로
+        title: 제목줄 문구
+        sheet_title: 시트명
+        width_sample_rows: 컬럼 너비를 추정할 표본 행 수 (None이면 전체 행)
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.utils import get_column_letter
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(sheet_title)
+
+    title_style, header_style, data_style = _named_styles()
+    for style in (title_style, header_style, data_style):
+        wb.add_named_style(style)
+
+    # 너비와 병합 범위는 첫 행을 쓰기 전에 지정해야 함
+    for col_idx, width in enumerate(column_widths(df, width_sample_rows), 1):
+        ws.column_dimensions[get_column_letter(col_idx)].width = width
+    ws.merged_cells.add(TITLE_RANGE)
+
+    # 1. 제목줄
+    title_cell = WriteOnlyCell(ws, value=title)
+    title_cell.style = title_style.name
+    ws.append([title_cell])
+
+    # 2. 헤더
+    header_cells = []
+    for column_title in df.columns:
+        cell = WriteOnlyCell(ws, value=column_title)
+        cell.style = header_style.name
+        header_cells.append(cell)
+    ws.append(header_cells)
+
+    # 3. 데이터 - 컬럼마다 스타일 셀 하나를 두고 값만 바꿔 기록 (빈 셀도 테두리 유지)
+    row_cells = []
+    for _ in df.columns:
+        cell = WriteOnlyCell(ws)
+        cell.style = data_style.name
+        row_cells.append(cell)
+    for row in df.itertuples(index=False, name=None):
+        for cell, value in zip(row_cells, row):
+            cell.value = value
+        ws.append(row_cells)
+
+    wb.save(output_path)
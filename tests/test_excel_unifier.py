@@ -1,5 +1,7 @@
 import unittest
 from pathlib import Path
+from unittest import mock
+import os
 import tempfile
 import sys
 
@@ -9,6 +11,7 @@ SRC = Path(__file__).resolve().parents[1] / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
+from kfta_excel import excel_unifier
 from kfta_excel.excel_unifier import ExcelUnifier
 
 
@@ -44,6 +47,21 @@ class ExcelUnifierTest(unittest.TestCase):
             self.assertIn("학교", mappings)
             self.assertIn("대학교", mappings["학교"])
 
+    def test_analyze_columns_keyword_priority(self):
+        unifier = ExcelUnifier()
+        unifier.dataframes = [
+            {"path": "a.xlsx", "sheet": None, "data": None,
+             "columns": ["현재 학교명", "발령 본청", "소속대학", "Email 주소", "직종구분"]},
+        ]
+
+        mappings = unifier.analyze_columns()
+
+        self.assertEqual(mappings["현재분회"], ["현재 학교명"])
+        self.assertEqual(mappings["발령분회"], ["발령 본청"])
+        self.assertEqual(mappings["학교"], ["소속대학"])
+        self.assertEqual(mappings["이메일"], ["Email 주소"])
+        self.assertEqual(mappings["직종분류"], ["직종구분"])
+
     def test_unify_dataframes_dedup(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             base = Path(tmpdir)
@@ -77,6 +95,80 @@ class ExcelUnifierTest(unittest.TestCase):
             self.assertIn("서울대학교", set(unified["현재분회"].tolist()))
             self.assertIn("컴퓨터공학", set(unified["과목"].tolist()))
 
+    def test_fuzzy_dedup_clusters_within_blocks(self):
+        df = pd.DataFrame(
+            {
+                "현재교육청": ["춘천", "춘천", "춘천", "원주", "원주", "춘천", "원주"],
+                "이름": ["김철수", "김철주", "김철수", "이영희", "이영히", "김영수", "김철쑤"],
+                "현재분회": ["남산초", "남산초", "남산초", "중앙고", "중앙고", "남산초", "남산초"],
+                "과목": ["", "국어", "", "", "수학", "", ""],
+            }
+        )
+        unifier = ExcelUnifier(similarity_threshold=85, similarity_mode="jamo")
+
+        exact = unifier._remove_duplicates_smart(df, ["이름", "현재분회"])
+        fuzzy = unifier._remove_duplicates_smart(df, ["이름", "현재분회"], mode="fuzzy")
+
+        self.assertEqual(exact.index.tolist(), [0, 1, 3, 4, 5, 6])
+        # 김철수/김철주(춘천), 이영희/이영히(원주)가 묶이고 더 채워진 행이 남음
+        # 원주의 김철쑤는 다른 교육청 블록이라 따로 남음
+        self.assertEqual(fuzzy.index.tolist(), [1, 4, 5, 6])
+        self.assertEqual(fuzzy.columns.tolist(), df.columns.tolist())
+
+    def test_normalize_values_matches_normalize_value(self):
+        unifier = ExcelUnifier()
+        values = pd.Series(["서울 대학교", None, "서울大學校", 1, 1.0, " 춘천고등학교 ", "서울 대학교", "ABC"], dtype=object)
+
+        for value_type in ("school", "general"):
+            self.assertEqual(
+                unifier.normalize_values(values, value_type).tolist(),
+                [unifier.normalize_value(value, value_type) for value in values],
+            )
+
+    def test_exact_dedup_keeps_first_rows_without_helper_columns(self):
+        df = pd.DataFrame(
+            {
+                "이름": ["김철수", "김철수", "이영희", "김철수", None, None],
+                "학교": ["서울대학교", "서울 대학", "연세대", "고려대", "서울대", None],
+                "과목": ["국어", "수학", "영어", "과학", "", ""],
+            },
+            index=[10, 11, 12, 13, 14, 15],
+        )
+
+        result = ExcelUnifier()._remove_duplicates_smart(df, ["이름", "학교", "없는컬럼"])
+
+        self.assertEqual(result.index.tolist(), [10, 12, 13, 14, 15])
+        self.assertEqual(result.columns.tolist(), ["이름", "학교", "과목"])
+
+    def test_fuzzy_dedup_mode_validation(self):
+        unifier = ExcelUnifier()
+        with self.assertRaises(ValueError):
+            unifier.unify_dataframes(key_columns=["이름"], dedup_mode="phonetic")
+        with self.assertRaises(ValueError):
+            unifier.unify_dataframes(key_columns=["이름"], dedup_keep="last")
+
+    def test_dedup_keep_most_complete_counts_kfta_columns(self):
+        df = pd.DataFrame(
+            {
+                "이름": ["김철수", "김철수", "김철수", "이영희", "이영희"],
+                "현재분회": ["남산초", "남산초", "남산초", "중앙고", "중앙고"],
+                "과목": ["", "국어", "수학", "", " "],
+                "직위": ["", "교사", "교사", "", ""],
+                "비고": ["메모", "", "", "메모", ""],
+            },
+            index=[10, 11, 12, 13, 14],
+        )
+        unifier = ExcelUnifier(similarity_threshold=85)
+
+        first = unifier._remove_duplicates_smart(df, ["이름", "현재분회"], keep="first")
+        complete = unifier._remove_duplicates_smart(df, ["이름", "현재분회"], keep="most_complete")
+        fuzzy_first = unifier._remove_duplicates_smart(df, ["이름", "현재분회"], mode="fuzzy", keep="first")
+
+        self.assertEqual(first.index.tolist(), [10, 13])
+        # 표준 컬럼(과목/직위)이 가장 많이 채워진 행, 같으면 먼저 나온 행 (비고는 세지 않음)
+        self.assertEqual(complete.index.tolist(), [11, 13])
+        self.assertEqual(fuzzy_first.index.tolist(), [10, 13])
+
     def test_kfta_output_for_non_kfta_input(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             base = Path(tmpdir)
@@ -112,6 +204,174 @@ class ExcelUnifierTest(unittest.TestCase):
             self.assertIn("서울대학교", set(unified["현재분회"].tolist()))
             self.assertIn("전자공학", set(unified["과목"].tolist()))
 
+    def test_enrich_coalesces_aliases_in_priority_order(self):
+        df = pd.DataFrame(
+            {
+                "성명": ["김철수", None, " 박민수 "],
+                "대응": ["무시", "이영희", "무시"],
+                "현소속": ["nan", "원주중앙초", None],
+                "학교": ["춘천남산초", "무시", None],
+                "전공": [None, "국어", "NULL"],
+            }
+        )
+
+        # 학습 매핑/실패 로그는 임시 폴더에만 기록 (패키지 폴더와 Turso DB에 쓰지 않음)
+        with tempfile.TemporaryDirectory() as tmpdir, mock.patch.dict(os.environ, {"TURSO_DATABASE_URL": ""}):
+            unifier = ExcelUnifier()
+            parser = unifier._get_kfta_parser()
+            parser.learned_mappings_file = str(Path(tmpdir) / "learned.json")
+            parser.failed_mappings_log = str(Path(tmpdir) / "failed.log")
+            enriched = unifier._enrich_kfta_dataframe(df)
+
+        self.assertEqual(enriched["이름"].tolist(), ["김철수", "이영희", "박민수"])
+        self.assertEqual(enriched["현재분회"].tolist(), ["춘천남산초", "원주중앙초", ""])
+        self.assertEqual(enriched["과목"].tolist(), ["", "국어", ""])
+
+    def test_enrich_resolves_each_school_once(self):
+        df = pd.DataFrame(
+            {
+                "이름": ["김철수", "이영희", "박민수", "최지은"],
+                "현재분회": ["춘천남산초", "춘천남산초", "원주중앙초", "춘천남산초"],
+                "현재교육청": ["", "", "", "직접입력교육청"],
+            }
+        )
+        # 학습 매핑/실패 로그는 임시 폴더에만 기록 (패키지 폴더와 Turso DB에 쓰지 않음)
+        with tempfile.TemporaryDirectory() as tmpdir, mock.patch.dict(os.environ, {"TURSO_DATABASE_URL": ""}):
+            unifier = ExcelUnifier()
+            parser = unifier._get_kfta_parser()
+            parser.learned_mappings_file = str(Path(tmpdir) / "learned.json")
+            parser.failed_mappings_log = str(Path(tmpdir) / "failed.log")
+            with mock.patch.object(
+                parser, "find_education_office_for_school", wraps=parser.find_education_office_for_school
+            ) as lookup:
+                enriched = unifier._enrich_kfta_dataframe(df)
+
+        self.assertEqual([c.args[0] for c in lookup.call_args_list], ["춘천남산초", "원주중앙초"])
+        self.assertEqual(enriched["현재교육청"].iloc[0], enriched["현재교육청"].iloc[1])
+        self.assertTrue(enriched["현재교육청"].iloc[0])
+        self.assertEqual(enriched["현재교육청"].iloc[3], "직접입력교육청")
+
+    def test_parallel_load_keeps_input_order(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            workbook = base / "a.xlsx"
+            csv_file = base / "b.csv"
+            missing = base / "missing.xlsx"
+
+            with pd.ExcelWriter(workbook) as writer:
+                pd.DataFrame({"이름": ["김철수"]}).to_excel(writer, sheet_name="1차", index=False)
+                pd.DataFrame({"이름": ["이영희"]}).to_excel(writer, sheet_name="2차", index=False)
+            pd.DataFrame({"성명": ["박민수"]}).to_csv(csv_file, index=False)
+
+            paths = [str(workbook), str(missing), str(csv_file)]
+            sequential = ExcelUnifier()
+            sequential.load_excel_files(paths)
+            parallel = ExcelUnifier(workers=2)
+            parallel.load_excel_files(paths)
+
+            expected = [(str(workbook), "1차"), (str(workbook), "2차"), (str(csv_file), None)]
+            self.assertEqual([(d["path"], d["sheet"]) for d in sequential.dataframes], expected)
+            self.assertEqual([(d["path"], d["sheet"]) for d in parallel.dataframes], expected)
+
+
+    def test_large_kfta_sheets_stream_for_kfta_output(self):
+        header = ["번호", "구분", "이름", "비고1", "직 위", "발령분회", "발령지", "현재분회", "과 목", "비고"]
+        rows = [
+            ["1", "전보", "김 철수", "", "초등학교 교사", "춘천 남산초", "", "원주", "", "원주여고"],
+            ["2", "전보", "이영희", "", "중등학교 교사", "강릉제일고", "", "속초여고", "국어", ""],
+            ["3", "신규", "박민수", "", "유치원 원감", "새들유", "", "", "", "인제 월학초유 교사"],
+            ["4", "전보", "최지은", "", "초등학교 교사", "홍천 남산초", "", "춘천 남산초", "영어", ""],
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir, mock.patch.dict(os.environ, {"TURSO_DATABASE_URL": ""}):
+            workbook = Path(tmpdir) / "kfta.xlsx"
+            with pd.ExcelWriter(workbook) as writer:
+                pd.DataFrame(rows, columns=header).to_excel(writer, sheet_name="명단", index=False)
+                pd.DataFrame({"이름": ["정수진"], "과목": ["수학"]}).to_excel(writer, sheet_name="추가", index=False)
+
+            def unify(stream_min_rows, output_format):
+                unifier = ExcelUnifier(stream_min_rows=stream_min_rows)
+                parser = unifier._get_kfta_parser()
+                parser.learned_mappings_file = str(Path(tmpdir) / "learned.json")
+                parser.failed_mappings_log = str(Path(tmpdir) / "failed.log")
+                with mock.patch.object(parser, "parse_dataframe", wraps=parser.parse_dataframe) as parse:
+                    unifier.load_excel_files([str(workbook)])
+                    unified = unifier.unify_dataframes(output_format=output_format)
+                return unifier, unified, parse.call_count
+
+            streamed, streamed_df, streamed_calls = unify(3, "kfta")
+            loaded, loaded_df, loaded_calls = unify(None, "kfta")
+            # 스트리밍은 kfta 형식에만 적용되고, 다른 형식은 스트리밍 여부와 관계없이 결과가 같아야 함
+            for output_format in ("auto", "standard"):
+                pd.testing.assert_frame_equal(
+                    unify(3, output_format)[1], unify(None, output_format)[1], obj=output_format
+                )
+
+        self.assertEqual([(d["sheet"], bool(d.get("stream"))) for d in streamed.dataframes],
+                         [("명단", True), ("추가", False)])
+        self.assertIsNone(streamed.dataframes[0]["data"])
+        self.assertEqual(streamed.dataframes[0]["columns"], header)
+        self.assertEqual((streamed_calls, loaded_calls), (0, 1))
+        pd.testing.assert_frame_equal(streamed_df, loaded_df)
+        self.assertIn("총 행 수: 5", streamed.generate_report())
+
+    def test_kfta_parser_is_shared_across_sheets(self):
+        created = []
+
+        class CountingParser(excel_unifier.KFTAParser):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.learned_mappings_file = str(Path(tmpdir) / "learned.json")
+                self.failed_mappings_log = str(Path(tmpdir) / "failed.log")
+                created.append(self)
+
+        header = ["번호", "구분", "이름", "비고1", "직 위", "발령 본청", "발령지", "현 본청", "과 목", "비고"]
+        with tempfile.TemporaryDirectory() as tmpdir, mock.patch.object(excel_unifier, "KFTAParser", CountingParser):
+            workbook = Path(tmpdir) / "kfta.xlsx"
+            with pd.ExcelWriter(workbook) as writer:
+                pd.DataFrame(
+                    [["1", "전보", "김철수", "", "교사", "춘천남산초", "", "원주", "국어", ""]], columns=header
+                ).to_excel(writer, sheet_name="1차", index=False)
+                pd.DataFrame(
+                    [["1", "전보", "이영희", "", "교사", "강릉중앙초", "", "속초", "수학", ""]], columns=header
+                ).to_excel(writer, sheet_name="2차", index=False)
+
+            unifier = ExcelUnifier()
+            unifier.load_excel_files([str(workbook)])
+            unified = unifier.unify_dataframes(output_format="kfta")
+
+        self.assertEqual(len(created), 1)
+        self.assertEqual(unified["이름"].tolist(), ["김철수", "이영희"])
+
+    def test_find_similar_values_methods(self):
+        unifier = ExcelUnifier(similarity_threshold=80)
+        values = ["춘천남산초", "춘천남산초등", None, "원주중앙고", "춘천남산초", " ", "춘천남산초등학교"]
+
+        clustered = unifier.find_similar_values(values)
+        greedy = unifier.find_similar_values(values, method="greedy")
+
+        self.assertEqual(clustered, {
+            "춘천남산초등학교": ["춘천남산초", "춘천남산초등", "춘천남산초등학교"],
+            "원주중앙고": ["원주중앙고"],
+        })
+        self.assertEqual(greedy, {
+            "춘천남산초등": ["춘천남산초", "춘천남산초등"],
+            "원주중앙고": ["원주중앙고"],
+            "춘천남산초등학교": ["춘천남산초등학교"],
+        })
+        with self.assertRaises(ValueError):
+            unifier.find_similar_values(values, method="bktree")
+
+    def test_jamo_similarity_mode(self):
+        values = ["강릉중앙고", "강능중앙고", "원주중앙고"]
+
+        syllable = ExcelUnifier(similarity_threshold=85).find_similar_values(values)
+        jamo = ExcelUnifier(similarity_threshold=85, similarity_mode="jamo").find_similar_values(values)
+
+        self.assertEqual(len(syllable), 3)
+        self.assertEqual(jamo, {"강릉중앙고": ["강릉중앙고", "강능중앙고"], "원주중앙고": ["원주중앙고"]})
+        with self.assertRaises(ValueError):
+            ExcelUnifier(similarity_mode="stroke")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,11 @@
+import json
 import unittest
 from pathlib import Path
+import tempfile
 import sys
 
+import pandas as pd
+
 SRC = Path(__file__).resolve().parents[1] / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
@@ -9,9 +13,26 @@ if str(SRC) not in sys.path:
 from kfta_excel.kfta_parser import KFTAParser
 
 
+KFTA_HEADER = ["번호", "구분", "성명", "비고1", "직위", "발령학교", "발령지", "현소속", "과목", "비고"]
+KFTA_ROWS = [
+    ["1", "전보", "김 철수", "", "초등학교 교사", "춘천 남산초", "", "원주", "", "원주여고"],
+    ["2", "전보", "이영희", "", "중등학교 교사", "강릉제일고", "", "속초여고", "국어", ""],
+    ["3", "신규", "박민수", "", "유치원 원감", "새들유", "", "", "", "인제 월학초유 교사"],
+    ["", "", "성명", "비고", "직위", "", "", "", "", ""],
+    ["4", "전보", "최지은", "", "초등학교 교사", "홍천 남산초", "", "춘천 남산초", "영어", ""],
+]
+
+
 class KFTAParserTest(unittest.TestCase):
     def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
         self.parser = KFTAParser()
+        self.parser.learned_mappings_file = str(Path(self.tmpdir.name) / "learned.json")
+        self.parser.failed_mappings_log = str(Path(self.tmpdir.name) / "failed.log")
+        self.parser.failed_mappings_jsonl = str(Path(self.tmpdir.name) / "failed.jsonl")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
 
     def test_school_abbreviation_expansion(self):
         self.assertEqual(self.parser.expand_school_abbreviation("춘천공고"), "춘천공업고등학교")
@@ -26,6 +47,133 @@ class KFTAParserTest(unittest.TestCase):
         self.assertEqual(self.parser.normalize_position("초등학교 교감"), "교감")
         self.assertEqual(self.parser.normalize_position("특수학교 교사(중등)"), "특수교사")
 
+    def test_school_index_matches_linear_precedence(self):
+        index = KFTAParser.school_index()
+        keywords = sorted(KFTAParser.MIDDLE_HIGH_SCHOOL_REGION_MAP, key=len, reverse=True)
+        regions = sorted(KFTAParser.GANGWON_REGIONS, key=len, reverse=True)
+        for name in ["강릉제일고등학교", "원주여자고등학교", "춘천남산초등학교", "남산초등학교", "봉의홍천중"]:
+            expected_keyword = next((k for k in keywords if k in name), None)
+            expected_prefix = next((r for r in regions if name.startswith(r)), None)
+            self.assertEqual(index.match_keyword(name), expected_keyword)
+            self.assertEqual(index.match_region_prefix(name), expected_prefix)
+            self.assertEqual(index.regions_in(name), [r for r in regions if r in name])
+
+    def test_school_normalization_is_memoized(self):
+        hints = {"regions": [], "education_offices": []}
+        # 첫 조회 후 학습 매핑이 생기므로 두 번째 조회까지는 다시 계산될 수 있음
+        first = self.parser.normalize_school_name("원주여고", hints)
+        self.parser.normalize_school_name("원주여고", hints)
+        misses = self.parser.school_cache_stats()["misses"]
+        second = self.parser.normalize_school_name("원주여고", hints)
+
+        self.assertEqual(first, second)
+        self.assertEqual(first[0], "원주여자고등학교")
+        self.assertEqual(self.parser.school_cache_stats()["misses"], misses)
+        self.assertGreater(self.parser.school_cache_stats()["hits"], 0)
+
+    def test_learned_mappings_are_written_on_flush(self):
+        learned_file = Path(self.parser.learned_mappings_file)
+        self.parser.save_learned_mapping("남산초등학교", "강원특별자치도춘천교육지원청")
+        self.parser.save_learned_mapping("남산초등학교", "강원특별자치도춘천교육지원청")
+        self.assertFalse(learned_file.exists())
+
+        self.parser.flush()
+
+        with open(learned_file, encoding="utf-8") as f:
+            self.assertEqual(json.load(f), {"남산초등학교": "강원특별자치도춘천교육지원청"})
+        self.assertEqual(self.parser._pending_mappings, {})
+
+    def test_failed_mappings_are_deduplicated_on_flush(self):
+        self.parser.failed_log_jsonl = True
+        for _ in range(3):
+            self.parser.log_failed_mapping("가나초등학교", {"regions": [], "education_offices": []})
+        self.parser.log_failed_mapping("다라중학교")
+        self.assertFalse(Path(self.parser.failed_mappings_log).exists())
+
+        self.parser.flush()
+
+        lines = Path(self.parser.failed_mappings_log).read_text(encoding="utf-8").splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].endswith("| 3회"))
+        records = [json.loads(line) for line in Path(self.parser.failed_mappings_jsonl).read_text(encoding="utf-8").splitlines()]
+        self.assertEqual([(r["school_name"], r["count"]) for r in records], [("가나초등학교", 3), ("다라중학교", 1)])
+
+    def test_failed_mapping_count_survives_school_cache(self):
+        rows = [
+            [str(idx), "전보", name, "", "초등학교 교사", "가나다라학교", "", "", "", ""]
+            for idx, name in enumerate(["김철수", "이영희", "박민수"], 1)
+        ]
+        df = pd.DataFrame(rows, columns=KFTA_HEADER)
+
+        def failed_counts(parser):
+            parser.failed_log_jsonl = True
+            parser.parse_dataframe(df)
+            records = Path(parser.failed_mappings_jsonl).read_text(encoding="utf-8").splitlines()
+            return {r["school_name"]: r["count"] for r in map(json.loads, records)}
+
+        uncached = KFTAParser(use_web_search=False, school_cache_size=0)
+        uncached.learned_mappings_file = str(Path(self.tmpdir.name) / "uncached.json")
+        uncached.failed_mappings_log = str(Path(self.tmpdir.name) / "uncached.log")
+        uncached.failed_mappings_jsonl = str(Path(self.tmpdir.name) / "uncached.jsonl")
+
+        # 행마다 발령분회 정규화 + 발령교육청 재조회로 2번 실패 (캐시 적중도 횟수에 포함)
+        self.assertEqual(failed_counts(self.parser), {"가나다라학교": 6})
+        self.assertEqual(failed_counts(uncached), {"가나다라학교": 6})
+        lines = Path(self.parser.failed_mappings_log).read_text(encoding="utf-8").splitlines()
+        self.assertTrue(lines[-1].endswith("| 6회"))
+
+    def test_columnar_engine_matches_row_engine(self):
+        df = pd.DataFrame(KFTA_ROWS + [[None] * len(KFTA_HEADER), KFTA_HEADER], columns=KFTA_HEADER)
+
+        row_result = self.parser.parse_dataframe(df, engine="row")
+        columnar_result = self.parser.parse_dataframe(df, engine="columnar")
+
+        self.assertEqual(len(columnar_result), 4)
+        pd.testing.assert_frame_equal(columnar_result, row_result)
+        with self.assertRaises(ValueError):
+            self.parser.parse_dataframe(df, engine="vector")
+
+    def test_sharded_parse_matches_sequential_parse(self):
+        df = pd.DataFrame(KFTA_ROWS * 6, columns=KFTA_HEADER)
+        expected = self.parser.parse_dataframe(df)
+
+        parser = KFTAParser(use_ai=False, use_web_search=False)
+        parser.learned_mappings_file = str(Path(self.tmpdir.name) / "sharded.json")
+        parser.failed_mappings_log = str(Path(self.tmpdir.name) / "sharded.log")
+        parser.PARSE_SHARD_MIN_ROWS = 1
+        sharded = parser.parse_dataframe(df, workers=3)
+
+        pd.testing.assert_frame_equal(sharded, expected)
+        self.assertEqual(
+            json.loads(Path(parser.learned_mappings_file).read_text(encoding="utf-8")),
+            json.loads(Path(self.parser.learned_mappings_file).read_text(encoding="utf-8")),
+        )
+
+    def test_streaming_parse_matches_dataframe_parse(self):
+        workbook = Path(self.tmpdir.name) / "kfta.xlsx"
+        pd.DataFrame(KFTA_ROWS, columns=KFTA_HEADER).to_excel(workbook, index=False)
+
+        expected = self.parser.parse_dataframe(pd.read_excel(workbook))
+        streamed = self.parser.parse_excel_streaming(str(workbook), chunk_size=2)
+
+        self.assertEqual(len(streamed), 4)
+        self.assertEqual(streamed.to_dict("records"), expected.to_dict("records"))
+
+    def test_streaming_parse_treats_na_strings_like_read_excel(self):
+        rows = KFTA_ROWS + [
+            ["5", "전보", "#N/A", "", "초등학교 교사", "N/A", "", "NULL", "", ""],
+            ["6", "전보", "nan", "", "중등학교 교사", "   ", "", "원주", "NA", ""],
+            ["7", "신규", "정수진", "", "초등학교 교사", "null", "", "춘천 남산초", "None", ""],
+        ]
+        workbook = Path(self.tmpdir.name) / "kfta_na.xlsx"
+        pd.DataFrame(rows, columns=KFTA_HEADER).to_excel(workbook, index=False)
+
+        expected = self.parser.parse_dataframe(pd.read_excel(workbook))
+        streamed = self.parser.parse_excel_streaming(str(workbook), chunk_size=3)
+
+        self.assertNotIn("#N/A", streamed["이름"].tolist())
+        self.assertEqual(streamed.to_dict("records"), expected.to_dict("records"))
+
 
 if __name__ == "__main__":
     unittest.main()
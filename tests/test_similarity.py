@@ -0,0 +1,164 @@
+import unittest
+from pathlib import Path
+from unittest import mock
+import random
+import sys
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from kfta_excel import similarity
+from kfta_excel.similarity import (
+    CharCountIndex,
+    SimilarityScorer,
+    cluster_groups,
+    decompose_jamo,
+    greedy_groups,
+    similarity_matrix,
+    similarity_ratio,
+    similarity_scores,
+    similarity_texts,
+)
+
+
+class CharCountIndexTest(unittest.TestCase):
+    def test_candidates_never_drop_similar_pairs(self):
+        rng = random.Random(7)
+        alphabet = "교사학년반번호성명이름직위ab 12"
+        texts = list(dict.fromkeys(
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 8))) for _ in range(300)
+        ))
+        index = CharCountIndex(texts)
+
+        for threshold in (50, 70, 85):
+            for idx in range(0, len(texts), 7):
+                candidates = set(index.candidates(idx, threshold, start=idx + 1))
+                for other in range(idx + 1, len(texts)):
+                    if similarity_ratio(texts[idx], texts[other]) >= threshold:
+                        self.assertIn(other, candidates, (texts[idx], texts[other], threshold))
+
+    def test_candidates_respect_start_and_order(self):
+        index = CharCountIndex(["전공", "전공분야", "전 공", "연락처", "전공"])
+
+        self.assertEqual(index.candidates(0, 60), [1, 2, 4])
+        self.assertEqual(index.candidates(0, 60, start=2), [2, 4])
+        self.assertEqual(index.candidates(3, 60), [])
+        self.assertEqual(index.candidates(3, 0), [0, 1, 2, 4])
+
+
+class SimilarityRatioTest(unittest.TestCase):
+    def test_ratio_matches_levenshtein_indel_ratio(self):
+        # fuzz.ratio (python-Levenshtein 0.21 이상)와 같은 값
+        self.assertEqual(similarity_ratio("춘천남산초", "춘천남산초등학교"), 77)
+        self.assertEqual(similarity_ratio("학교", "대학교"), 80)
+        self.assertEqual(similarity_ratio("이름", "성명"), 0)
+        self.assertEqual(similarity_ratio("a", "b" * 38 + "a" + "b" * 40), 3)
+        self.assertEqual(similarity_ratio("전공", "전공"), 100)
+        self.assertEqual(similarity_ratio("", "전공"), 0)
+
+    def test_batch_scores_match_pairwise_ratio(self):
+        rng = random.Random(5)
+        alphabet = "교사학년반번호성명춘천남산초중고등ab 12"
+        texts = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12))) for _ in range(200)]
+        texts += ["".join(rng.choice(alphabet) for _ in range(rng.randint(65, 90))) for _ in range(5)]
+        scorer = SimilarityScorer(texts)
+
+        for query in texts[:40] + texts[-5:]:
+            expected = [similarity_ratio(query, text) for text in texts]
+            self.assertEqual(scorer.scores(query).tolist(), expected)
+            self.assertEqual(
+                scorer.scores(query, score_cutoff=70).tolist(),
+                [score if score >= 70 else 0 for score in expected],
+            )
+
+        indices = [5, 3, 200, 3]
+        self.assertEqual(
+            scorer.scores(texts[0], indices).tolist(),
+            [similarity_ratio(texts[0], texts[idx]) for idx in indices],
+        )
+
+    def test_numpy_kernel_matches_without_rapidfuzz(self):
+        texts = ["춘천남산초", "춘천남산초등학교", "원주중앙고", "", "남산초" * 30]
+        with mock.patch.object(similarity, "cdist", None), mock.patch.object(similarity, "Indel", None):
+            matrix = similarity_matrix(texts)
+            expected = [[similarity_ratio(left, right) for right in texts] for left in texts]
+        self.assertEqual(matrix.tolist(), expected)
+
+    def test_scores_and_matrix_shapes(self):
+        scores = similarity_scores("전공", ["전공분야", "전 공", "연락처"])
+        matrix = similarity_matrix(["전공", "연락처"], ["전공분야", "전 공", "연락처"])
+
+        self.assertEqual(scores.dtype.kind, "i")
+        self.assertEqual(scores.tolist(), matrix[0].tolist())
+        self.assertEqual(matrix.shape, (2, 3))
+        self.assertEqual(matrix[1, 2], 100)
+        self.assertEqual(SimilarityScorer([]).scores("전공").tolist(), [])
+
+
+class JamoTest(unittest.TestCase):
+    def test_decompose_jamo_splits_syllables_only(self):
+        self.assertEqual(decompose_jamo("강릉 A1"), "\u1100\u1161\u11bc\u1105\u1173\u11bc A1")
+        self.assertEqual(len(decompose_jamo("춘천남산초")), 14)
+
+    def test_jamo_mode_tolerates_typos(self):
+        syllable = similarity_texts(["강릉", "강능", "연락처", "연락쳐"])
+        jamo = similarity_texts(["강릉", "강능", "연락처", "연락쳐"], mode="jamo")
+
+        self.assertEqual(syllable, ["강릉", "강능", "연락처", "연락쳐"])
+        self.assertLess(similarity_ratio(*syllable[:2]), 80)
+        self.assertGreaterEqual(similarity_ratio(*jamo[:2]), 80)
+        self.assertGreater(similarity_ratio(*jamo[2:]), similarity_ratio(*syllable[2:]))
+        with self.assertRaises(ValueError):
+            similarity_texts(["강릉"], mode="stroke")
+
+
+class GroupingTest(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(11)
+        alphabet = "춘천남산중앙봉의초중고등학교 "
+        self.texts = list(dict.fromkeys(
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(2, 9))) for _ in range(250)
+        ))
+
+    def test_greedy_groups_match_exhaustive_greedy(self):
+        for threshold in (60, 80):
+            expected = []
+            assigned = set()
+            for idx, text in enumerate(self.texts):
+                if idx in assigned:
+                    continue
+                group = [idx]
+                assigned.add(idx)
+                for other in range(idx + 1, len(self.texts)):
+                    if other not in assigned and similarity_ratio(text, self.texts[other]) >= threshold:
+                        group.append(other)
+                        assigned.add(other)
+                expected.append(group)
+
+            self.assertEqual(greedy_groups(self.texts, threshold), expected)
+
+    def test_cluster_groups_are_connected_components(self):
+        threshold = 70
+        groups = cluster_groups(self.texts, threshold)
+        group_of = {idx: number for number, group in enumerate(groups) for idx in group}
+
+        self.assertEqual(sorted(group_of), list(range(len(self.texts))))
+        self.assertEqual([group[0] for group in groups], sorted(group[0] for group in groups))
+        for idx in range(len(self.texts)):
+            for other in range(idx + 1, len(self.texts)):
+                if similarity_ratio(self.texts[idx], self.texts[other]) >= threshold:
+                    self.assertEqual(group_of[idx], group_of[other])
+
+    def test_cluster_groups_ignore_input_order(self):
+        groups = cluster_groups(self.texts, 70)
+        reversed_texts = self.texts[::-1]
+        reversed_groups = cluster_groups(reversed_texts, 70)
+
+        as_sets = {frozenset(self.texts[idx] for idx in group) for group in groups}
+        reversed_sets = {frozenset(reversed_texts[idx] for idx in group) for group in reversed_groups}
+        self.assertEqual(as_sets, reversed_sets)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+from pathlib import Path
+import tempfile
+import sys
+
+import pandas as pd
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from kfta_excel.sheet_cache import SheetCache
+from kfta_excel.workbook_reader import read_csv_chunked, read_workbook_sheets
+
+
+class WorkbookReaderTest(unittest.TestCase):
+    def test_reads_all_sheets_in_order(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workbook = Path(tmpdir) / "a.xlsx"
+            with pd.ExcelWriter(workbook) as writer:
+                pd.DataFrame({"이름": ["김철수"]}).to_excel(writer, sheet_name="1차", index=False)
+                pd.DataFrame({"이름": ["이영희", "박민수"]}).to_excel(writer, sheet_name="2차", index=False)
+
+            sheets = read_workbook_sheets(str(workbook))
+
+            self.assertEqual([name for name, _ in sheets], ["1차", "2차"])
+            self.assertEqual(sheets[1][1]["이름"].tolist(), ["이영희", "박민수"])
+
+    def test_csv_is_single_unnamed_sheet(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            csv_file = Path(tmpdir) / "a.csv"
+            pd.DataFrame({"성명": ["김철수"]}).to_csv(csv_file, index=False)
+
+            sheets = read_workbook_sheets(str(csv_file))
+
+            self.assertEqual(len(sheets), 1)
+            self.assertIsNone(sheets[0][0])
+
+    def test_chunked_csv_encodes_low_cardinality_columns(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            csv_file = Path(tmpdir) / "a.csv"
+            offices = ["춘천", "원주", "강릉"]
+            pd.DataFrame(
+                {
+                    "이름": [f"교사{i}" for i in range(30)],
+                    "현재교육청": [offices[i % 3] for i in range(30)],
+                }
+            ).to_csv(csv_file, index=False)
+
+            df = read_csv_chunked(str(csv_file), chunksize=7)
+
+            self.assertEqual(len(df), 30)
+            self.assertEqual(str(df["현재교육청"].dtype), "category")
+            self.assertNotEqual(str(df["이름"].dtype), "category")
+            self.assertEqual(df["현재교육청"].tolist()[:4], ["춘천", "원주", "강릉", "춘천"])
+
+    def test_chunked_csv_handles_blank_or_numeric_tail_chunks(self):
+        # 범주형 대상은 첫 청크로 정해지므로, 뒤 청크가 비어 있거나 숫자뿐이어도 읽혀야 함
+        with tempfile.TemporaryDirectory() as tmpdir:
+            csv_file = Path(tmpdir) / "a.csv"
+            offices = ["춘천", "원주", "강릉"]
+            pd.DataFrame(
+                {
+                    "이름": [f"교사{i}" for i in range(30)],
+                    "현재교육청": [offices[i % 3] for i in range(20)] + [None] * 10,
+                    "비고": [offices[i % 3] for i in range(20)] + [i % 2 for i in range(10)],
+                }
+            ).to_csv(csv_file, index=False)
+
+            df = read_csv_chunked(str(csv_file), chunksize=10)
+            expected = pd.read_csv(csv_file)
+
+            self.assertEqual(len(df), 30)
+            self.assertEqual(str(df["현재교육청"].dtype), "category")
+            self.assertEqual(df["현재교육청"].tolist()[:20], expected["현재교육청"].tolist()[:20])
+            self.assertTrue(df["현재교육청"].iloc[20:].isna().all())
+            self.assertEqual(df["비고"].tolist()[:20], expected["비고"].tolist()[:20])
+            self.assertEqual([str(v) for v in df["비고"].tolist()[20:]], [str(i % 2) for i in range(10)])
+
+    def test_cache_reuses_parsed_sheets_until_bytes_change(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workbook = Path(tmpdir) / "a.xlsx"
+            cache = SheetCache(cache_dir=str(Path(tmpdir) / "cache"))
+            pd.DataFrame({"이름": ["김철수"]}).to_excel(workbook, sheet_name="1차", index=False)
+
+            first = read_workbook_sheets(str(workbook), cache)
+            self.assertIsNotNone(cache.load(cache.file_digest(str(workbook))))
+            cached = read_workbook_sheets(str(workbook), cache)
+            self.assertEqual(cached[0][0], "1차")
+            self.assertEqual(cached[0][1]["이름"].tolist(), first[0][1]["이름"].tolist())
+
+            pd.DataFrame({"이름": ["이영희"]}).to_excel(workbook, sheet_name="1차", index=False)
+            changed = read_workbook_sheets(str(workbook), cache)
+            self.assertEqual(changed[0][1]["이름"].tolist(), ["이영희"])
+
+    def test_cache_evicts_least_recently_used(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = SheetCache(cache_dir=str(Path(tmpdir) / "cache"), max_bytes=1)
+            cache.store("a" * 64, [("1차", pd.DataFrame({"이름": ["김철수"]}))])
+            self.assertIsNone(cache.load("a" * 64))
+
+
+if __name__ == "__main__":
+    unittest.main()
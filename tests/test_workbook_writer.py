@@ -0,0 +1,143 @@
+import unittest
+from pathlib import Path
+import tempfile
+import sys
+
+import pandas as pd
+from openpyxl import load_workbook
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from kfta_excel.excel_unifier import ExcelUnifier
+from kfta_excel.workbook_writer import TITLE_TEXT, column_widths, display_widths, resolve_output_format
+
+
+def _cell_snapshot(cell):
+    return (
+        cell.value,
+        cell.font.b,
+        cell.font.sz,
+        cell.font.color.rgb if cell.font.color is not None else None,
+        cell.fill.fgColor.rgb if cell.fill.fill_type else None,
+        cell.alignment.horizontal,
+        getattr(cell.border.left, "style", None),
+        getattr(cell.border.bottom, "style", None),
+    )
+
+
+class WorkbookWriterTest(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame(
+            {
+                "현재교육청": ["춘천", "원주", ""],
+                "이름": ["김철수", "이영희", "박민수"],
+                "현재분회": ["춘천남산초등학교", "원주중앙고등학교", None],
+                "과목": ["국어", "", "수학"],
+            }
+        )
+
+    def _save(self, tmpdir, engine):
+        output = Path(tmpdir) / f"{engine}.xlsx"
+        ExcelUnifier().save_unified_excel(str(output), self.df, engine=engine)
+        return load_workbook(output)["통합결과"]
+
+    def test_streaming_matches_cell_engine(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cell_ws = self._save(tmpdir, "cell")
+            stream_ws = self._save(tmpdir, "streaming")
+
+            self.assertEqual([str(r) for r in stream_ws.merged_cells.ranges], ["A1:L1"])
+            self.assertEqual([str(r) for r in cell_ws.merged_cells.ranges], ["A1:L1"])
+            for row in range(1, len(self.df) + 3):
+                for col in range(1, len(self.df.columns) + 1):
+                    self.assertEqual(
+                        _cell_snapshot(stream_ws.cell(row, col)),
+                        _cell_snapshot(cell_ws.cell(row, col)),
+                        (row, col),
+                    )
+                for col in "ABCD":
+                    self.assertEqual(
+                        stream_ws.column_dimensions[col].width, cell_ws.column_dimensions[col].width, col
+                    )
+
+            title = stream_ws["A1"]
+            self.assertEqual(title.value, TITLE_TEXT)
+            self.assertTrue(title.font.b)
+            self.assertEqual(title.font.color.rgb, "00FF0000")
+
+    def test_display_widths_count_wide_characters_twice(self):
+        values = pd.Series(["춘천", "A1 국어", "ｱ", "漢字", None, "2025. 3. 1.자"], dtype=object)
+
+        self.assertEqual(display_widths(values).tolist(), [4, 7, 1, 4, 0, 13])
+
+    def test_display_widths_cover_korean_and_fullwidth_forms(self):
+        values = pd.Series(["ㄱㅏ", "（주）", "ＡＢ１", "「발령」、", "￦1,000", "ｱｲ·a", "𠀀"], dtype=object)
+
+        self.assertEqual(display_widths(values).tolist(), [4, 6, 6, 10, 7, 4, 2])
+
+    def test_column_widths_from_dataframe(self):
+        # 제목줄은 병합 셀이라 첫 컬럼 너비에 넣지 않음
+        self.assertEqual(column_widths(self.df), [12, 8, 18, 6])
+        self.assertEqual(column_widths(pd.DataFrame({"비고": ["가" * 30]})), [50])
+        self.assertEqual(column_widths(pd.DataFrame({"비고": []})), [6])
+
+    def test_column_widths_from_sample(self):
+        df = pd.DataFrame({"이름": ["김철수"] * 999 + ["가" * 20]})
+
+        self.assertEqual(column_widths(df), [42])
+        self.assertEqual(column_widths(df, sample_rows=2000), [42])
+        self.assertEqual(column_widths(df, sample_rows=10), column_widths(df.sample(n=10, random_state=0)))
+
+    def test_resolve_output_format(self):
+        self.assertEqual(resolve_output_format("out.XLSX"), "xlsx")
+        self.assertEqual(resolve_output_format("out.parquet"), "parquet")
+        self.assertEqual(resolve_output_format("out.arrow"), "feather")
+        self.assertEqual(resolve_output_format("out.csv"), "csv")
+        self.assertEqual(resolve_output_format("out"), "xlsx")
+        self.assertEqual(resolve_output_format("out.xlsx", "xlsx"), "xlsx")
+        self.assertEqual(resolve_output_format("out.dat", "csv"), "csv")
+        with self.assertRaises(ValueError):
+            resolve_output_format("out.xlsx", "json")
+        # 알려진 확장자와 다른 형식은 열 수 없는 파일이 되므로 거부
+        with self.assertRaises(ValueError):
+            resolve_output_format("out.xlsx", "csv")
+        with self.assertRaises(ValueError):
+            resolve_output_format("out.parquet", "feather")
+
+    def test_columnar_formats_round_trip(self):
+        df = self.df.assign(교호기호등=[1, "A1", None])
+        readers = {
+            "out.parquet": pd.read_parquet,
+            "out.feather": pd.read_feather,
+            "out.csv": lambda path: pd.read_csv(path, encoding="utf-8-sig", keep_default_na=False),
+        }
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name, reader in readers.items():
+                output = Path(tmpdir) / name
+                ExcelUnifier().save_unified_excel(str(output), df)
+
+                loaded = reader(output)
+                self.assertEqual(loaded.columns.tolist(), df.columns.tolist(), name)
+                self.assertEqual(loaded["이름"].tolist(), ["김철수", "이영희", "박민수"], name)
+                self.assertEqual(loaded["교호기호등"].fillna("").astype(str).tolist(), ["1", "A1", ""], name)
+
+            self.assertTrue((Path(tmpdir) / "out.csv").read_bytes().startswith(b"\xef\xbb\xbf"))
+
+            # 확장자가 없으면 지정한 형식으로 저장, 확장자와 충돌하면 저장하지 않음
+            output = Path(tmpdir) / "export"
+            ExcelUnifier().save_unified_excel(str(output), df, output_format="csv")
+            self.assertEqual(pd.read_csv(output, encoding="utf-8-sig")["이름"].tolist(), ["김철수", "이영희", "박민수"])
+            conflicting = Path(tmpdir) / "forced.xlsx"
+            with self.assertRaises(ValueError):
+                ExcelUnifier().save_unified_excel(str(conflicting), df, output_format="csv")
+            self.assertFalse(conflicting.exists())
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            ExcelUnifier().save_unified_excel("out.xlsx", self.df, engine="csv")
+
+
+if __name__ == "__main__":
+    unittest.main()